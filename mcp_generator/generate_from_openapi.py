@@ -710,10 +710,21 @@ def _build_input_parameters_log(parameters: list) -> str:
     return input_parameters
 
 
+def _offload_request(request: str) -> str:
+    """Route a `mistapi.<module>.<function>(apisession, ...)` call through the
+    shared request executor so the blocking HTTP call runs off the event loop."""
+    if not request:
+        return request
+    function, separator, arguments = request.partition("(")
+    if not separator:
+        return request
+    return f"await mist_call({function.strip()}, {arguments.lstrip()}"
+
+
 def _gen_tool_replacement(details: dict, processed_operation_ids: list) -> str:
 
     request = (
-        f"    response = {details.get('function', '')}\n"
+        f"    response = {_offload_request(details.get('function', ''))}\n"
         f"    await process_response(response)\n"
     )
     processed_operation_ids.append(
@@ -729,7 +740,7 @@ def _gen_tools_read(details: dict, func_data: dict, processed_operation_ids: lis
         if details.get("get") and details.get("list"):
             request += (
                 f"            if {func_data.get('if_filter', 'object_id')}:\n"
-                f"                response = {details['get'].get('function', '')}\n"
+                f"                response = {_offload_request(details['get'].get('function', ''))}\n"
                 f"                await process_response(response)\n"
                 f"            else:\n"
             )
@@ -739,7 +750,7 @@ def _gen_tools_read(details: dict, func_data: dict, processed_operation_ids: lis
 
         elif details.get("get"):
             request += (
-                f"            response = {details['get'].get('function', '')}\n"
+                f"            response = {_offload_request(details['get'].get('function', ''))}\n"
                 f"            await process_response(response)\n"
             )
             processed_operation_ids.append(
@@ -750,7 +761,7 @@ def _gen_tools_read(details: dict, func_data: dict, processed_operation_ids: lis
             reduce_attribute = details["list"].get(
                 "reduce_attribute", "name")
             request += (
-                f"                response = {details['list'].get('function', '')}\n"
+                f"                response = {_offload_request(details['list'].get('function', ''))}\n"
                 f"                await process_response(response)\n"
                 f"                data = [\n"
                 f"                  {{'{reduce_attribute}': item.get('{reduce_attribute}'), 'id': item.get('id')}}\n"
@@ -763,7 +774,7 @@ def _gen_tools_read(details: dict, func_data: dict, processed_operation_ids: lis
             )
         elif details.get("list"):
             request += (
-                f"                response = {details['list'].get('function', '')}\n"
+                f"                response = {_offload_request(details['list'].get('function', ''))}\n"
                 f"                await process_response(response)\n"
             )
             processed_operation_ids.append(
@@ -773,10 +784,10 @@ def _gen_tools_read(details: dict, func_data: dict, processed_operation_ids: lis
         if details.get("site_id") and details.get("org_id"):
             request += (
                 f"            if site_id:\n"
-                f"                response = {details['site_id'].get('function', '')}\n"
+                f"                response = {_offload_request(details['site_id'].get('function', ''))}\n"
                 f"                await process_response(response)\n"
                 f"            else:\n"
-                f"                response = {details['org_id'].get('function', '')}\n"
+                f"                response = {_offload_request(details['org_id'].get('function', ''))}\n"
                 f"                await process_response(response)\n"
             )
             processed_operation_ids.append(
@@ -787,7 +798,7 @@ def _gen_tools_read(details: dict, func_data: dict, processed_operation_ids: lis
             )
         elif details.get("site_id"):
             request += (
-                f"            response = {details['site_id'].get('function', '')}\n"
+                f"            response = {_offload_request(details['site_id'].get('function', ''))}\n"
                 f"            await process_response(response)\n"
             )
             processed_operation_ids.append(
@@ -795,7 +806,7 @@ def _gen_tools_read(details: dict, func_data: dict, processed_operation_ids: lis
             )
         elif details.get("org_id"):
             request += (
-                f"            response = {details['org_id'].get('function', '')}\n"
+                f"            response = {_offload_request(details['org_id'].get('function', ''))}\n"
                 f"            await process_response(response)\n"
             )
             processed_operation_ids.append(
@@ -812,7 +823,7 @@ def _gen_tools_write(details: dict, func_data: dict, processed_operation_ids: li
         if i == 0:
             request += (
                 f"            if {func_data.get('if_filter', 'object_id')}:\n"
-                f"                response = {value.get('function', '')}\n"
+                f"                response = {_offload_request(value.get('function', ''))}\n"
                 f"                await process_response(response)\n"
             )
             processed_operation_ids.append(
@@ -821,7 +832,7 @@ def _gen_tools_write(details: dict, func_data: dict, processed_operation_ids: li
         else:
             request += (
                 f"            else:\n"
-                f"                response = {value.get('function', '')}\n"
+                f"                response = {_offload_request(value.get('function', ''))}\n"
                 f"                await process_response(response)\n"
             )
             processed_operation_ids.append(
@@ -838,7 +849,7 @@ def _gen_tools_write_delete(details: dict, func_data: dict, processed_operation_
         if i == 0:
             request += (
                 f"            if {func_data.get('if_filter', 'action_type')}.value == \"{key}\":\n"
-                f"                response = {value.get('function', '')}\n"
+                f"                response = {_offload_request(value.get('function', ''))}\n"
                 f"                await process_response(response)\n"
             )
             processed_operation_ids.append(
@@ -847,7 +858,7 @@ def _gen_tools_write_delete(details: dict, func_data: dict, processed_operation_
         elif i == len(details) - 1:
             request += (
                 f"            else:\n"
-                f"                response = {value.get('function', '')}\n"
+                f"                response = {_offload_request(value.get('function', ''))}\n"
                 f"                await process_response(response)\n"
             )
             processed_operation_ids.append(
@@ -856,7 +867,7 @@ def _gen_tools_write_delete(details: dict, func_data: dict, processed_operation_
         else:
             request += (
                 f"            elif {func_data.get('if_filter', 'action_type')}.value == \"{key}\":\n"
-                f"                response = {value.get('function', '')}\n"
+                f"                response = {_offload_request(value.get('function', ''))}\n"
                 f"                await process_response(response)\n"
             )
             processed_operation_ids.append(
@@ -1166,11 +1177,11 @@ def _gen_tools_openapi(
         if optimization_parameter_name:
             request = REQ_OPTIMIZED_TEMPLATE.format(
                 parameter=optimization_parameter_name,
-                custom_request=optimization_request,
-                request=mistapi_request,
+                custom_request=_offload_request(optimization_request),
+                request=_offload_request(mistapi_request),
             )
         else:
-            request = REQ_TEMPLATE.format(request=mistapi_request)
+            request = REQ_TEMPLATE.format(request=_offload_request(mistapi_request))
 
         input_parameters = _build_input_parameters_log(
             methods.get("parameters", [])
@@ -85,20 +85,37 @@ GET_CONFIGURATION_OBJECTS_TEMPLATE = '''"""
 --------------------------------------------------------------------------------
 """
 
+import asyncio
+import copy
+import functools
+import hashlib
+import time
+from collections import OrderedDict
+from contextlib import aclosing
 from enum import Enum
 from typing import Annotated, Optional
 from uuid import UUID
 
 import mistapi
 from fastmcp.exceptions import ToolError
+from fastmcp.server.dependencies import get_context
 from mistapi.__api_response import APIResponse as _APIResponse
 from pydantic import Field
 from requests.structures import CaseInsensitiveDict
 
+from mistmcp.config import config
+from mistmcp.config_cache import config_cache
+from mistmcp.cursor_store import cursor_store
 from mistmcp.logger import logger
+from mistmcp.object_index import name_matcher, object_index
+from mistmcp.paginator import get_all_pages, iter_pages
+from mistmcp.rate_limiter import low_priority, session_key
+from mistmcp.request_executor import MIST_CALL_ERRORS, mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_formatter import format_response
 from mistmcp.response_processor import handle_network_error, process_response
+from mistmcp.retry_policy import tool_deadline
+from mistmcp.serializer import dumps
 from mistmcp.server import mcp
 
 
@@ -205,8 +222,7 @@ Raises:
 async def get_configuration_objects(
     org_id: Annotated[UUID, Field(description="""Organization ID""")],
     object_type: Annotated[
-        Object_type, Field(
-            description="""Type of configuration object to retrieve""")
+        Object_type, Field(description="""Type of configuration object to retrieve""")
     ],
     site_id: Annotated[
         UUID,
@@ -233,7 +249,7 @@ async def get_configuration_objects(
         bool,
         Field(
             default=None,
-            description="""Whether to retrieve the computed configuration object with all inherited settings applied. Only considered when object_type is `org_sites` and `site_devices` when a single object is returned, or when object_type is `site_wlans`""",
+            description="""Whether to retrieve the computed configuration object with all inherited settings applied. Only considered when object_type is `org_sites` when a single object is returned, `site_devices` (a single device, or every device of the site when neither `object_id` nor `name` is provided), or when object_type is `site_wlans`""",
         ),
     ],
     limit: Annotated[
@@ -247,13 +263,50 @@ async def get_configuration_objects(
     """Retrieve configuration objects from a specified organization or site. For the site configuration objects, set the attribute `computed` to `true` to retrieve the computed configuration including all configuration objects defined at the org level and assigned to the site. This tool allows you to retrieve a list of configuration objects (e.g. wlans, device profiles, network templates) or to filter them providing their ID."""
 
     logger.debug("Tool get_configuration_objects called")
-    logger.debug("Input Parameters: org_id=%s, object_type=%s, site_id=%s, object_id=%s, name=%s, computed=%s, limit=%s", org_id, object_type, site_id, object_id, name, computed, limit)
+    logger.debug(
+        "Input Parameters: org_id=%s, object_type=%s, site_id=%s, object_id=%s, name=%s, computed=%s, limit=%s",
+        org_id,
+        object_type,
+        site_id,
+        object_id,
+        name,
+        computed,
+        limit,
+    )
 
     apisession, response_format = await get_apisession()
 
-    response = None
+    cache_key = config_cache.key(
+        apisession,
+        object_type=object_type.value,
+        org_id=str(org_id),
+        site_id=str(site_id) if site_id else None,
+        object_id=str(object_id) if object_id else None,
+        name=name,
+        computed=computed,
+        limit=limit,
+    )
+    response = config_cache.get(cache_key)
+    cached = response is not None
+    # The lookups by ID use the get endpoint: the list data can be a summary
+    # of the objects, and as old as the index
+    if not cached and not computed and name and not object_id:
+        response = _index_lookup(
+            object_index.key(
+                apisession,
+                object_type.value,
+                str(org_id),
+                str(site_id)
+                if site_id and object_type.value.startswith("site_")
+                else None,
+            ),
+            name=name,
+            limit=limit if limit else 20,
+        )
     try:
-        if object_type.value.startswith("site_"):
+        if response is not None:
+            logger.debug("Configuration objects served from cache")
+        elif object_type.value.startswith("site_"):
             if not site_id:
                 raise ToolError(
                     "site_id is required when object_type starts with 'site_'"
@@ -292,6 +345,8 @@ async def get_configuration_objects(
                 "message": "API call failed: No response object was created due to an error.",
             }
         )
+    if not cached:
+        config_cache.put(cache_key, response)
     return format_response(response, response_format)
 
 
@@ -307,26 +362,43 @@ async def _org_configuration_objects_getter(
 ) -> _APIResponse:
     match object_type:
         case "org":
-            response = mistapi.api.v1.orgs.setting.getOrgSettings(
-                apisession, org_id=str(org_id)
+            response = await mist_call(
+                mistapi.api.v1.orgs.setting.getOrgSettings,
+                apisession,
+                org_id=str(org_id),
             )
             await process_response(response)
         case "org_alarmtemplates":
             if object_id:
-                response = mistapi.api.v1.orgs.alarmtemplates.getOrgAlarmTemplate(
-                    apisession, org_id=str(org_id), alarmtemplate_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.alarmtemplates.getOrgAlarmTemplate,
+                    apisession,
+                    org_id=str(org_id),
+                    alarmtemplate_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.alarmtemplates.listOrgAlarmTemplates(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.alarmtemplates.listOrgAlarmTemplates,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.alarmtemplates.listOrgAlarmTemplates(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.alarmtemplates.listOrgAlarmTemplates,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -337,20 +409,35 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_wlans":
             if object_id:
-                response = mistapi.api.v1.orgs.wlans.getOrgWLAN(
-                    apisession, org_id=str(org_id), wlan_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.wlans.getOrgWLAN,
+                    apisession,
+                    org_id=str(org_id),
+                    wlan_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.wlans.listOrgWlans(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.wlans.listOrgWlans,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "ssid",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "ssid")
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.wlans.listOrgWlans(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.wlans.listOrgWlans,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -361,38 +448,68 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_sitegroups":
             if object_id:
-                response = mistapi.api.v1.orgs.sitegroups.getOrgSiteGroup(
-                    apisession, org_id=str(org_id), sitegroup_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.sitegroups.getOrgSiteGroup,
+                    apisession,
+                    org_id=str(org_id),
+                    sitegroup_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.sitegroups.listOrgSiteGroups(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.sitegroups.listOrgSiteGroups,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.sitegroups.listOrgSiteGroups(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.sitegroups.listOrgSiteGroups,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
         case "org_avprofiles":
             if object_id:
-                response = mistapi.api.v1.orgs.avprofiles.getOrgAntivirusProfile(
-                    apisession, org_id=str(org_id), avprofile_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.avprofiles.getOrgAntivirusProfile,
+                    apisession,
+                    org_id=str(org_id),
+                    avprofile_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.avprofiles.listOrgAntivirusProfiles(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.avprofiles.listOrgAntivirusProfiles,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.avprofiles.listOrgAntivirusProfiles(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.avprofiles.listOrgAntivirusProfiles,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -403,20 +520,35 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_deviceprofiles":
             if object_id:
-                response = mistapi.api.v1.orgs.deviceprofiles.getOrgDeviceProfile(
-                    apisession, org_id=str(org_id), deviceprofile_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.deviceprofiles.getOrgDeviceProfile,
+                    apisession,
+                    org_id=str(org_id),
+                    deviceprofile_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.deviceprofiles.listOrgDeviceProfiles(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.deviceprofiles.listOrgDeviceProfiles,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.deviceprofiles.listOrgDeviceProfiles(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.deviceprofiles.listOrgDeviceProfiles,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -427,20 +559,35 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_evpn_topologies":
             if object_id:
-                response = mistapi.api.v1.orgs.evpn_topologies.getOrgEvpnTopology(
-                    apisession, org_id=str(org_id), evpn_topology_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.evpn_topologies.getOrgEvpnTopology,
+                    apisession,
+                    org_id=str(org_id),
+                    evpn_topology_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.evpn_topologies.listOrgEvpnTopologies(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.evpn_topologies.listOrgEvpnTopologies,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.evpn_topologies.listOrgEvpnTopologies(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.evpn_topologies.listOrgEvpnTopologies,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -451,20 +598,35 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_gatewaytemplates":
             if object_id:
-                response = mistapi.api.v1.orgs.gatewaytemplates.getOrgGatewayTemplate(
-                    apisession, org_id=str(org_id), gatewaytemplate_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.gatewaytemplates.getOrgGatewayTemplate,
+                    apisession,
+                    org_id=str(org_id),
+                    gatewaytemplate_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.gatewaytemplates.listOrgGatewayTemplates(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.gatewaytemplates.listOrgGatewayTemplates,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.gatewaytemplates.listOrgGatewayTemplates(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.gatewaytemplates.listOrgGatewayTemplates,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -475,20 +637,35 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_idpprofiles":
             if object_id:
-                response = mistapi.api.v1.orgs.idpprofiles.getOrgIdpProfile(
-                    apisession, org_id=str(org_id), idpprofile_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.idpprofiles.getOrgIdpProfile,
+                    apisession,
+                    org_id=str(org_id),
+                    idpprofile_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.idpprofiles.listOrgIdpProfiles(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.idpprofiles.listOrgIdpProfiles,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.idpprofiles.listOrgIdpProfiles(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.idpprofiles.listOrgIdpProfiles,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -499,20 +676,33 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_aamwprofiles":
             if object_id:
-                response = mistapi.api.v1.orgs.aamwprofiles.getOrgAAMWProfile(
-                    apisession, org_id=str(org_id), aamwprofile_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.aamwprofiles.getOrgAAMWProfile,
+                    apisession,
+                    org_id=str(org_id),
+                    aamwprofile_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.aamwprofiles.listOrgAAMWProfiles(
-                    apisession, org_id=str(org_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.aamwprofiles.listOrgAAMWProfiles,
+                    apisession,
+                    org_id=str(org_id),
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.aamwprofiles.listOrgAAMWProfiles(
-                    apisession, org_id=str(org_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.aamwprofiles.listOrgAAMWProfiles,
+                    apisession,
+                    org_id=str(org_id),
                 )
                 await process_response(response)
                 data = [
@@ -523,20 +713,35 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_mxclusters":
             if object_id:
-                response = mistapi.api.v1.orgs.mxclusters.getOrgMxEdgeCluster(
-                    apisession, org_id=str(org_id), mxcluster_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.mxclusters.getOrgMxEdgeCluster,
+                    apisession,
+                    org_id=str(org_id),
+                    mxcluster_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.mxclusters.listOrgMxEdgeClusters(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.mxclusters.listOrgMxEdgeClusters,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.mxclusters.listOrgMxEdgeClusters(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.mxclusters.listOrgMxEdgeClusters,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -547,20 +752,35 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_mxedges":
             if object_id:
-                response = mistapi.api.v1.orgs.mxedges.getOrgMxEdge(
-                    apisession, org_id=str(org_id), mxedge_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.mxedges.getOrgMxEdge,
+                    apisession,
+                    org_id=str(org_id),
+                    mxedge_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.mxedges.listOrgMxEdges(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.mxedges.listOrgMxEdges,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.mxedges.listOrgMxEdges(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.mxedges.listOrgMxEdges,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -571,20 +791,35 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_mxtunnels":
             if object_id:
-                response = mistapi.api.v1.orgs.mxtunnels.getOrgMxTunnel(
-                    apisession, org_id=str(org_id), mxtunnel_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.mxtunnels.getOrgMxTunnel,
+                    apisession,
+                    org_id=str(org_id),
+                    mxtunnel_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.mxtunnels.listOrgMxTunnels(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.mxtunnels.listOrgMxTunnels,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.mxtunnels.listOrgMxTunnels(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.mxtunnels.listOrgMxTunnels,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -595,56 +830,101 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_nactags":
             if object_id:
-                response = mistapi.api.v1.orgs.nactags.getOrgNacTag(
-                    apisession, org_id=str(org_id), nactag_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.nactags.getOrgNacTag,
+                    apisession,
+                    org_id=str(org_id),
+                    nactag_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.nactags.listOrgNacTags(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.nactags.listOrgNacTags,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.nactags.listOrgNacTags(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.nactags.listOrgNacTags,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
         case "org_nacrules":
             if object_id:
-                response = mistapi.api.v1.orgs.nacrules.getOrgNacRule(
-                    apisession, org_id=str(org_id), nacrule_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.nacrules.getOrgNacRule,
+                    apisession,
+                    org_id=str(org_id),
+                    nacrule_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.nacrules.listOrgNacRules(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.nacrules.listOrgNacRules,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.nacrules.listOrgNacRules(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.nacrules.listOrgNacRules,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
         case "org_networktemplates":
             if object_id:
-                response = mistapi.api.v1.orgs.networktemplates.getOrgNetworkTemplate(
-                    apisession, org_id=str(org_id), networktemplate_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.networktemplates.getOrgNetworkTemplate,
+                    apisession,
+                    org_id=str(org_id),
+                    networktemplate_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.networktemplates.listOrgNetworkTemplates(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.networktemplates.listOrgNetworkTemplates,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.networktemplates.listOrgNetworkTemplates(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.networktemplates.listOrgNetworkTemplates,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -655,56 +935,101 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_networks":
             if object_id:
-                response = mistapi.api.v1.orgs.networks.getOrgNetwork(
-                    apisession, org_id=str(org_id), network_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.networks.getOrgNetwork,
+                    apisession,
+                    org_id=str(org_id),
+                    network_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.networks.listOrgNetworks(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.networks.listOrgNetworks,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.networks.listOrgNetworks(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.networks.listOrgNetworks,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
         case "org_psks":
             if object_id:
-                response = mistapi.api.v1.orgs.psks.getOrgPsk(
-                    apisession, org_id=str(org_id), psk_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.psks.getOrgPsk,
+                    apisession,
+                    org_id=str(org_id),
+                    psk_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.psks.listOrgPsks(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.psks.listOrgPsks,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.psks.listOrgPsks(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.psks.listOrgPsks,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
         case "org_rftemplates":
             if object_id:
-                response = mistapi.api.v1.orgs.rftemplates.getOrgRfTemplate(
-                    apisession, org_id=str(org_id), rftemplate_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.rftemplates.getOrgRfTemplate,
+                    apisession,
+                    org_id=str(org_id),
+                    rftemplate_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.rftemplates.listOrgRfTemplates(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.rftemplates.listOrgRfTemplates,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.rftemplates.listOrgRfTemplates(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.rftemplates.listOrgRfTemplates,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -715,20 +1040,35 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_services":
             if object_id:
-                response = mistapi.api.v1.orgs.services.getOrgService(
-                    apisession, org_id=str(org_id), service_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.services.getOrgService,
+                    apisession,
+                    org_id=str(org_id),
+                    service_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.networktemplates.listOrgNetworkTemplates(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.networktemplates.listOrgNetworkTemplates,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.services.listOrgServices(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.services.listOrgServices,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -739,20 +1079,35 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_servicepolicies":
             if object_id:
-                response = mistapi.api.v1.orgs.servicepolicies.getOrgServicePolicy(
-                    apisession, org_id=str(org_id), servicepolicy_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.servicepolicies.getOrgServicePolicy,
+                    apisession,
+                    org_id=str(org_id),
+                    servicepolicy_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.servicepolicies.listOrgServicePolicies(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.servicepolicies.listOrgServicePolicies,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.servicepolicies.listOrgServicePolicies(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.servicepolicies.listOrgServicePolicies,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -766,23 +1121,34 @@ async def _org_configuration_objects_getter(
                 site_id = object_id
             if site_id:
                 if computed:
-                    response = mistapi.api.v1.sites.setting.getSiteSettingDerived(
-                        apisession, site_id=str(site_id)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.setting.getSiteSettingDerived,
+                        apisession,
+                        site_id=str(site_id),
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.sites.setting.getSiteSetting(
-                        apisession, site_id=str(site_id)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.setting.getSiteSetting,
+                        apisession,
+                        site_id=str(site_id),
                     )
                     await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.sites.searchOrgSites(
-                    apisession, org_id=str(org_id), limit=limit, name=name
+                response = await mist_call(
+                    mistapi.api.v1.orgs.sites.searchOrgSites,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
+                    name=name,
                 )
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.sites.listOrgSites(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.sites.listOrgSites,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -793,20 +1159,35 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_sitetemplates":
             if object_id:
-                response = mistapi.api.v1.orgs.sitetemplates.getOrgSiteTemplate(
-                    apisession, org_id=str(org_id), sitetemplate_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.sitetemplates.getOrgSiteTemplate,
+                    apisession,
+                    org_id=str(org_id),
+                    sitetemplate_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.sitetemplates.listOrgSiteTemplates(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.sitetemplates.listOrgSiteTemplates,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.sitetemplates.listOrgSiteTemplates(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.sitetemplates.listOrgSiteTemplates,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -817,38 +1198,65 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_vpns":
             if object_id:
-                response = mistapi.api.v1.orgs.vpns.getOrgVpn(
-                    apisession, org_id=str(org_id), vpn_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.vpns.getOrgVpn,
+                    apisession,
+                    org_id=str(org_id),
+                    vpn_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.vpns.listOrgVpns(
-                    apisession, org_id=str(org_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.vpns.listOrgVpns, apisession, org_id=str(org_id)
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.vpns.listOrgVpns(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.vpns.listOrgVpns,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
         case "org_webhooks":
             if object_id:
-                response = mistapi.api.v1.orgs.webhooks.getOrgWebhook(
-                    apisession, org_id=str(org_id), webhook_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.webhooks.getOrgWebhook,
+                    apisession,
+                    org_id=str(org_id),
+                    webhook_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.webhooks.listOrgWebhooks(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.webhooks.listOrgWebhooks,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.webhooks.listOrgWebhooks(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.webhooks.listOrgWebhooks,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -859,20 +1267,35 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_wlantemplates":
             if object_id:
-                response = mistapi.api.v1.orgs.templates.getOrgTemplate(
-                    apisession, org_id=str(org_id), template_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.templates.getOrgTemplate,
+                    apisession,
+                    org_id=str(org_id),
+                    template_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.templates.listOrgTemplates(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.templates.listOrgTemplates,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.templates.listOrgTemplates(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.templates.listOrgTemplates,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -883,31 +1306,52 @@ async def _org_configuration_objects_getter(
                 response.data = data
         case "org_wxrules":
             if object_id:
-                response = mistapi.api.v1.orgs.wxrules.getOrgWxRule(
-                    apisession, org_id=str(org_id), wxrule_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.wxrules.getOrgWxRule,
+                    apisession,
+                    org_id=str(org_id),
+                    wxrule_id=str(object_id),
                 )
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.wxrules.listOrgWxRules(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.wxrules.listOrgWxRules,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
         case "org_wxtags":
             if object_id:
-                response = mistapi.api.v1.orgs.wxtags.getOrgWxTag(
-                    apisession, org_id=str(org_id), wxtag_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.wxtags.getOrgWxTag,
+                    apisession,
+                    org_id=str(org_id),
+                    wxtag_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.orgs.wxtags.listOrgWxTags(
-                    apisession, org_id=str(org_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.orgs.wxtags.listOrgWxTags,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(apisession, object_type, org_id),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.orgs.wxtags.listOrgWxTags(
-                    apisession, org_id=str(org_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.orgs.wxtags.listOrgWxTags,
+                    apisession,
+                    org_id=str(org_id),
+                    limit=limit,
                 )
                 await process_response(response)
         case _:
@@ -937,20 +1381,37 @@ async def _site_configuration_objects_getter(
             )
         case "site_evpn_topologies":
             if object_id:
-                response = mistapi.api.v1.sites.evpn_topologies.getSiteEvpnTopology(
-                    apisession, site_id=str(site_id), evpn_topology_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.sites.evpn_topologies.getSiteEvpnTopology,
+                    apisession,
+                    site_id=str(site_id),
+                    evpn_topology_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.sites.evpn_topologies.listSiteEvpnTopologies(
-                    apisession, site_id=str(site_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.sites.evpn_topologies.listSiteEvpnTopologies,
+                    apisession,
+                    site_id=str(site_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(
+                        apisession, object_type, org_id, site_id
+                    ),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.sites.evpn_topologies.listSiteEvpnTopologies(
-                    apisession, site_id=str(site_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.sites.evpn_topologies.listSiteEvpnTopologies,
+                    apisession,
+                    site_id=str(site_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -961,20 +1422,37 @@ async def _site_configuration_objects_getter(
                 response.data = data
         case "site_maps":
             if object_id:
-                response = mistapi.api.v1.sites.maps.getSiteMap(
-                    apisession, site_id=str(site_id), map_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.sites.maps.getSiteMap,
+                    apisession,
+                    site_id=str(site_id),
+                    map_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.sites.maps.listSiteMaps(
-                    apisession, site_id=str(site_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.sites.maps.listSiteMaps,
+                    apisession,
+                    site_id=str(site_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(
+                        apisession, object_type, org_id, site_id
+                    ),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.sites.maps.listSiteMaps(
-                    apisession, site_id=str(site_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.sites.maps.listSiteMaps,
+                    apisession,
+                    site_id=str(site_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -985,20 +1463,37 @@ async def _site_configuration_objects_getter(
                 response.data = data
         case "site_mxedges":
             if object_id:
-                response = mistapi.api.v1.sites.mxedges.getSiteMxEdge(
-                    apisession, site_id=str(site_id), mxedge_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.sites.mxedges.getSiteMxEdge,
+                    apisession,
+                    site_id=str(site_id),
+                    mxedge_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.sites.mxedges.listSiteMxEdges(
-                    apisession, site_id=str(site_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.sites.mxedges.listSiteMxEdges,
+                    apisession,
+                    site_id=str(site_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(
+                        apisession, object_type, org_id, site_id
+                    ),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.sites.mxedges.listSiteMxEdges(
-                    apisession, site_id=str(site_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.sites.mxedges.listSiteMxEdges,
+                    apisession,
+                    site_id=str(site_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -1009,38 +1504,72 @@ async def _site_configuration_objects_getter(
                 response.data = data
         case "site_psks":
             if object_id:
-                response = mistapi.api.v1.sites.psks.getSitePsk(
-                    apisession, site_id=str(site_id), psk_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.sites.psks.getSitePsk,
+                    apisession,
+                    site_id=str(site_id),
+                    psk_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.sites.psks.listSitePsks(
-                    apisession, site_id=str(site_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.sites.psks.listSitePsks,
+                    apisession,
+                    site_id=str(site_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(
+                        apisession, object_type, org_id, site_id
+                    ),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.sites.psks.listSitePsks(
-                    apisession, site_id=str(site_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.sites.psks.listSitePsks,
+                    apisession,
+                    site_id=str(site_id),
+                    limit=limit,
                 )
                 await process_response(response)
         case "site_webhooks":
             if object_id:
-                response = mistapi.api.v1.sites.webhooks.getSiteWebhook(
-                    apisession, site_id=str(site_id), webhook_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.sites.webhooks.getSiteWebhook,
+                    apisession,
+                    site_id=str(site_id),
+                    webhook_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.sites.webhooks.listSiteWebhooks(
-                    apisession, site_id=str(site_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.sites.webhooks.listSiteWebhooks,
+                    apisession,
+                    site_id=str(site_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(
+                        apisession, object_type, org_id, site_id
+                    ),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.sites.webhooks.listSiteWebhooks(
-                    apisession, site_id=str(site_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.sites.webhooks.listSiteWebhooks,
+                    apisession,
+                    site_id=str(site_id),
+                    limit=limit,
                 )
                 await process_response(response)
                 data = [
@@ -1055,31 +1584,54 @@ async def _site_configuration_objects_getter(
             )
         case "site_wxrules":
             if object_id:
-                response = mistapi.api.v1.sites.wxrules.getSiteWxRule(
-                    apisession, site_id=str(site_id), wxrule_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.sites.wxrules.getSiteWxRule,
+                    apisession,
+                    site_id=str(site_id),
+                    wxrule_id=str(object_id),
                 )
                 await process_response(response)
             else:
-                response = mistapi.api.v1.sites.wxrules.listSiteWxRules(
-                    apisession, site_id=str(site_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.sites.wxrules.listSiteWxRules,
+                    apisession,
+                    site_id=str(site_id),
+                    limit=limit,
                 )
                 await process_response(response)
         case "site_wxtags":
             if object_id:
-                response = mistapi.api.v1.sites.wxtags.getSiteWxTag(
-                    apisession, site_id=str(site_id), wxtag_id=str(object_id)
+                response = await mist_call(
+                    mistapi.api.v1.sites.wxtags.getSiteWxTag,
+                    apisession,
+                    site_id=str(site_id),
+                    wxtag_id=str(object_id),
                 )
                 await process_response(response)
             elif name:
-                response = mistapi.api.v1.sites.wxtags.listSiteWxTags(
-                    apisession, site_id=str(site_id), limit=1000
+                response = await mist_call(
+                    mistapi.api.v1.sites.wxtags.listSiteWxTags,
+                    apisession,
+                    site_id=str(site_id),
+                    limit=1000,
+                )
+                response = await _search_object(
+                    apisession,
+                    response,
+                    name,
+                    "name",
+                    limit=limit,
+                    index_key=object_index.key(
+                        apisession, object_type, org_id, site_id
+                    ),
                 )
-                data_in = mistapi.get_all(apisession, response)
-                response = _search_object(data_in, name, "name", limit=limit)
                 await process_response(response)
             else:
-                response = mistapi.api.v1.sites.wxtags.listSiteWxTags(
-                    apisession, site_id=str(site_id), limit=limit
+                response = await mist_call(
+                    mistapi.api.v1.sites.wxtags.listSiteWxTags,
+                    apisession,
+                    site_id=str(site_id),
+                    limit=limit,
                 )
                 await process_response(response)
         case _:
@@ -1113,14 +1665,22 @@ async def _get_site_devices(
             )
             return response
         else:
-            response = mistapi.api.v1.sites.devices.getSiteDevice(
-                apisession, site_id=str(site_id), device_id=str(object_id)
+            response = await mist_call(
+                mistapi.api.v1.sites.devices.getSiteDevice,
+                apisession,
+                site_id=str(site_id),
+                device_id=str(object_id),
             )
             await process_response(response)
             return response
     elif name:
-        response = mistapi.api.v1.sites.devices.searchSiteDevices(
-            apisession, site_id=str(site_id), hostname=name, limit=1000, type="all"
+        response = await mist_call(
+            mistapi.api.v1.sites.devices.searchSiteDevices,
+            apisession,
+            site_id=str(site_id),
+            hostname=name,
+            limit=1000,
+            type="all",
         )
         await process_response(response)
         if (
@@ -1136,9 +1696,17 @@ async def _get_site_devices(
                 device_data=response,
             )
         return response
+    elif computed:
+        return await _get_computed_site_devices(
+            apisession=apisession, org_id=str(org_id), site_id=str(site_id)
+        )
     else:
-        response = mistapi.api.v1.sites.devices.listSiteDevices(
-            apisession, site_id=str(site_id), limit=limit, type="all"
+        response = await mist_call(
+            mistapi.api.v1.sites.devices.listSiteDevices,
+            apisession,
+            site_id=str(site_id),
+            limit=limit,
+            type="all",
         )
         await process_response(response)
         return response
@@ -1155,8 +1723,11 @@ async def _get_computed_device_configuration(
     logger.debug("func _get_device_configuration called")
 
     if device_id:
-        device_data = mistapi.api.v1.sites.devices.getSiteDevice(
-            apisession, site_id=str(site_id), device_id=str(device_id)
+        device_data = await mist_call(
+            mistapi.api.v1.sites.devices.getSiteDevice,
+            apisession,
+            site_id=str(site_id),
+            device_id=str(device_id),
         )
         await process_response(device_data)
     elif not device_data:
@@ -1166,218 +1737,338 @@ async def _get_computed_device_configuration(
                 "message": "Either device_id or device_data must be provided",
             }
         )
-    data = {}
     if isinstance(device_data.data, dict):
         match device_data.data.get("type"):
             case "switch":
-                switch_name = device_data.data.get("name", "")
-                switch_model = device_data.data.get("model", "")
-                switch_role = device_data.data.get("role", "")
-                switch_data = {}
-
-                site_config = mistapi.api.v1.sites.setting.getSiteSettingDerived(
-                    apisession, site_id=str(site_id)
-                )
-                await process_response(site_config)
-                if isinstance(site_config.data, dict):
-                    switch_data = _process_switch_template(
-                        site_config.data,
-                        switch_name,
-                        switch_model,
-                        switch_role,
-                        switch_data,
-                    )
-
-                for key, value in device_data.data.items():
-                    if key == "port_config":
-                        port_config = _process_switch_interface(value)
-                        switch_data[key] = {**data.get(key, {}), **port_config}
-                    elif isinstance(value, dict) and isinstance(
-                        switch_data.get(key, {}), dict
-                    ):
-                        switch_data[key] = {
-                            **switch_data.get(key, {}), **value}
-                    elif isinstance(value, list) and isinstance(
-                        switch_data.get(key, []), list
-                    ):
-                        switch_data[key] = switch_data.get(key, []) + value
-                    else:
-                        switch_data[key] = value
-                device_data.data = switch_data
+                site_config = await _get_site_setting_derived(apisession, site_id)
+                device_data.data = _compute_device(
+                    device_data.data, _compile_switch_template(site_config), None
+                )
             case "gateway":
-                gateway_data = {}
-                site_data = mistapi.api.v1.sites.sites.getSiteInfo(
-                    apisession, site_id=str(site_id)
-                )
-                await process_response(site_data)
-                if isinstance(site_data.data, dict):
-                    gateway_template_id = site_data.data.get(
-                        "gatewaytemplate_id")
-                    if gateway_template_id:
-                        response = (
-                            mistapi.api.v1.orgs.gatewaytemplates.getOrgGatewayTemplate(
-                                apisession,
-                                org_id=str(org_id),
-                                gatewaytemplate_id=str(gateway_template_id),
-                            )
-                        )
-                        await process_response(response)
-                        gateway_data = response.data
-
-                if isinstance(gateway_data, dict):
-                    for key, value in device_data.data.items():
-                        if key in NETWORK_TEMPLATE_FIELDS:
-                            if isinstance(value, dict) and isinstance(
-                                gateway_data.get(key, {}), dict
-                            ):
-                                gateway_data[key] = {
-                                    **gateway_data.get(key, {}),
-                                    **value,
-                                }
-                            elif isinstance(value, list) and isinstance(
-                                gateway_data.get(key, []), list
-                            ):
-                                gateway_data[key] = gateway_data.get(
-                                    key, []) + value
-                            else:
-                                gateway_data[key] = value
-                device_data.data = gateway_data
+                gateway_template = await _get_site_gateway_template(
+                    apisession, org_id, site_id
+                )
+                device_data.data = _compute_device(
+                    device_data.data, None, gateway_template
+                )
 
     return device_data
 
 
-########### SWITCH RELATED FUNCTIONS ############
+async def _get_computed_site_devices(
+    apisession: mistapi.APISession,
+    org_id: str,
+    site_id: str,
+) -> _APIResponse:
+    """Return the computed configuration of every device of a site.
 
+    The derived site setting and the gateway template are retrieved once,
+    at the same time as the first page of devices, and applied to the
+    devices page by page while the next pages are retrieved. The switch
+    template of the site setting is compiled once for all the devices.
+    """
+    devices, site_config, gateway_template = await asyncio.gather(
+        mist_call(
+            mistapi.api.v1.sites.devices.listSiteDevices,
+            apisession,
+            site_id=str(site_id),
+            limit=1000,
+            type="all",
+        ),
+        _get_site_setting_derived(apisession, site_id),
+        _get_site_gateway_template(apisession, org_id, site_id),
+    )
+    await process_response(devices)
+    switch_steps = _compile_switch_template(site_config)
+    try:
+        total = int(devices.headers.get("X-Page-Total", ""))
+    except (AttributeError, ValueError):
+        total = None
+    data = []
+    async with aclosing(iter_pages(apisession, devices)) as pages:
+        async for items in pages:
+            data += [
+                _compute_device(device, switch_steps, gateway_template)
+                for device in items
+                if isinstance(device, dict)
+            ]
+            await _report_progress(
+                len(data), total, f"Computed the configuration of {len(data)} devices"
+            )
+    devices.data = data
+    devices.next = None
+    return devices
 
-def _process_switch_template(
-    template: dict,
-    switch_name: str,
-    switch_model: str,
-    switch_role: str,
-    data: dict,
-) -> dict:
-    for key, value in template.items():
-        if key in NETWORK_TEMPLATE_FIELDS:
-            if key == "name":
-                continue
-            elif key == "switch_matching" and value.get("enable"):
-                data = _process_switch_rule(
-                    value.get("rules", []),
-                    switch_name,
-                    switch_model,
-                    switch_role,
-                    data,
-                )
-            elif isinstance(value, dict) and isinstance(data.get(key, {}), dict):
-                data[key] = {**data.get(key, {}), **value}
-            elif isinstance(value, list) and isinstance(data.get(key, []), list):
-                data[key] = data.get(key, []) + value
-            else:
-                data[key] = value
 
-    return data
+async def _get_site_setting_derived(
+    apisession: mistapi.APISession, site_id: str
+) -> dict | None:
+    site_config = await mist_call(
+        mistapi.api.v1.sites.setting.getSiteSettingDerived,
+        apisession,
+        site_id=str(site_id),
+    )
+    await process_response(site_config)
+    return site_config.data if isinstance(site_config.data, dict) else None
 
 
-def _process_switch_rule(
-    rules: list,
-    switch_name: str,
-    switch_model: str,
-    switch_role: str,
-    data: dict,
+async def _get_site_gateway_template(
+    apisession: mistapi.APISession, org_id: str, site_id: str
+) -> dict | None:
+    site_data = await mist_call(
+        mistapi.api.v1.sites.sites.getSiteInfo,
+        apisession,
+        site_id=str(site_id),
+    )
+    await process_response(site_data)
+    if not isinstance(site_data.data, dict):
+        return None
+    gateway_template_id = site_data.data.get("gatewaytemplate_id")
+    if not gateway_template_id:
+        return {}
+    response = await mist_call(
+        mistapi.api.v1.orgs.gatewaytemplates.getOrgGatewayTemplate,
+        apisession,
+        org_id=str(org_id),
+        gatewaytemplate_id=str(gateway_template_id),
+    )
+    await process_response(response)
+    return response.data
+
+
+def _compute_device(
+    device: dict, switch_steps: list, gateway_template: dict | None
 ) -> dict:
-    for rule in rules:
-        rule_cleansed = rule.copy()
-        del rule_cleansed["name"]
-
-        match_name_true = False
-        match_name_enabled = False
-        match_model_true = False
-        match_model_enabled = False
-        match_role_true = False
-        match_role_enabled = False
-        for k, v in rule.items():
-            if k.startswith("match_name"):
-                match_name_enabled = True
-                del rule_cleansed[k]
-                match_name_true = _process_switch_rule_match(switch_name, k, v)
-            elif k.startswith("match_model"):
-                match_model_enabled = True
-                del rule_cleansed[k]
-                match_model_true = _process_switch_rule_match(
-                    switch_model, k, v)
-            elif k == "match_role":
-                match_role_enabled = True
-                match_role_true = _process_switch_rule_match(switch_role, k, v)
-        if (
-            (not match_name_enabled or match_name_true)
-            and (not match_model_enabled or match_model_true)
-            and (not match_role_enabled or match_role_true)
-        ):
-            for key, value in rule_cleansed.items():
+    """Apply the site (switch) or gateway template to the device configuration.
+
+    ``switch_steps`` is the switch template compiled by
+    ``_compile_switch_template()``. The templates are not modified, so they
+    can be applied to many devices.
+    """
+    match device.get("type"):
+        case "switch":
+            switch_data = _process_switch_template(
+                switch_steps,
+                device.get("name", ""),
+                device.get("model", ""),
+                device.get("role", ""),
+                {},
+            )
+            for key, value in device.items():
                 if key == "port_config":
                     port_config = _process_switch_interface(value)
-                    data[key] = {**data.get(key, {}), **port_config}
-                elif isinstance(value, dict) and isinstance(data.get(key, {}), dict):
-                    data[key] = {**data.get(key, {}), **value}
-                elif isinstance(value, list) and isinstance(data.get(key, []), list):
-                    data[key] = data.get(key, []) + value
+                    switch_data[key] = {**switch_data.get(key, {}), **port_config}
+                elif isinstance(value, dict) and isinstance(
+                    switch_data.get(key, {}), dict
+                ):
+                    switch_data[key] = {**switch_data.get(key, {}), **value}
+                elif isinstance(value, list) and isinstance(
+                    switch_data.get(key, []), list
+                ):
+                    switch_data[key] = switch_data.get(key, []) + value
                 else:
-                    data[key] = value
-            return data
-    return data
+                    switch_data[key] = value
+            return switch_data
+        case "gateway":
+            gateway_data = copy.deepcopy(gateway_template) or {}
+            if isinstance(gateway_data, dict):
+                for key, value in device.items():
+                    if key in NETWORK_TEMPLATE_FIELDS:
+                        if isinstance(value, dict) and isinstance(
+                            gateway_data.get(key, {}), dict
+                        ):
+                            gateway_data[key] = {**gateway_data.get(key, {}), **value}
+                        elif isinstance(value, list) and isinstance(
+                            gateway_data.get(key, []), list
+                        ):
+                            gateway_data[key] = gateway_data.get(key, []) + value
+                        else:
+                            gateway_data[key] = value
+            return gateway_data
+    return device
 
 
-def _process_switch_rule_match(
-    switch_value: str, match_key: str, match_value: str
-) -> bool:
+async def _report_progress(
+    progress: float, total: float | None, message: str | None = None
+) -> None:
+    try:
+        ctx = get_context()
+    except RuntimeError:
+        return
+    await ctx.report_progress(progress, total, message)
+
+
+########### SWITCH RELATED FUNCTIONS ############
+
+
+# Max number of compiled switch templates kept in memory, and seconds they
+# are kept
+_COMPILED_TEMPLATES_MAX = 64
+_COMPILED_TEMPLATES_TTL = 300
+# template content hash -> (steps, compilation time)
+_compiled_templates: OrderedDict[str, tuple[list, float]] = OrderedDict()
+
+
+class _SwitchRule:
+    """``switch_matching`` rule compiled once: match slices parsed, values
+    lower-cased and port ranges expanded"""
+
+    __slots__ = ("conditions", "config")
+
+    def __init__(self, rule: dict) -> None:
+        # attribute -> (slice or None, lower-cased value), the last
+        # condition of an attribute wins
+        conditions: dict[str, tuple[slice | None, str | None]] = {}
+        self.config = {}
+        for key, value in rule.items():
+            if key.startswith("match_name"):
+                conditions["name"] = _compile_rule_match(key, value)
+            elif key.startswith("match_model"):
+                conditions["model"] = _compile_rule_match(key, value)
+            else:
+                if key == "match_role":
+                    conditions["role"] = _compile_rule_match(key, value)
+                if key == "port_config" and isinstance(value, dict):
+                    value = _process_switch_interface(value)
+                if key != "name":
+                    self.config[key] = value
+        self.conditions = list(conditions.items())
+
+    def matches(self, switch: dict[str, str]) -> bool:
+        for attribute, (part, value) in self.conditions:
+            if value is None:
+                return False
+            switch_value = switch[attribute].lower()
+            if part is None:
+                if switch_value != value:
+                    return False
+            elif len(switch_value) <= part.stop or switch_value[part] != value:
+                return False
+        return True
+
+
+def _compile_rule_match(match_key: str, match_value) -> tuple[slice | None, str | None]:
+    """Return the slice of the switch value to compare (``match_name[0:3]``)
+    and the value to compare with, or a None value if it can never match."""
+    if not isinstance(match_value, str):
+        return None, None
     if ":" in match_key:
-        match_start, match_stop = match_key.replace(
-            "]", "").split("[")[1].split(":")
         try:
-            if (
-                len(switch_value) > int(match_stop)
-                and switch_value[int(match_start): int(match_stop)].lower()
-                == match_value.lower()
-            ):
-                return True
-        except Exception:
-            return False
-    elif switch_value.lower() == match_value.lower():
-        return True
-    return False
+            match_start, match_stop = (
+                match_key.replace("]", "").split("[")[1].split(":")
+            )
+            return slice(int(match_start), int(match_stop)), match_value.lower()
+        except (IndexError, ValueError):
+            return None, None
+    return None, match_value.lower()
 
 
-def _process_switch_interface(
-    port_config: dict,
+def _compile_switch_template(template: dict | None) -> list:
+    """Return the steps applying ``template`` to a switch, in template order:
+    ``(key, value)`` to merge, or ``(None, rules)`` for the switch_matching
+    rules. Compile the template once, then apply the steps to every switch.
+
+    The compiled templates are cached by content hash for
+    ``_COMPILED_TEMPLATES_TTL`` seconds: the derived site setting merges the
+    network and site templates, and its ``modified_time`` does not change
+    when they are updated. The steps are shared, their values must be copied
+    before being merged into a response.
+    """
+    if not isinstance(template, dict):
+        return []
+    cache_key = hashlib.sha256(dumps(template).encode()).hexdigest()
+    now = time.monotonic()
+    cached = _compiled_templates.get(cache_key)
+    if cached is not None and now - cached[1] < _COMPILED_TEMPLATES_TTL:
+        _compiled_templates.move_to_end(cache_key)
+        return cached[0]
+    steps = []
+    for key, value in template.items():
+        if key in NETWORK_TEMPLATE_FIELDS and key != "name":
+            if key == "switch_matching" and value.get("enable"):
+                rules = [
+                    _SwitchRule(rule)
+                    for rule in value.get("rules", []) or []
+                    if isinstance(rule, dict)
+                ]
+                # the rules are evaluated when the template is applied
+                steps.append((None, rules))
+            else:
+                steps.append((key, value))
+    _compiled_templates[cache_key] = (steps, now)
+    _compiled_templates.move_to_end(cache_key)
+    while len(_compiled_templates) > _COMPILED_TEMPLATES_MAX:
+        _compiled_templates.popitem(last=False)
+    return steps
+
+
+def _merge_config(data: dict, config: dict) -> dict:
+    for key, value in config.items():
+        if isinstance(value, dict) and isinstance(data.get(key, {}), dict):
+            data[key] = {**data.get(key, {}), **value}
+        elif isinstance(value, list) and isinstance(data.get(key, []), list):
+            data[key] = data.get(key, []) + value
+        else:
+            data[key] = value
+    return data
+
+
+def _process_switch_template(
+    steps: list,
+    switch_name: str,
+    switch_model: str,
+    switch_role: str,
+    data: dict,
 ) -> dict:
-    port_config_tmp = {}
-    for key, value in port_config.items():
-        if "," in key:
-            keys = [k.strip() for k in key.split(",")]
-            for k in keys:
-                port_config_tmp[k] = value
+    switch = {
+        "name": switch_name or "",
+        "model": switch_model or "",
+        "role": switch_role or "",
+    }
+    for key, value in steps:
+        if key is None:
+            for rule in value:
+                if rule.matches(switch):
+                    data = _merge_config(data, copy.deepcopy(rule.config))
+                    break
         else:
-            port_config_tmp[key] = value
+            data = _merge_config(data, {key: copy.deepcopy(value)})
 
-    port_config_cleansed = {}
-    for key, value in port_config_tmp.items():
-        if key.count("-") > 1:
-            prefix, interfaces = key.split("-", 1)
-            fpc, pic, port = interfaces.split("/")
+    return data
+
+
+@functools.lru_cache(maxsize=4096)
+def _expand_interface(key: str) -> tuple[str, ...]:
+    """Return the interfaces of a ``port_config`` key, e.g. ``ge-0/0/0-47``"""
+    interfaces = []
+    for name in (k.strip() for k in key.split(",")):
+        if name.count("-") > 1:
+            prefix, ports = name.split("-", 1)
+            fpc, pic, port = ports.split("/")
             if "-" in fpc:
                 fpc_start, fpc_end = fpc.split("-")
                 for fpc_num in range(int(fpc_start), int(fpc_end) + 1):
-                    port_config_cleansed[f"{prefix}-{fpc_num}/{pic}/{port}"] = value
+                    interfaces.append(f"{prefix}-{fpc_num}/{pic}/{port}")
             elif "-" in pic:
                 pic_start, pic_end = pic.split("-")
                 for pic_num in range(int(pic_start), int(pic_end) + 1):
-                    port_config_cleansed[f"{prefix}-{fpc}/{pic_num}/{port}"] = value
+                    interfaces.append(f"{prefix}-{fpc}/{pic_num}/{port}")
             elif "-" in port:
                 port_start, port_end = port.split("-")
                 for port_num in range(int(port_start), int(port_end) + 1):
-                    port_config_cleansed[f"{prefix}-{fpc}/{pic}/{port_num}"] = value
+                    interfaces.append(f"{prefix}-{fpc}/{pic}/{port_num}")
         else:
-            port_config_cleansed[key] = value
+            interfaces.append(name)
+    return tuple(interfaces)
+
+
+def _process_switch_interface(
+    port_config: dict,
+) -> dict:
+    port_config_cleansed = {}
+    for key, value in port_config.items():
+        for interface in _expand_interface(key):
+            port_config_cleansed[interface] = value
 
     return port_config_cleansed
 
@@ -1386,6 +2077,27 @@ def _process_switch_interface(
 ########### SITE WLANS FUNCTIONS ############
 
 
+async def _get_org_objects(
+    apisession: mistapi.APISession,
+    list_function,
+    object_type: str,
+    org_id: str,
+) -> list:
+    """Return the full list of org objects, shared through the configuration
+    objects cache so resolving many sites in a row lists them only once.
+    The writes on ``object_type`` in the org invalidate the cached list."""
+    cache_key = config_cache.key(apisession, object_type, org_id=org_id)
+    response = config_cache.get(cache_key)
+    if response is None:
+        response = await mist_call(
+            list_function, apisession, org_id=str(org_id), limit=1000
+        )
+        await process_response(response)
+        response.data = await get_all_pages(apisession, response)
+        config_cache.put(cache_key, response)
+    return response.data
+
+
 async def _get_site_wlans(
     apisession: mistapi.APISession,
     org_id: str,
@@ -1396,27 +2108,46 @@ async def _get_site_wlans(
     limit: int = 20,
 ) -> _APIResponse:
     if object_id:
-        response = mistapi.api.v1.sites.wlans.getSiteWlan(
-            apisession, site_id=str(site_id), wlan_id=str(object_id)
+        response = await mist_call(
+            mistapi.api.v1.sites.wlans.getSiteWlan,
+            apisession,
+            site_id=str(site_id),
+            wlan_id=str(object_id),
         )
         await process_response(response)
     elif computed:
-        site_data = mistapi.api.v1.sites.sites.getSiteInfo(
-            apisession, site_id=str(site_id)
+        site_data, org_wlan_templates, org_wlans, site_wlans = await asyncio.gather(
+            mist_call(
+                mistapi.api.v1.sites.sites.getSiteInfo, apisession, site_id=str(site_id)
+            ),
+            _get_org_objects(
+                apisession,
+                mistapi.api.v1.orgs.templates.listOrgTemplates,
+                "org_wlantemplates",
+                str(org_id),
+            ),
+            _get_org_objects(
+                apisession,
+                mistapi.api.v1.orgs.wlans.listOrgWlans,
+                "org_wlans",
+                str(org_id),
+            ),
+            mist_call(
+                mistapi.api.v1.sites.wlans.listSiteWlans,
+                apisession,
+                site_id=str(site_id),
+                limit=1000,
+            ),
         )
         await process_response(site_data)
+        await process_response(site_wlans)
         if isinstance(site_data.data, dict):
-            sitegroup_ids = site_data.data.get("sitegroup_ids", [])
+            sitegroup_ids = site_data.data.get("sitegroup_ids", []) or []
         else:
             sitegroup_ids = []
-        assigned_template_ids = []
-        assigned_wlans = []
         # ORG TEMPLATES
-        org_wlan_templates = mistapi.api.v1.orgs.templates.listOrgTemplates(
-            apisession, org_id=str(org_id), limit=limit
-        )
-        await process_response(org_wlan_templates)
-        for template in org_wlan_templates.data:
+        assigned_template_ids = set()
+        for template in org_wlan_templates:
             applies = template.get("applies", {})
             template_org_id = applies.get("org_id", "")
             template_site_ids = applies.get("site_ids", []) or []
@@ -1426,35 +2157,29 @@ async def _get_site_wlans(
                 or (set(template_sitegroup_ids) & set(sitegroup_ids))
                 or template_org_id == str(org_id)
             ):
-                assigned_template_ids.append(template.get("id"))
-        # ORG WLANS
-        org_wlans = mistapi.api.v1.orgs.wlans.listOrgWlans(
-            apisession, org_id=str(org_id), limit=limit
-        )
-        await process_response(org_wlans)
-        for wlan in org_wlans.data:
-            if wlan.get("template_id") in assigned_template_ids:
-                assigned_wlans.append(wlan)
-        # SITE WLANS
-        site_wlans = mistapi.api.v1.sites.wlans.listSiteWlans(
-            apisession, site_id=str(site_id), limit=limit
-        )
-        await process_response(site_wlans)
-
+                assigned_template_ids.add(template.get("id"))
+        # ORG WLANS, then SITE WLANS
+        assigned_wlans = [
+            wlan
+            for wlan in org_wlans
+            if wlan.get("template_id") in assigned_template_ids
+        ]
+        assigned_wlans += await get_all_pages(apisession, site_wlans)
         if name:
-            response = mistapi.api.v1.sites.wxtags.listSiteWxTags(
-                apisession, site_id=str(site_id), limit=1000
-            )
-            data_in = mistapi.get_all(apisession, response)
-            response = _search_object(data_in, name, "ssid", limit=limit)
-            await process_response(response)
-        for wlan in site_wlans.data:
-            assigned_wlans.append(wlan)
+            match = name_matcher(name)
+            assigned_wlans = [
+                wlan
+                for wlan in assigned_wlans
+                if match(str(wlan.get("ssid") or "").lower())
+            ]
         site_wlans.data = assigned_wlans
         response = site_wlans
     else:
-        response = mistapi.api.v1.sites.wlans.listSiteWlans(
-            apisession, site_id=str(site_id), limit=limit
+        response = await mist_call(
+            mistapi.api.v1.sites.wlans.listSiteWlans,
+            apisession,
+            site_id=str(site_id),
+            limit=limit,
         )
         await process_response(response)
         data = [
@@ -1466,32 +2191,143 @@ async def _get_site_wlans(
     return response
 
 
-def _search_object(
-    data_in: list,
-    name: str,
-    attribute: str = "name",
-    limit: int = 20,
+def _search_response(
+    matches: list,
+    total: int,
+    limit: int,
+    complete: bool = True,
+    session: str | None = None,
 ) -> _APIResponse:
-    data_out = []
-    for entry in data_in:
-        if name.startswith("*") and name.endswith("*"):
-            if name[1:-1].lower() in entry.get(attribute, "").lower():
-                data_out.append(entry)
-        elif name.startswith("*"):
-            if entry.get(attribute, "").lower().endswith(name[1:].lower()):
-                data_out.append(entry)
-        elif name.endswith("*"):
-            if entry.get(attribute, "").lower().startswith(name[:-1].lower()):
-                data_out.append(entry)
-        else:
-            if name.lower() in entry.get(attribute, "").lower():
-                data_out.append(entry)
+    """Return the response of a search, with the first ``limit`` matches.
+
+    When every match is known (``len(matches) == total``), the matches are
+    kept in the cursor store and the response ``next`` is the cursor of the
+    next page.
+    """
+    data_out = matches[:limit]
     response = _APIResponse(url="", response=None)
-    response.data = data_out[:limit]
     response.status_code = 200
     response.headers = CaseInsensitiveDict(
-        {"X-Page-Total": str(len(data_out)), "X-Page-Limit": str(limit)}
+        {"X-Page-Total": str(total), "X-Page-Limit": str(limit)}
     )
+    if total > len(data_out) or not complete:
+        response.data = {
+            "results": data_out,
+            "total": total,
+            "total_is_lower_bound": not complete,
+        }
+        if complete and session is not None and len(matches) == total:
+            response.next = cursor_store.put(session, matches, limit)
+    else:
+        response.data = data_out
     return response
 
+
+def _index_lookup(
+    index_key: tuple,
+    name: str,
+    limit: int = 20,
+) -> _APIResponse | None:
+    """Return the name search response built from the object index, or None
+    if the objects are not indexed (yet)."""
+    # every match is needed to paginate the next pages from the cursor store
+    found = object_index.search(
+        index_key, name, None if cursor_store.enabled else limit
+    )
+    if found is None:
+        return None
+    return _search_response(found[0], found[1], limit, session=index_key[0])
+
+
+# Index builds continuing in the background, by index key
+_index_builds: dict[tuple, asyncio.Task] = {}
+
+
+async def _build_index(index_key: tuple, pages, objects: list, attribute: str) -> None:
+    """Retrieve the remaining ``pages`` of a search, then index every object."""
+    try:
+        async with aclosing(pages):
+            async for items in pages:
+                objects += items
+    except MIST_CALL_ERRORS as exc:
+        logger.debug("Search object: the index build stopped: %s", exc)
+        return
+    object_index.build(index_key, objects, attribute)
+
+
+def _continue_index_build(
+    index_key: tuple, pages, objects: list, attribute: str
+) -> bool:
+    """Build the index of ``index_key`` from the remaining ``pages`` in the
+    background. Return False when a build of this index is already running."""
+    if index_key in _index_builds:
+        return False
+    with low_priority(), tool_deadline(config.tool_deadline):
+        task = asyncio.ensure_future(_build_index(index_key, pages, objects, attribute))
+    _index_builds[index_key] = task
+    task.add_done_callback(lambda done: _index_builds.pop(index_key, None))
+    return True
+
+
+async def _search_object(
+    apisession: mistapi.APISession,
+    response: _APIResponse,
+    name: str,
+    attribute: str = "name",
+    limit: int = 20,
+    index_key: tuple | None = None,
+) -> _APIResponse:
+    """Search the objects of a list response, and its next pages, by ``name``.
+
+    The pages are matched as they are retrieved, and the search returns as
+    soon as ``limit`` objects are found. In this case the total is a lower
+    bound and the response includes ``"total_is_lower_bound": true``.
+
+    With an ``index_key`` (and the object index enabled), the objects are
+    also indexed, so the next searches are done without calling the Mist
+    API: when the search returns early, the remaining pages are retrieved
+    in the background (as low priority calls) to complete the index.
+
+    When more than ``limit`` objects match and all of them are known, the
+    next pages are served from the cursor store (see ``_search_response()``).
+    """
+    indexing = index_key is not None and object_index.enabled
+    match = name_matcher(name)
+    matches = []
+    objects: list = []
+    complete = True
+    pages = iter_pages(apisession, response)
+    building = False
+    try:
+        async for items in pages:
+            if indexing:
+                objects += items
+            if len(matches) >= limit:
+                complete = False
+                break
+            matches += [
+                entry
+                for entry in items
+                if match(str(entry.get(attribute) or "").lower())
+            ]
+        if indexing and not complete:
+            building = _continue_index_build(index_key, pages, objects, attribute)
+    finally:
+        if not building:
+            await pages.aclose()
+    if indexing and complete:
+        object_index.build(index_key, objects, attribute)
+        indexed = _index_lookup(index_key, name=name, limit=limit)
+        if indexed is not None:
+            return indexed
+    total = len(matches)
+    logger.debug(
+        "Search object: %d match(es) for %s (%s)",
+        total,
+        name,
+        "complete" if complete else "stopped early",
+    )
+    return _search_response(
+        matches, total, limit, complete, session=session_key(apisession)
+    )
 '''
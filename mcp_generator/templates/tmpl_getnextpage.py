@@ -16,6 +16,10 @@ from pydantic import Field
 
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.cursor_store import cursor_store, is_cursor
+from mistmcp.prefetch_middleware import prefetch_middleware
+from mistmcp.rate_limiter import low_priority, session_key
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -25,7 +29,7 @@ from mistmcp.logger import logger
 
 @mcp.tool(
     name="mist_get_next_page",
-    description="Retrieve the next page of results using the \'_next\' URL returned by a previous tool call.",
+    description="Retrieve the next page of results using the '_next' URL returned by a previous tool call.",
     tags={"info"},
     annotations={
         "title": "Get Next Page",
@@ -38,17 +42,31 @@ from mistmcp.logger import logger
 async def get_next_page(
     url: Annotated[
         str,
-        Field(description="The \'_next\' URL from a previous response"),
+        Field(description="The '_next' URL from a previous response"),
     ],
 ) -> dict | list | str:
-    """Retrieve the next page of results using the \'_next\' URL returned by a previous tool call."""
+    """Retrieve the next page of results using the '_next' URL returned by a previous tool call."""
 
     logger.debug("Tool get_next_page called")
 
     apisession, response_format = await get_apisession()
 
+    if is_cursor(url):
+        data = cursor_store.page(session_key(apisession), url)
+        if data is None:
+            raise ToolError(
+                {
+                    "status_code": 404,
+                    "message": "The results of this cursor expired. Repeat the initial request to get them again.",
+                }
+            )
+        return format_response(data, response_format)
+
     try:
-        response = apisession.mist_get(url)
+        response = await prefetch_middleware.take(apisession, url)
+        if response is None:
+            with low_priority():
+                response = await mist_call(apisession.mist_get, url)
         await process_response(response)
     except ToolError:
         raise
@@ -56,5 +74,4 @@ async def get_next_page(
         await handle_network_error(_exc)
 
     return format_response(response, response_format)
-
 '''
@@ -21,8 +21,11 @@ from fastmcp.exceptions import ToolError
 from mistapi.__api_response import APIResponse
 from pydantic import Field
 
+from mistmcp.config_cache import config_cache
 from mistmcp.elicitation_processor import config_elicitation_handler
 from mistmcp.logger import logger
+from mistmcp.object_index import object_index
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_formatter import format_response
 from mistmcp.response_processor import handle_network_error, process_response
@@ -299,7 +302,8 @@ async def _org_function(
         match object_type.value:
             case "org_info":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.orgs.updateOrg(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.orgs.updateOrg,
                         apisession,
                         org_id=str(org_id),
                         body=payload,
@@ -314,7 +318,8 @@ async def _org_function(
                     )
             case "org_settings":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.setting.updateOrgSettings(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.setting.updateOrgSettings,
                         apisession,
                         org_id=str(org_id),
                         body=payload,
@@ -329,34 +334,34 @@ async def _org_function(
                     )
             case "org_alarmtemplates":
                 if action_type.value == "update":
-                    response = (
-                        mistapi.api.v1.orgs.alarmtemplates.updateOrgAlarmTemplate(
-                            apisession,
-                            org_id=str(org_id),
-                            alarmtemplate_id=str(object_id),
-                            body=payload,
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.alarmtemplates.updateOrgAlarmTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        alarmtemplate_id=str(object_id),
+                        body=payload,
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = (
-                        mistapi.api.v1.orgs.alarmtemplates.createOrgAlarmTemplate(
-                            apisession, org_id=str(org_id), body=payload
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.alarmtemplates.createOrgAlarmTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = (
-                        mistapi.api.v1.orgs.alarmtemplates.deleteOrgAlarmTemplate(
-                            apisession,
-                            org_id=str(org_id),
-                            alarmtemplate_id=str(object_id),
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.alarmtemplates.deleteOrgAlarmTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        alarmtemplate_id=str(object_id),
                     )
                     await process_response(response)
             case "org_wlans":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.wlans.updateOrgWlan(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.wlans.updateOrgWlan,
                         apisession,
                         org_id=str(org_id),
                         wlan_id=str(object_id),
@@ -364,18 +369,25 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.wlans.createOrgWlan(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.wlans.createOrgWlan,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.wlans.deleteOrgWlan(
-                        apisession, org_id=str(org_id), wlan_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.wlans.deleteOrgWlan,
+                        apisession,
+                        org_id=str(org_id),
+                        wlan_id=str(object_id),
                     )
                     await process_response(response)
             case "org_sitegroups":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.sitegroups.updateOrgSiteGroup(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.sitegroups.updateOrgSiteGroup,
                         apisession,
                         org_id=str(org_id),
                         sitegroup_id=str(object_id),
@@ -383,36 +395,49 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.sitegroups.createOrgSiteGroup(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.sitegroups.createOrgSiteGroup,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.sitegroups.deleteOrgSiteGroup(
-                        apisession, org_id=str(org_id), sitegroup_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.sitegroups.deleteOrgSiteGroup,
+                        apisession,
+                        org_id=str(org_id),
+                        sitegroup_id=str(object_id),
                     )
                     await process_response(response)
             case "org_sites":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.sites.sites.updateSiteInfo(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.sites.updateSiteInfo,
                         apisession,
                         site_id=str(object_id),
                         body=payload,
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.sites.createOrgSite(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.sites.createOrgSite,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.sites.sites.deleteSite(
-                        apisession, site_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.sites.deleteSite,
+                        apisession,
+                        site_id=str(object_id),
                     )
                     await process_response(response)
             case "org_avprofiles":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.avprofiles.updateOrgAntivirusProfile(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.avprofiles.updateOrgAntivirusProfile,
                         apisession,
                         org_id=str(org_id),
                         avprofile_id=str(object_id),
@@ -420,72 +445,77 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.avprofiles.createOrgAntivirusProfile(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.avprofiles.createOrgAntivirusProfile,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.avprofiles.deleteOrgAntivirusProfile(
-                        apisession, org_id=str(org_id), avprofile_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.avprofiles.deleteOrgAntivirusProfile,
+                        apisession,
+                        org_id=str(org_id),
+                        avprofile_id=str(object_id),
                     )
                     await process_response(response)
             case "org_deviceprofiles":
                 if action_type.value == "update":
-                    response = (
-                        mistapi.api.v1.orgs.deviceprofiles.updateOrgDeviceProfile(
-                            apisession,
-                            org_id=str(org_id),
-                            deviceprofile_id=str(object_id),
-                            body=payload,
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.deviceprofiles.updateOrgDeviceProfile,
+                        apisession,
+                        org_id=str(org_id),
+                        deviceprofile_id=str(object_id),
+                        body=payload,
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = (
-                        mistapi.api.v1.orgs.deviceprofiles.createOrgDeviceProfile(
-                            apisession, org_id=str(org_id), body=payload
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.deviceprofiles.createOrgDeviceProfile,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = (
-                        mistapi.api.v1.orgs.deviceprofiles.deleteOrgDeviceProfile(
-                            apisession,
-                            org_id=str(org_id),
-                            deviceprofile_id=str(object_id),
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.deviceprofiles.deleteOrgDeviceProfile,
+                        apisession,
+                        org_id=str(org_id),
+                        deviceprofile_id=str(object_id),
                     )
                     await process_response(response)
             case "org_gatewaytemplates":
                 if action_type.value == "update":
-                    response = (
-                        mistapi.api.v1.orgs.gatewaytemplates.updateOrgGatewayTemplate(
-                            apisession,
-                            org_id=str(org_id),
-                            gatewaytemplate_id=str(object_id),
-                            body=payload,
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.gatewaytemplates.updateOrgGatewayTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        gatewaytemplate_id=str(object_id),
+                        body=payload,
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = (
-                        mistapi.api.v1.orgs.gatewaytemplates.createOrgGatewayTemplate(
-                            apisession, org_id=str(org_id), body=payload
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.gatewaytemplates.createOrgGatewayTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = (
-                        mistapi.api.v1.orgs.gatewaytemplates.deleteOrgGatewayTemplate(
-                            apisession,
-                            org_id=str(org_id),
-                            gatewaytemplate_id=str(object_id),
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.gatewaytemplates.deleteOrgGatewayTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        gatewaytemplate_id=str(object_id),
                     )
                     await process_response(response)
             case "org_idpprofiles":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.idpprofiles.updateOrgIdpProfile(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.idpprofiles.updateOrgIdpProfile,
                         apisession,
                         org_id=str(org_id),
                         idpprofile_id=str(object_id),
@@ -493,18 +523,25 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.idpprofiles.createOrgIdpProfile(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.idpprofiles.createOrgIdpProfile,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.idpprofiles.deleteOrgIdpProfile(
-                        apisession, org_id=str(org_id), idpprofile_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.idpprofiles.deleteOrgIdpProfile,
+                        apisession,
+                        org_id=str(org_id),
+                        idpprofile_id=str(object_id),
                     )
                     await process_response(response)
             case "org_aamwprofiles":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.aamwprofiles.updateOrgAAMWProfile(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.aamwprofiles.updateOrgAAMWProfile,
                         apisession,
                         org_id=str(org_id),
                         aamwprofile_id=str(object_id),
@@ -512,18 +549,25 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.aamwprofiles.createOrgAAMWProfile(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.aamwprofiles.createOrgAAMWProfile,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.aamwprofiles.deleteOrgAAMWProfile(
-                        apisession, org_id=str(org_id), aamwprofile_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.aamwprofiles.deleteOrgAAMWProfile,
+                        apisession,
+                        org_id=str(org_id),
+                        aamwprofile_id=str(object_id),
                     )
                     await process_response(response)
             case "org_nactags":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.nactags.updateOrgNacTag(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.nactags.updateOrgNacTag,
                         apisession,
                         org_id=str(org_id),
                         nactag_id=str(object_id),
@@ -531,18 +575,25 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.nactags.createOrgNacTag(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.nactags.createOrgNacTag,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.nactags.deleteOrgNacTag(
-                        apisession, org_id=str(org_id), nactag_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.nactags.deleteOrgNacTag,
+                        apisession,
+                        org_id=str(org_id),
+                        nactag_id=str(object_id),
                     )
                     await process_response(response)
             case "org_nacrules":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.nacrules.updateOrgNacRule(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.nacrules.updateOrgNacRule,
                         apisession,
                         org_id=str(org_id),
                         nacrule_id=str(object_id),
@@ -550,45 +601,51 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.nacrules.createOrgNacRule(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.nacrules.createOrgNacRule,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.nacrules.deleteOrgNacRule(
-                        apisession, org_id=str(org_id), nacrule_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.nacrules.deleteOrgNacRule,
+                        apisession,
+                        org_id=str(org_id),
+                        nacrule_id=str(object_id),
                     )
                     await process_response(response)
             case "org_networktemplates":
                 if action_type.value == "update":
-                    response = (
-                        mistapi.api.v1.orgs.networktemplates.updateOrgNetworkTemplate(
-                            apisession,
-                            org_id=str(org_id),
-                            networktemplate_id=str(object_id),
-                            body=payload,
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.networktemplates.updateOrgNetworkTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        networktemplate_id=str(object_id),
+                        body=payload,
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = (
-                        mistapi.api.v1.orgs.networktemplates.createOrgNetworkTemplate(
-                            apisession, org_id=str(org_id), body=payload
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.networktemplates.createOrgNetworkTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = (
-                        mistapi.api.v1.orgs.networktemplates.deleteOrgNetworkTemplate(
-                            apisession,
-                            org_id=str(org_id),
-                            networktemplate_id=str(object_id),
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.networktemplates.deleteOrgNetworkTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        networktemplate_id=str(object_id),
                     )
                     await process_response(response)
             case "org_networks":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.networks.updateOrgNetwork(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.networks.updateOrgNetwork,
                         apisession,
                         org_id=str(org_id),
                         network_id=str(object_id),
@@ -596,18 +653,25 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.networks.createOrgNetwork(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.networks.createOrgNetwork,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.networks.deleteOrgNetwork(
-                        apisession, org_id=str(org_id), network_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.networks.deleteOrgNetwork,
+                        apisession,
+                        org_id=str(org_id),
+                        network_id=str(object_id),
                     )
                     await process_response(response)
             case "org_psks":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.psks.updateOrgPsk(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.psks.updateOrgPsk,
                         apisession,
                         org_id=str(org_id),
                         psk_id=str(object_id),
@@ -615,18 +679,25 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.psks.createOrgPsk(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.psks.createOrgPsk,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.psks.deleteOrgPsk(
-                        apisession, org_id=str(org_id), psk_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.psks.deleteOrgPsk,
+                        apisession,
+                        org_id=str(org_id),
+                        psk_id=str(object_id),
                     )
                     await process_response(response)
             case "org_rftemplates":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.rftemplates.updateOrgRfTemplate(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.rftemplates.updateOrgRfTemplate,
                         apisession,
                         org_id=str(org_id),
                         rftemplate_id=str(object_id),
@@ -634,18 +705,25 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.rftemplates.createOrgRfTemplate(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.rftemplates.createOrgRfTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.rftemplates.deleteOrgRfTemplate(
-                        apisession, org_id=str(org_id), rftemplate_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.rftemplates.deleteOrgRfTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        rftemplate_id=str(object_id),
                     )
                     await process_response(response)
             case "org_services":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.services.updateOrgService(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.services.updateOrgService,
                         apisession,
                         org_id=str(org_id),
                         service_id=str(object_id),
@@ -653,45 +731,51 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.services.createOrgService(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.services.createOrgService,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.services.deleteOrgService(
-                        apisession, org_id=str(org_id), service_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.services.deleteOrgService,
+                        apisession,
+                        org_id=str(org_id),
+                        service_id=str(object_id),
                     )
                     await process_response(response)
             case "org_servicepolicies":
                 if action_type.value == "update":
-                    response = (
-                        mistapi.api.v1.orgs.servicepolicies.updateOrgServicePolicy(
-                            apisession,
-                            org_id=str(org_id),
-                            servicepolicy_id=str(object_id),
-                            body=payload,
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.servicepolicies.updateOrgServicePolicy,
+                        apisession,
+                        org_id=str(org_id),
+                        servicepolicy_id=str(object_id),
+                        body=payload,
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = (
-                        mistapi.api.v1.orgs.servicepolicies.createOrgServicePolicy(
-                            apisession, org_id=str(org_id), body=payload
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.servicepolicies.createOrgServicePolicy,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = (
-                        mistapi.api.v1.orgs.servicepolicies.deleteOrgServicePolicy(
-                            apisession,
-                            org_id=str(org_id),
-                            servicepolicy_id=str(object_id),
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.servicepolicies.deleteOrgServicePolicy,
+                        apisession,
+                        org_id=str(org_id),
+                        servicepolicy_id=str(object_id),
                     )
                     await process_response(response)
             case "org_sitetemplates":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.sitetemplates.updateOrgSiteTemplate(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.sitetemplates.updateOrgSiteTemplate,
                         apisession,
                         org_id=str(org_id),
                         sitetemplate_id=str(object_id),
@@ -699,18 +783,25 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.sitetemplates.createOrgSiteTemplate(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.sitetemplates.createOrgSiteTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.sitetemplates.deleteOrgSiteTemplate(
-                        apisession, org_id=str(org_id), sitetemplate_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.sitetemplates.deleteOrgSiteTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        sitetemplate_id=str(object_id),
                     )
                     await process_response(response)
             case "org_vpns":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.vpns.updateOrgVpn(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.vpns.updateOrgVpn,
                         apisession,
                         org_id=str(org_id),
                         vpn_id=str(object_id),
@@ -718,18 +809,25 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.vpns.createOrgVpn(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.vpns.createOrgVpn,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.vpns.deleteOrgVpn(
-                        apisession, org_id=str(org_id), vpn_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.vpns.deleteOrgVpn,
+                        apisession,
+                        org_id=str(org_id),
+                        vpn_id=str(object_id),
                     )
                     await process_response(response)
             case "org_webhooks":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.webhooks.updateOrgWebhook(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.webhooks.updateOrgWebhook,
                         apisession,
                         org_id=str(org_id),
                         webhook_id=str(object_id),
@@ -737,18 +835,25 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.webhooks.createOrgWebhook(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.webhooks.createOrgWebhook,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.webhooks.deleteOrgWebhook(
-                        apisession, org_id=str(org_id), webhook_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.webhooks.deleteOrgWebhook,
+                        apisession,
+                        org_id=str(org_id),
+                        webhook_id=str(object_id),
                     )
                     await process_response(response)
             case "org_wlantemplates":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.templates.updateOrgTemplate(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.templates.updateOrgTemplate,
                         apisession,
                         org_id=str(org_id),
                         template_id=str(object_id),
@@ -756,18 +861,25 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.templates.createOrgTemplate(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.templates.createOrgTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.templates.deleteOrgTemplate(
-                        apisession, org_id=str(org_id), template_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.templates.deleteOrgTemplate,
+                        apisession,
+                        org_id=str(org_id),
+                        template_id=str(object_id),
                     )
                     await process_response(response)
             case "org_wxrules":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.wxrules.updateOrgWxRule(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.wxrules.updateOrgWxRule,
                         apisession,
                         org_id=str(org_id),
                         wxrule_id=str(object_id),
@@ -775,18 +887,25 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.wxrules.createOrgWxRule(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.wxrules.createOrgWxRule,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.wxrules.deleteOrgWxRule(
-                        apisession, org_id=str(org_id), wxrule_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.wxrules.deleteOrgWxRule,
+                        apisession,
+                        org_id=str(org_id),
+                        wxrule_id=str(object_id),
                     )
                     await process_response(response)
             case "org_wxtags":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.orgs.wxtags.updateOrgWxTag(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.wxtags.updateOrgWxTag,
                         apisession,
                         org_id=str(org_id),
                         wxtag_id=str(object_id),
@@ -794,13 +913,19 @@ async def _org_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.orgs.wxtags.createOrgWxTag(
-                        apisession, org_id=str(org_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.wxtags.createOrgWxTag,
+                        apisession,
+                        org_id=str(org_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.wxtags.deleteOrgWxTag(
-                        apisession, org_id=str(org_id), wxtag_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.wxtags.deleteOrgWxTag,
+                        apisession,
+                        org_id=str(org_id),
+                        wxtag_id=str(object_id),
                     )
                     await process_response(response)
 
@@ -808,6 +933,13 @@ async def _org_function(
         raise
     except Exception as _exc:
         await handle_network_error(_exc)
+    finally:
+        config_cache.invalidate(
+            object_type.value,
+            org_id=str(org_id),
+            object_id=str(object_id) if object_id else None,
+        )
+        object_index.invalidate(object_type.value, org_id=str(org_id))
 
     return response
 
@@ -824,7 +956,8 @@ async def _site_function(
         match object_type.value:
             case "site_settings":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.sites.setting.updateSiteSettings(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.setting.updateSiteSettings,
                         apisession,
                         site_id=str(site_id),
                         body=payload,
@@ -839,7 +972,8 @@ async def _site_function(
                     )
             case "site_devices":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.sites.devices.updateSiteDevice(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.devices.updateSiteDevice,
                         apisession,
                         site_id=str(site_id),
                         device_id=str(object_id),
@@ -848,7 +982,8 @@ async def _site_function(
                     await process_response(response)
             case "site_psks":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.sites.psks.updateSitePsk(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.psks.updateSitePsk,
                         apisession,
                         site_id=str(site_id),
                         psk_id=str(object_id),
@@ -856,18 +991,25 @@ async def _site_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.sites.psks.createSitePsk(
-                        apisession, site_id=str(site_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.sites.psks.createSitePsk,
+                        apisession,
+                        site_id=str(site_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.sites.psks.deleteSitePsk(
-                        apisession, site_id=str(site_id), psk_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.psks.deleteSitePsk,
+                        apisession,
+                        site_id=str(site_id),
+                        psk_id=str(object_id),
                     )
                     await process_response(response)
             case "site_webhooks":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.sites.webhooks.updateSiteWebhook(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.webhooks.updateSiteWebhook,
                         apisession,
                         site_id=str(site_id),
                         webhook_id=str(object_id),
@@ -875,18 +1017,25 @@ async def _site_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.sites.webhooks.createSiteWebhook(
-                        apisession, site_id=str(site_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.sites.webhooks.createSiteWebhook,
+                        apisession,
+                        site_id=str(site_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.sites.webhooks.deleteSiteWebhook(
-                        apisession, site_id=str(site_id), webhook_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.webhooks.deleteSiteWebhook,
+                        apisession,
+                        site_id=str(site_id),
+                        webhook_id=str(object_id),
                     )
                     await process_response(response)
             case "site_wlans":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.sites.wlans.updateSiteWlan(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.wlans.updateSiteWlan,
                         apisession,
                         site_id=str(site_id),
                         wlan_id=str(object_id),
@@ -894,18 +1043,25 @@ async def _site_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.sites.wlans.createSiteWlan(
-                        apisession, site_id=str(site_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.sites.wlans.createSiteWlan,
+                        apisession,
+                        site_id=str(site_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.sites.wlans.deleteSiteWlan(
-                        apisession, site_id=str(site_id), wlan_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.wlans.deleteSiteWlan,
+                        apisession,
+                        site_id=str(site_id),
+                        wlan_id=str(object_id),
                     )
                     await process_response(response)
             case "site_wxrules":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.sites.wxrules.updateSiteWxRule(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.wxrules.updateSiteWxRule,
                         apisession,
                         site_id=str(site_id),
                         wxrule_id=str(object_id),
@@ -913,18 +1069,25 @@ async def _site_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.sites.wxrules.createSiteWxRule(
-                        apisession, site_id=str(site_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.sites.wxrules.createSiteWxRule,
+                        apisession,
+                        site_id=str(site_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.sites.wxrules.deleteSiteWxRule(
-                        apisession, site_id=str(site_id), wxrule_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.wxrules.deleteSiteWxRule,
+                        apisession,
+                        site_id=str(site_id),
+                        wxrule_id=str(object_id),
                     )
                     await process_response(response)
             case "site_wxtags":
                 if action_type.value == "update":
-                    response = mistapi.api.v1.sites.wxtags.updateSiteWxTag(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.wxtags.updateSiteWxTag,
                         apisession,
                         site_id=str(site_id),
                         wxtag_id=str(object_id),
@@ -932,13 +1095,19 @@ async def _site_function(
                     )
                     await process_response(response)
                 elif action_type.value == "create":
-                    response = mistapi.api.v1.sites.wxtags.createSiteWxTag(
-                        apisession, site_id=str(site_id), body=payload
+                    response = await mist_call(
+                        mistapi.api.v1.sites.wxtags.createSiteWxTag,
+                        apisession,
+                        site_id=str(site_id),
+                        body=payload,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.sites.wxtags.deleteSiteWxTag(
-                        apisession, site_id=str(site_id), wxtag_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.wxtags.deleteSiteWxTag,
+                        apisession,
+                        site_id=str(site_id),
+                        wxtag_id=str(object_id),
                     )
                     await process_response(response)
 
@@ -954,7 +1123,13 @@ async def _site_function(
         raise
     except Exception as _exc:
         await handle_network_error(_exc)
+    finally:
+        config_cache.invalidate(
+            object_type.value,
+            site_id=str(site_id),
+            object_id=str(object_id) if object_id else None,
+        )
+        object_index.invalidate(object_type.value, site_id=str(site_id))
 
     return response
-
 '''
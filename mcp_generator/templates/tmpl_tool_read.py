@@ -13,6 +13,7 @@ TOOL_TEMPLATE_READ = '''"""
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
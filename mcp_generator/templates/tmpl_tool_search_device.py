@@ -20,6 +20,7 @@ from fastmcp.exceptions import ToolError
 from pydantic import Field
 
 from mistmcp.logger import logger
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_formatter import format_response
 from mistmcp.response_processor import handle_network_error, process_response
@@ -62,7 +63,8 @@ async def search_device(
     model: Annotated[
         str,
         Field(
-            description="""Device model. Partial match allowed with wildcard * (e.g. `AP*` will match `AP43` and `AP41`)""", default=None
+            description="""Device model. Partial match allowed with wildcard * (e.g. `AP*` will match `AP43` and `AP41`)""",
+            default=None,
         ),
     ],
     mac: Annotated[
@@ -106,12 +108,25 @@ async def search_device(
     """Search a network device in the Organization Inventory. This tool provides a consolidated view of all devices within an organization, even those not assigned to any site. This can be used to quickly search for a device across the whole organization. It allows filtering by various attributes such as serial number, model, MAC address, firmware version, device type, and connection status. This tool is useful for quickly finding specific devices or getting an overview of the organization's inventory without needing to query each site separately."""
 
     logger.debug("Tool search_device called")
-    logger.debug("Input Parameters: org_id: %s, site_id: %s, serial: %s, model: %s, mac: %s, version: %s, device_type: %s, status: %s, text: %s, limit: %s", org_id, site_id, serial, model, mac, version, device_type, status, text, limit)
+    logger.debug(
+        "Input Parameters: org_id: %s, site_id: %s, serial: %s, model: %s, mac: %s, version: %s, device_type: %s, status: %s, text: %s, limit: %s",
+        org_id,
+        site_id,
+        serial,
+        model,
+        mac,
+        version,
+        device_type,
+        status,
+        text,
+        limit,
+    )
 
     apisession, response_format = await get_apisession()
 
     try:
-        response = mistapi.api.v1.orgs.inventory.searchOrgInventory(
+        response = await mist_call(
+            mistapi.api.v1.orgs.inventory.searchOrgInventory,
             apisession,
             org_id=str(org_id),
             serial=serial if serial else None,
@@ -137,5 +152,4 @@ async def search_device(
         await handle_network_error(_exc)
 
     return format_response(response, response_format)
-
 '''
@@ -14,7 +14,6 @@ UTILITIES_TEMPLATE = '''
 
 import asyncio
 import inspect
-import json
 import time
 from enum import Enum
 from types import NoneType, UnionType
@@ -32,8 +31,10 @@ from pydantic import Field
 from mistmcp.config import config
 from mistmcp.elicitation_processor import config_elicitation_handler
 from mistmcp.logger import logger
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import handle_network_error, process_response
+from mistmcp.serializer import dumps
 from mistmcp.server import mcp
 
 UTILITY_TOOL_TIMEOUT_SECONDS = 120.0
@@ -436,7 +437,7 @@ def _format_device_utility_result(
     if result["stream_output"] and all(
         isinstance(item, str) for item in result["stream_output"]
     ):
-        result["stream_output_text"] = "\n".join(result["stream_output"])
+        result["stream_output_text"] = "\\n".join(result["stream_output"])
 
     if not completed:
         result["message"] = (
@@ -451,7 +452,7 @@ def _serialize_output(
     output: dict[str, Any], response_format: str
 ) -> dict[str, Any] | str:
     if response_format == "string":
-        return json.dumps(output, indent=2, default=str)
+        return dumps(output)
     return output
 
 
@@ -554,7 +555,7 @@ async def run_utilities(
             f"Running device utility '{canonical_utility}' on {device_type.value}. Some commands stream over WebSocket and may take up to about a minute."
         )
         await ctx.report_progress(5, 100, f"Triggered '{canonical_utility}'")
-        utility_response = await asyncio.to_thread(
+        utility_response = await mist_call(
             utility_callable,
             apisession,
             str(site_id),
@@ -656,5 +657,4 @@ async def utilities(
         parameters,
         timeout_seconds,
     )
-
 '''
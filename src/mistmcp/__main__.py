@@ -18,7 +18,10 @@ from dotenv import load_dotenv
 
 from mistmcp.config import config
 from mistmcp.logger import logger, setup_logging
+from mistmcp.request_executor import request_executor
+from mistmcp.serializer import SERIALIZERS
 from mistmcp.server import create_mcp_server
+from mistmcp.session_pool import session_pool
 
 
 def start(
@@ -41,7 +44,7 @@ def start(
         debug: Enable debug output
         enable_write_tools: Enable write tools. By default, only read tools are enabled for safety. This flag enabled the full set of tools including those that can modify configuration (secured with elicitation). Use with caution!
         disable_elicitation: DANGER ZONE!!! Disable elicitation for write tools. This will allow any AI App to modify configuration objects without confirmation. Use only for testing with non-malicious AI Apps or if you have other safeguards in place. Do NOT use this in production or with untrusted AI Apps!
-        response_format: Response format for HTTP transport ("json" or "string")
+        response_format: Response format for HTTP transport ("json", "string" or "table")
         log_file: Optional path to write logs to a file
     """
     # Update global config
@@ -59,6 +62,8 @@ def start(
     logger.debug("  RESPONSE_FORMAT: %s", config.response_format)
     logger.debug("  ENABLE_WRITE_TOOLS: %s", config.enable_write_tools)
     logger.debug("  DISABLE_ELICITATION: %s", config.disable_elicitation)
+    logger.debug("  MAX_WORKERS: %s", config.max_workers)
+    logger.debug("  HTTP_BACKEND: %s", config.http_backend)
     if transport_mode == "http":
         logger.debug("  MCP_HOST: %s", mcp_host)
         logger.debug("  MCP_PORT: %s", mcp_port)
@@ -81,6 +86,10 @@ def start(
 
             traceback.print_exc()
 
+    finally:
+        session_pool.clear()
+        request_executor.shutdown(wait=False)
+
 
 def load_env_file(env_file: str | None = None) -> None:
     """Load environment variables from .env file if it exists"""
@@ -159,6 +168,141 @@ def load_env_var(
     )
 
 
+def _env_int(value: int | None, env_name: str, default: int) -> int:
+    """Return the CLI value if set, otherwise the integer from env_name, otherwise default"""
+    if value is not None:
+        return value
+    env_value = os.getenv(env_name)
+    if not env_value:
+        return default
+    try:
+        return int(env_value)
+    except ValueError:
+        logger.warning(
+            "Invalid value for %s: %s. Using default %s.", env_name, env_value, default
+        )
+        return default
+
+
+def _env_float(value: float | None, env_name: str, default: float) -> float:
+    """Return the CLI value if set, otherwise the number from env_name, otherwise default"""
+    if value is not None:
+        return value
+    env_value = os.getenv(env_name)
+    if not env_value:
+        return default
+    try:
+        return float(env_value)
+    except ValueError:
+        logger.warning(
+            "Invalid value for %s: %s. Using default %s.", env_name, env_value, default
+        )
+        return default
+
+
+def load_performance_var(args: argparse.Namespace) -> None:
+    """Load the performance tuning options from CLI arguments or environment variables"""
+    config.max_workers = _env_int(
+        getattr(args, "max_workers", None), "MISTMCP_MAX_WORKERS", config.max_workers
+    )
+    config.session_pool_size = _env_int(
+        None, "MISTMCP_SESSION_POOL_SIZE", config.session_pool_size
+    )
+    config.session_idle_ttl = _env_int(
+        None, "MISTMCP_SESSION_IDLE_TTL", config.session_idle_ttl
+    )
+    config.session_connections = _env_int(
+        None, "MISTMCP_SESSION_CONNECTIONS", config.session_connections
+    )
+    http_backend = getattr(args, "http_backend", None) or os.getenv(
+        "MISTMCP_HTTP_BACKEND", config.http_backend
+    )
+    if http_backend not in ("threads", "async"):
+        logger.warning(
+            "Invalid value for MISTMCP_HTTP_BACKEND: %s. Using default threads.",
+            http_backend,
+        )
+        http_backend = "threads"
+    config.http_backend = http_backend
+    config.async_max_connections = _env_int(
+        None, "MISTMCP_ASYNC_MAX_CONNECTIONS", config.async_max_connections
+    )
+    config.rate_limit = _env_int(None, "MISTMCP_RATE_LIMIT", config.rate_limit)
+    config.rate_limit_reserve = _env_int(
+        None, "MISTMCP_RATE_LIMIT_RESERVE", config.rate_limit_reserve
+    )
+    config.rate_limit_max_wait = _env_int(
+        None, "MISTMCP_RATE_LIMIT_MAX_WAIT", config.rate_limit_max_wait
+    )
+    config.retry_max = _env_int(None, "MISTMCP_RETRY_MAX", config.retry_max)
+    config.retry_base_delay = _env_float(
+        None, "MISTMCP_RETRY_BASE_DELAY", config.retry_base_delay
+    )
+    config.retry_max_delay = _env_float(
+        None, "MISTMCP_RETRY_MAX_DELAY", config.retry_max_delay
+    )
+    config.tool_deadline = _env_int(None, "MISTMCP_TOOL_DEADLINE", config.tool_deadline)
+    config.constants_ttl = _env_int(None, "MISTMCP_CONSTANTS_TTL", config.constants_ttl)
+    config.constants_refresh = _env_int(
+        None, "MISTMCP_CONSTANTS_REFRESH", config.constants_refresh
+    )
+    config.config_cache_ttl = _env_int(
+        None, "MISTMCP_CONFIG_CACHE_TTL", config.config_cache_ttl
+    )
+    config.config_cache_max_bytes = _env_int(
+        None, "MISTMCP_CONFIG_CACHE_MAX_BYTES", config.config_cache_max_bytes
+    )
+    config.page_concurrency = _env_int(
+        None, "MISTMCP_PAGE_CONCURRENCY", config.page_concurrency
+    )
+    config.object_index_ttl = _env_int(
+        None, "MISTMCP_OBJECT_INDEX_TTL", config.object_index_ttl
+    )
+    config.object_index_max_entries = _env_int(
+        None, "MISTMCP_OBJECT_INDEX_MAX_ENTRIES", config.object_index_max_entries
+    )
+    config.fan_out_concurrency = _env_int(
+        None, "MISTMCP_FAN_OUT_CONCURRENCY", config.fan_out_concurrency
+    )
+    field_profiles = os.getenv("MISTMCP_FIELD_PROFILES")
+    if field_profiles is not None:
+        config.field_profiles = field_profiles.lower() in ("true", "1", "yes")
+    serializer = os.getenv("MISTMCP_SERIALIZER", config.serializer).lower()
+    if serializer not in SERIALIZERS:
+        logger.warning(
+            "Invalid value for MISTMCP_SERIALIZER: %s. Using default auto.",
+            serializer,
+        )
+        serializer = "auto"
+    config.serializer = serializer
+    config.cursor_ttl = _env_int(None, "MISTMCP_CURSOR_TTL", config.cursor_ttl)
+    config.cursor_max_bytes = _env_int(
+        None, "MISTMCP_CURSOR_MAX_BYTES", config.cursor_max_bytes
+    )
+    prefetch = os.getenv("MISTMCP_PREFETCH")
+    if prefetch is not None:
+        config.prefetch = prefetch.lower() in ("true", "1", "yes")
+    config.prefetch_ttl = _env_int(None, "MISTMCP_PREFETCH_TTL", config.prefetch_ttl)
+    config.prefetch_max_pages = _env_int(
+        None, "MISTMCP_PREFETCH_MAX_PAGES", config.prefetch_max_pages
+    )
+    config.max_records = _env_int(None, "MISTMCP_MAX_RECORDS", config.max_records)
+    config.max_response_bytes = _env_int(
+        None, "MISTMCP_MAX_RESPONSE_BYTES", config.max_response_bytes
+    )
+    config.max_search_shards = _env_int(
+        None, "MISTMCP_MAX_SEARCH_SHARDS", config.max_search_shards
+    )
+    config.aggregate_max_records = _env_int(
+        None, "MISTMCP_AGGREGATE_MAX_RECORDS", config.aggregate_max_records
+    )
+    config.aggregate_max_groups = _env_int(
+        None, "MISTMCP_AGGREGATE_MAX_GROUPS", config.aggregate_max_groups
+    )
+    config.watermark_ttl = _env_int(None, "MISTMCP_WATERMARK_TTL", config.watermark_ttl)
+    config.watermark_file = os.getenv("MISTMCP_WATERMARK_FILE") or config.watermark_file
+
+
 def main() -> None:
     """Main entry point for the CLI"""
     parser = argparse.ArgumentParser(
@@ -203,7 +347,7 @@ def main() -> None:
     parser.add_argument(
         "-r",
         "--response_format",
-        choices=["json", "string"],
+        choices=["json", "string", "table"],
         help="Response format for HTTP transport (default: json)",
     )
     parser.add_argument(
@@ -211,6 +355,17 @@ def main() -> None:
         metavar="PATH",
         help="Also write logs to a file (default: MISTMCP_LOG_FILE env var)",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        metavar="N",
+        help="Max number of concurrent Mist API calls (default: 32, MISTMCP_MAX_WORKERS env var)",
+    )
+    parser.add_argument(
+        "--http-backend",
+        choices=["threads", "async"],
+        help="HTTP backend used for the Mist API read requests (default: threads, MISTMCP_HTTP_BACKEND env var)",
+    )
 
     args = parser.parse_args()
 
@@ -235,6 +390,7 @@ def main() -> None:
         args.response_format,
         args.log_file,
     )
+    load_performance_var(args)
 
     start(
         transport_mode,
@@ -0,0 +1,378 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import threading
+from collections.abc import Iterable, Sequence
+from contextlib import aclosing
+
+import mcp.types
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools.tool import Tool, ToolResult
+
+from mistmcp.auto_paginate_middleware import (
+    MAX_PAGE_SIZE,
+    iter_pages,
+    page_records,
+    report_progress,
+    tool_result,
+)
+from mistmcp.config import config
+from mistmcp.field_projection import projected_fields
+from mistmcp.logger import logger
+from mistmcp.request_processor import get_apisession
+from mistmcp.response_formatter import (
+    format_table,
+    response_format_override,
+    tool_result_data,
+)
+from mistmcp.serializer import dumps
+
+# Search tools accepting an ``aggregate`` parameter
+AGGREGATE_TOOLS = {"mist_search_events", "mist_search_alarms"}
+
+# Column of the time bucket of a group, when ``interval`` is set
+TIME_COLUMN = "time"
+
+# Parameters of the other middlewares which cannot be combined with
+# ``aggregate``
+_EXCLUSIVE_PARAMETERS = ("shards", "site_ids", "org_ids")
+
+
+def _aggregate_schema() -> dict:
+    return {
+        "type": "object",
+        "properties": {
+            "group_by": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": 'Record fields to group by, e.g. ["type"], ["mac", "type"] or ["site_id"]. Nested fields are separated by dots',
+            },
+            "interval": {
+                "type": "integer",
+                "minimum": 1,
+                "description": f"Also group the records by time buckets of `interval` seconds (e.g. 3600 for an hourly count), returned in the `{TIME_COLUMN}` column as the epoch of the bucket start",
+            },
+        },
+        "description": f'Return the number of records per group instead of the records, with the timestamp of the `first` and `last` record of each group. The records of every page of the search are counted by the server (at most {config.aggregate_max_records} records, or `max_records`), and only the table of the groups is returned, most frequent first. Past {config.aggregate_max_groups} groups, only the most frequent ones are kept: their counts may then be up to `max_error` below the exact counts, and the other records are counted in `other`. Use it to answer questions like "how many events per type, per device or per hour"',
+    }
+
+
+def _field(record: dict, path: str):
+    value = record
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    if isinstance(value, (dict, list)):
+        # e.g. a list of tags, grouped by its serialized value
+        return dumps(value)
+    return value
+
+
+def _timestamp(record: dict) -> float | None:
+    try:
+        return float(record["timestamp"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class Aggregator:
+    """Streaming count of records per group.
+
+    The records are added page by page and only the groups are kept: each
+    one holds its number of records and the timestamps of its first and last
+    records. At most ``max_groups`` groups are kept, with the Misra-Gries
+    algorithm: a record of a new group past this limit is counted, with one
+    record of every group, in a single ``other`` group, and the groups left
+    without records are dropped. The records of the new groups are folded
+    into ``other`` by batches of ``max_groups``, so each record is counted
+    in constant (amortized) time. The most frequent groups are kept whatever
+    the order of the records, and their counts are at most ``max_error``
+    below the exact counts. The memory used does not depend on the number
+    of records.
+    """
+
+    def __init__(
+        self,
+        group_by: Sequence[str],
+        interval: int | None = None,
+        max_groups: int | None = None,
+    ) -> None:
+        self.group_by = list(group_by)
+        self.interval = interval
+        self.max_groups = (
+            max_groups if max_groups is not None else config.aggregate_max_groups
+        )
+        self.records = 0
+        # number of times a record of every group was folded into ``other``
+        self.max_error = 0
+        # group key -> [count, first timestamp, last timestamp]
+        self._groups: dict[tuple, list] = {}
+        self._other: list | None = None
+        # records of new groups past max_groups, not folded yet
+        self._misses = 0
+
+    @staticmethod
+    def _update(group: list, timestamp: float | None, count: int = 1) -> None:
+        group[0] += count
+        if timestamp is not None:
+            group[1] = timestamp if group[1] is None else min(group[1], timestamp)
+            group[2] = timestamp if group[2] is None else max(group[2], timestamp)
+
+    def _miss(self, timestamp: float | None) -> None:
+        # Count a record of a new group past max_groups in ``other``
+        if self._other is None:
+            self._other = [0, None, None]
+        self._update(self._other, timestamp)
+        self._misses += 1
+        if self._misses >= self.max_groups:
+            self._fold()
+
+    def _fold(self) -> None:
+        # Count as many records of every group as records missed in ``other``
+        misses, self._misses = self._misses, 0
+        if not misses:
+            return
+        self.max_error += misses
+        for key, group in list(self._groups.items()):
+            folded = min(group[0], misses)
+            self._update(self._other, None, folded)
+            group[0] -= folded
+            if not group[0]:
+                del self._groups[key]
+                for group_timestamp in group[1:]:
+                    self._update(self._other, group_timestamp, 0)
+
+    def _key(self, record: dict, timestamp: float | None) -> tuple:
+        key = tuple(_field(record, path) for path in self.group_by)
+        if self.interval:
+            bucket = (
+                None
+                if timestamp is None
+                else int(timestamp // self.interval * self.interval)
+            )
+            key += (bucket,)
+        return key
+
+    def add(self, records: Iterable) -> None:
+        """Count ``records`` in their groups"""
+        for record in records:
+            if not isinstance(record, dict):
+                continue
+            self.records += 1
+            timestamp = _timestamp(record)
+            key = self._key(record, timestamp)
+            group = self._groups.get(key)
+            if group is None:
+                if len(self._groups) >= self.max_groups:
+                    self._miss(timestamp)
+                    continue
+                group = self._groups[key] = [0, None, None]
+            self._update(group, timestamp)
+
+    def results(self) -> dict:
+        """Return the groups, most frequent first (oldest time bucket first
+        when grouped by time)."""
+        self._fold()
+        columns = [*self.group_by]
+        if self.interval:
+            columns.append(TIME_COLUMN)
+
+        def _order(item: tuple[tuple, list]) -> tuple:
+            key, (count, _, _) = item
+            if self.interval:
+                return (key[-1] is None, key[-1] or 0, -count)
+            return (-count,)
+
+        results = [
+            {
+                **dict(zip(columns, key)),
+                "count": count,
+                "first": first,
+                "last": last,
+            }
+            for key, (count, first, last) in sorted(self._groups.items(), key=_order)
+        ]
+        aggregated: dict = {
+            "results": results,
+            "total": len(results),
+            "records": self.records,
+        }
+        if self._other is not None:
+            count, first, last = self._other
+            aggregated["other"] = {"count": count, "first": first, "last": last}
+            aggregated["max_error"] = self.max_error
+        return aggregated
+
+
+class AggregateMiddleware(Middleware):
+    """Count the records of a search per group, on the server.
+
+    The tools of ``AGGREGATE_TOOLS`` are listed with an additional
+    ``aggregate`` parameter (``{"group_by": [...], "interval": <seconds>}``).
+    When it is used, the first page of the search is retrieved with
+    ``limit=1000`` (when ``limit`` is not set), then its ``next`` pages one
+    after the other (see ``auto_paginate_middleware.iter_pages()``), and the
+    records of each page are counted by an ``Aggregator`` before the next
+    page is retrieved. Only the table of the groups is returned.
+
+    The number of records counted is limited by ``max_records`` if set,
+    otherwise by ``config.aggregate_max_records``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._aggregations = 0
+        self._pages = 0
+        self._records = 0
+        self._groups = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the aggregation counters."""
+        with self._lock:
+            return {
+                "aggregations": self._aggregations,
+                "pages": self._pages,
+                "records": self._records,
+                "groups": self._groups,
+            }
+
+    async def on_list_tools(
+        self,
+        context: MiddlewareContext[mcp.types.ListToolsRequest],
+        call_next,
+    ) -> Sequence[Tool]:
+        tools = await call_next(context)
+        return [self._with_aggregate(tool) for tool in tools]
+
+    @staticmethod
+    def _with_aggregate(tool: Tool) -> Tool:
+        if tool.name not in AGGREGATE_TOOLS:
+            return tool
+        parameters = dict(tool.parameters)
+        properties = dict(parameters.get("properties", {}))
+        properties["aggregate"] = _aggregate_schema()
+        parameters["properties"] = properties
+        return tool.model_copy(update={"parameters": parameters})
+
+    @staticmethod
+    def _aggregator(aggregate) -> Aggregator:
+        group_by = aggregate.get("group_by") if isinstance(aggregate, dict) else None
+        interval = aggregate.get("interval") if isinstance(aggregate, dict) else None
+        if (
+            not isinstance(group_by, list)
+            or not all(isinstance(path, str) and path for path in group_by)
+            or (
+                interval is not None and (not isinstance(interval, int) or interval < 1)
+            )
+            or not (group_by or interval)
+        ):
+            raise ToolError(
+                {
+                    "status_code": 400,
+                    "message": '`aggregate` must be an object with a `group_by` list of fields and an optional `interval` in seconds, e.g. {"group_by": ["type"], "interval": 3600}',
+                }
+            )
+        return Aggregator(group_by, interval)
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mcp.types.CallToolRequestParams],
+        call_next,
+    ) -> ToolResult:
+        message = context.message
+        arguments = message.arguments or {}
+        if message.name not in AGGREGATE_TOOLS or "aggregate" not in arguments:
+            return await call_next(context)
+
+        arguments = dict(arguments)
+        aggregator = self._aggregator(arguments.pop("aggregate"))
+        for name in _EXCLUSIVE_PARAMETERS:
+            if arguments.get(name) is not None:
+                raise ToolError(
+                    {
+                        "status_code": 400,
+                        "message": f"`aggregate` and `{name}` cannot be used together",
+                    }
+                )
+        max_records = arguments.pop("max_records", None) or config.aggregate_max_records
+        max_records = min(max_records, config.aggregate_max_records)
+        if arguments.get("limit") is None:
+            arguments["limit"] = MAX_PAGE_SIZE
+        context = context.copy(
+            message=message.model_copy(update={"arguments": arguments})
+        )
+
+        apisession, response_format = await get_apisession()
+        # the groups are computed on the full records
+        with projected_fields(message.name, ["*"]):
+            with response_format_override("json"):
+                data = tool_result_data(await call_next(context))
+            aggregator.add(page_records(data))
+            total = data.get("total") if isinstance(data, dict) else None
+            next_url = data.get("next") if isinstance(data, dict) else None
+            pages = 1
+            errors: list[str] = []
+            await report_progress(context, aggregator.records, max_records, total)
+            if aggregator.records < max_records:
+                async with aclosing(
+                    iter_pages(apisession, next_url, errors)
+                ) as iterator:
+                    async for records, next_url in iterator:
+                        aggregator.add(records)
+                        pages += 1
+                        await report_progress(
+                            context, aggregator.records, max_records, total
+                        )
+                        if aggregator.records >= max_records:
+                            break
+
+        aggregated = aggregator.results()
+        with self._lock:
+            self._aggregations += 1
+            self._pages += pages
+            self._records += aggregator.records
+            self._groups += aggregated["total"]
+        logger.debug(
+            "AggregateMiddleware: %s counted %d records in %d groups (%d pages)",
+            message.name,
+            aggregator.records,
+            aggregated["total"],
+            pages,
+        )
+
+        aggregated["has_more"] = bool(next_url)
+        messages = []
+        if "other" in aggregated:
+            messages.append(
+                f"Only the {aggregated['total']} most frequent groups were kept, their counts may be up to {aggregated['max_error']} below the exact counts, and the other records are counted in `other`. Group by fewer fields, or use a larger `interval`, to count every group."
+            )
+        if errors:
+            aggregated["error"] = errors[0]
+            messages.append(
+                f"The pagination stopped on an error, only the {aggregator.records} records retrieved before it were counted: {errors[0]}."
+            )
+        elif next_url:
+            messages.append(
+                f"Only the {aggregator.records} most recent records of the search were counted. Narrow the time range, or increase `max_records`, to count the others."
+            )
+        if messages:
+            aggregated["message"] = " ".join(messages)
+        output = format_table(aggregated)
+        if response_format == "string":
+            output = dumps(output)
+        return tool_result(output)
+
+
+# Shared instance, registered in the server middleware and read by /metrics
+aggregate_middleware = AggregateMiddleware()
@@ -0,0 +1,197 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import mistapi
+from mistapi.__api_response import APIResponse
+
+from mistmcp.config import config
+from mistmcp.logger import logger
+from mistmcp.response_processor import response_error
+
+# Name prefixes of the ``mistapi.api`` wrappers sending a single GET request,
+# whatever their case (e.g. ``GetOrgLicenseAsyncClaimStatus``). The other
+# wrappers (create, update, delete, upload, ...) are never recorded
+GET_WRAPPER_PREFIXES = ("get", "list", "search", "count")
+
+
+class _RecordedRequest(Exception):
+    """Raised by the request recorder to capture the request a wrapper builds."""
+
+    def __init__(self, method: str, uri: str, query: dict | None = None) -> None:
+        super().__init__(method, uri)
+        self.method = method
+        self.uri = uri
+        self.query = query
+
+
+class _RequestRecorder:
+    """Stand-in for ``mistapi.APISession`` used to capture a wrapper request.
+
+    The ``mistapi.api.v1`` functions only build the URI and query parameters
+    before calling the session HTTP method, so calling them with this object
+    gives the request details without sending anything.
+    """
+
+    def mist_get(self, uri: str, query: dict | None = None) -> None:
+        raise _RecordedRequest("GET", uri, query)
+
+    def mist_post(self, uri: str, body: Any = None) -> None:
+        raise _RecordedRequest("POST", uri)
+
+    def mist_put(self, uri: str, body: Any = None) -> None:
+        raise _RecordedRequest("PUT", uri)
+
+    def mist_delete(self, uri: str, query: dict | None = None) -> None:
+        raise _RecordedRequest("DELETE", uri, query)
+
+    def mist_post_file(self, uri: str, *args: Any, **kwargs: Any) -> None:
+        raise _RecordedRequest("POST", uri)
+
+
+class AsyncTransport:
+    """Native asyncio HTTP backend for the Mist API read (GET) requests.
+
+    Enabled with ``--http-backend async``. GET requests are sent with a shared
+    ``httpx.AsyncClient`` instead of a worker thread per request, so the number
+    of in-flight upstream requests is only bounded by
+    ``config.async_max_connections``. The request URL and authentication
+    headers are taken from the ``mistapi.APISession`` so the behaviour is the
+    same as the threaded backend, and the responses are wrapped in regular
+    ``mistapi`` ``APIResponse`` objects.
+
+    Write requests, and any call that is not a plain GET, keep using the
+    request executor.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._in_flight = 0
+        self._completed = 0
+        self._errors = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the transport counters."""
+        return {
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "errors": self._errors,
+        }
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # httpx connections are bound to the event loop that opened them
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            limits = httpx.Limits(
+                max_connections=config.async_max_connections,
+                max_keepalive_connections=config.async_max_connections,
+            )
+            self._client = httpx.AsyncClient(limits=limits, timeout=60.0)
+            self._loop = loop
+        return self._client
+
+    @staticmethod
+    def record(
+        func: Callable[..., Any], args: tuple, kwargs: dict
+    ) -> tuple[mistapi.APISession, str, dict | None] | None:
+        """Return ``(apisession, uri, query)`` if the call is a single GET request.
+
+        Handles the ``mistapi.api.v1`` read wrappers (see
+        ``GET_WRAPPER_PREFIXES``) and ``APISession.mist_get``. Returns ``None``
+        for any other call.
+        """
+        bound_session = getattr(func, "__self__", None)
+        if isinstance(bound_session, mistapi.APISession):
+            if getattr(func, "__name__", "") != "mist_get":
+                return None
+            uri = args[0] if args else kwargs.get("uri")
+            query = args[1] if len(args) > 1 else kwargs.get("query")
+            return bound_session, uri, query
+
+        module = getattr(func, "__module__", "") or ""
+        if not module.startswith("mistapi.api.") or not args:
+            return None
+        if not getattr(func, "__name__", "").lower().startswith(GET_WRAPPER_PREFIXES):
+            return None
+        apisession = args[0]
+        if not isinstance(apisession, mistapi.APISession):
+            return None
+        try:
+            func(_RequestRecorder(), *args[1:], **kwargs)
+        except _RecordedRequest as request:
+            if request.method == "GET":
+                return apisession, request.uri, request.query
+        return None
+
+    async def get(
+        self, apisession: mistapi.APISession, uri: str, query: dict | None = None
+    ) -> APIResponse:
+        """Send a GET request for ``uri`` with the ``apisession`` credentials."""
+        url = apisession._url(uri) + apisession._gen_query(query)
+        headers = dict(apisession._session.headers)
+        client = self._get_client()
+        logger.debug("Async transport: GET %s", url)
+        self._in_flight += 1
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.HTTPError:
+            self._errors += 1
+            raise
+        finally:
+            self._in_flight -= 1
+        self._completed += 1
+        # httpx.Response exposes the same attributes as requests.Response
+        return APIResponse(response=response, url=url)  # type: ignore[arg-type]
+
+    async def get_all(
+        self, apisession: mistapi.APISession, response: APIResponse
+    ) -> list:
+        """Async version of ``mistapi.get_all``, following the ``next`` links.
+
+        Raises the ToolError of the failed response (see
+        ``response_processor.response_error()``) if a page cannot be
+        retrieved.
+        """
+        data: list = []
+        if isinstance(response.data, list):
+            data = list(response.data)
+            while response.next:
+                response = await self._get_page(apisession, response.next)
+                data += response.data
+        elif isinstance(response.data, dict) and "results" in response.data:
+            data = response.data["results"].copy()
+            while response.next:
+                response = await self._get_page(apisession, response.next)
+                data += response.data["results"]
+        return data
+
+    async def _get_page(self, apisession: mistapi.APISession, uri: str) -> APIResponse:
+        response = await self.get(apisession, uri)
+        if response.status_code != 200:
+            raise response_error(response)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+
+# Process-wide transport shared by every tool
+async_transport = AsyncTransport()
@@ -0,0 +1,302 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import threading
+from collections.abc import AsyncIterator, Sequence
+from contextlib import aclosing
+
+import mcp.types
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools.tool import Tool, ToolResult
+
+from mistmcp.config import config
+from mistmcp.cursor_store import cursor_store
+from mistmcp.logger import logger
+from mistmcp.rate_limiter import low_priority, session_key
+from mistmcp.request_executor import MIST_CALL_ERRORS, mist_call
+from mistmcp.request_processor import get_apisession
+from mistmcp.response_formatter import (
+    format_response,
+    format_response_data,
+    response_format_override,
+    tool_result_data,
+)
+from mistmcp.response_processor import process_response
+from mistmcp.retry_policy import tool_deadline
+from mistmcp.serializer import dumps
+
+# Search tools accepting a ``max_records`` parameter
+AUTO_PAGINATE_TOOLS = {
+    "mist_search_events",
+    "mist_search_alarms",
+    "mist_search_client",
+    "mist_search_audit_logs",
+}
+
+# Max page size of the Mist API search endpoints
+MAX_PAGE_SIZE = 1000
+
+
+def _max_records_schema() -> dict:
+    return {
+        "type": "integer",
+        "minimum": 1,
+        "maximum": config.max_records,
+        "description": f"Retrieve every page of the results until at least `max_records` records are retrieved (max {config.max_records}), instead of returning only the first page. Use it when every result of the time range is needed, instead of calling `mist_get_next_page` many times. The pages are retrieved with `limit=1000` when `limit` is not set",
+    }
+
+
+def page_records(data) -> list:
+    """Return the records of a tool or API response page"""
+    if isinstance(data, dict):
+        data = data.get("results")
+    return data if isinstance(data, list) else []
+
+
+def error_message(exc: Exception) -> str:
+    """Return the message of the error stopping a pagination"""
+    error = exc.args[0] if exc.args else None
+    if isinstance(error, dict) and error.get("message"):
+        return str(error["message"])
+    return str(exc) or type(exc).__name__
+
+
+async def iter_pages(
+    apisession, next_url: str | None, errors: list[str] | None = None
+) -> AsyncIterator[tuple[list, str | None]]:
+    """Retrieve the ``next_url`` pages one after the other, yielding the
+    records and the ``next`` URL of each page.
+
+    Only one page is held in memory at a time. A failed call stops the
+    iteration: the ``next`` URL last yielded is the one that failed, and the
+    message of the error is appended to ``errors``.
+    """
+    while next_url:
+        try:
+            with low_priority(), tool_deadline(config.tool_deadline):
+                response = await mist_call(apisession.mist_get, next_url)
+            await process_response(response)
+        except MIST_CALL_ERRORS as exc:
+            # e.g. API call budget exhausted, return what was retrieved
+            logger.warning("Pagination of %s stopped: %s", next_url, exc)
+            if errors is not None:
+                errors.append(error_message(exc))
+            return
+        page = format_response_data(response)
+        next_url = page.get("next") if isinstance(page, dict) else None
+        yield page_records(page), next_url
+
+
+async def follow_pages(
+    apisession,
+    records: list,
+    next_url: str | None,
+    max_records: int,
+    on_page=None,
+) -> tuple[str | None, int, str | None]:
+    """Retrieve the ``next_url`` pages until ``max_records`` records are
+    retrieved, adding their records to ``records``.
+
+    ``on_page`` is awaited after each page. Returns the ``next`` URL of the
+    last page retrieved, the number of pages retrieved and the message of
+    the error stopping the pagination, if any. A failed call stops the
+    pagination, the records already retrieved are kept.
+    """
+    pages = 0
+    errors: list[str] = []
+    if len(records) >= max_records:
+        return next_url, pages, None
+    async with aclosing(iter_pages(apisession, next_url, errors)) as iterator:
+        async for page, url in iterator:
+            records += page
+            next_url = url
+            pages += 1
+            if on_page is not None:
+                await on_page()
+            if len(records) >= max_records:
+                break
+    return next_url, pages, errors[0] if errors else None
+
+
+def combine_records(
+    apisession, records: list, total, next_url: str | None, error: str | None = None
+) -> dict:
+    """Return the response combining ``records``, within the response size
+    budget (``config.max_response_bytes``).
+
+    The records over the budget are kept in the cursor store, and the
+    response ``next`` is the cursor returning them. When they cannot be
+    stored (e.g. the cursor store is disabled), they are dropped from the
+    response. ``error`` is the message of the error which stopped the
+    pagination of the records, if any.
+    """
+    combined: dict = {"results": records}
+    if total is not None:
+        combined["total"] = total
+    messages = []
+    if error is not None:
+        combined["error"] = error
+        messages.append(
+            f"The pagination stopped on an error after {len(records)} records: {error}."
+        )
+    size = 0
+    for count, record in enumerate(records):
+        size += len(dumps(record)) + 1
+        if size > config.max_response_bytes:
+            count = max(1, count)
+            cursor = cursor_store.put(session_key(apisession), records, count, next_url)
+            combined["results"] = records[:count]
+            if cursor is not None:
+                next_url = cursor
+            else:
+                messages.append(
+                    f"Only the first {count} of the {len(records)} records retrieved fit in the response, the others were dropped. Narrow the search, or decrease `max_records`, to retrieve them."
+                )
+            break
+    if next_url:
+        combined["next"] = next_url
+    combined["has_more"] = bool(next_url) or len(combined["results"]) < len(records)
+    if messages:
+        combined["message"] = " ".join(messages)
+    return combined
+
+
+def tool_result(output) -> ToolResult:
+    """Return the result of a tool returning ``output``"""
+    return ToolResult(
+        content=output if isinstance(output, str) else dumps(output),
+        structured_content={"result": output},
+    )
+
+
+async def report_progress(
+    context: MiddlewareContext, retrieved: int, max_records: int, total=None
+) -> None:
+    """Report the number of records retrieved to the client"""
+    if context.fastmcp_context is None:
+        return
+    target = min(max_records, total) if isinstance(total, int) else max_records
+    await context.fastmcp_context.report_progress(
+        retrieved, target, f"Retrieved {retrieved} records"
+    )
+
+
+class AutoPaginateMiddleware(Middleware):
+    """Retrieve every page of a search with a single tool call.
+
+    The tools of ``AUTO_PAGINATE_TOOLS`` are listed with an additional
+    ``max_records`` parameter. When it is used, the tool returns its first
+    page as usual, then the ``next`` pages are retrieved here until
+    ``max_records`` records are retrieved (or the search is complete),
+    reporting the progress to the client after each page.
+
+    The records are returned in a single response. When they are larger
+    than ``config.max_response_bytes``, the response only holds the first
+    records and the others are kept in the cursor store: the response
+    ``next`` is a cursor returning them with ``mist_get_next_page``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._pages = 0
+        self._records = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the auto-pagination counters."""
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "pages": self._pages,
+                "records": self._records,
+            }
+
+    async def on_list_tools(
+        self,
+        context: MiddlewareContext[mcp.types.ListToolsRequest],
+        call_next,
+    ) -> Sequence[Tool]:
+        tools = await call_next(context)
+        return [self._with_max_records(tool) for tool in tools]
+
+    @staticmethod
+    def _with_max_records(tool: Tool) -> Tool:
+        if tool.name not in AUTO_PAGINATE_TOOLS:
+            return tool
+        parameters = dict(tool.parameters)
+        properties = dict(parameters.get("properties", {}))
+        properties["max_records"] = _max_records_schema()
+        parameters["properties"] = properties
+        return tool.model_copy(update={"parameters": parameters})
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mcp.types.CallToolRequestParams],
+        call_next,
+    ) -> ToolResult:
+        message = context.message
+        arguments = message.arguments or {}
+        if message.name not in AUTO_PAGINATE_TOOLS or "max_records" not in arguments:
+            return await call_next(context)
+
+        arguments = dict(arguments)
+        max_records = arguments.pop("max_records")
+        if not isinstance(max_records, int) or max_records < 1:
+            raise ToolError(
+                {
+                    "status_code": 400,
+                    "message": "`max_records` must be a positive integer",
+                }
+            )
+        max_records = min(max_records, config.max_records)
+        if arguments.get("limit") is None:
+            arguments["limit"] = min(MAX_PAGE_SIZE, max_records)
+        context = context.copy(
+            message=message.model_copy(update={"arguments": arguments})
+        )
+
+        apisession, response_format = await get_apisession()
+        with response_format_override("json"):
+            data = tool_result_data(await call_next(context))
+        records = list(page_records(data))
+        total = data.get("total") if isinstance(data, dict) else None
+
+        async def _on_page() -> None:
+            await report_progress(context, len(records), max_records, total)
+
+        await _on_page()
+        next_url, pages, error = await follow_pages(
+            apisession,
+            records,
+            data.get("next") if isinstance(data, dict) else None,
+            max_records,
+            _on_page,
+        )
+
+        with self._lock:
+            self._calls += 1
+            self._pages += pages + 1
+            self._records += len(records)
+        logger.debug(
+            "AutoPaginateMiddleware: %s retrieved %d records in %d pages",
+            message.name,
+            len(records),
+            pages + 1,
+        )
+
+        combined = combine_records(apisession, records, total, next_url, error)
+        return tool_result(format_response(combined, response_format))
+
+
+# Shared instance, registered in the server middleware and read by /metrics
+auto_paginate_middleware = AutoPaginateMiddleware()
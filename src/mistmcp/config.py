@@ -22,6 +22,41 @@ class ServerConfig:
         disable_elicitation: bool = False,
         response_format: str = "json",
         log_file: str | None = None,
+        max_workers: int = 32,
+        session_pool_size: int = 64,
+        session_idle_ttl: int = 900,
+        session_connections: int = 0,
+        http_backend: str = "threads",
+        async_max_connections: int = 100,
+        rate_limit: int = 5000,
+        rate_limit_reserve: int = 500,
+        rate_limit_max_wait: int = 30,
+        retry_max: int = 3,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+        tool_deadline: int = 120,
+        constants_ttl: int = 86400,
+        constants_refresh: int = 3600,
+        config_cache_ttl: int = 60,
+        config_cache_max_bytes: int = 32 * 1024 * 1024,
+        page_concurrency: int = 8,
+        object_index_ttl: int = 300,
+        object_index_max_entries: int = 256,
+        fan_out_concurrency: int = 8,
+        field_profiles: bool = True,
+        serializer: str = "auto",
+        cursor_ttl: int = 600,
+        cursor_max_bytes: int = 32 * 1024 * 1024,
+        prefetch: bool = False,
+        prefetch_ttl: int = 30,
+        prefetch_max_pages: int = 2,
+        max_records: int = 10000,
+        max_response_bytes: int = 1024 * 1024,
+        max_search_shards: int = 16,
+        aggregate_max_records: int = 100000,
+        aggregate_max_groups: int = 1000,
+        watermark_ttl: int = 86400,
+        watermark_file: str | None = None,
     ) -> None:
         self.transport_mode: str = transport_mode
         self.mist_apitoken: str = ""
@@ -31,6 +66,73 @@ class ServerConfig:
         self.disable_elicitation = disable_elicitation
         self.response_format = response_format
         self.log_file: str | None = log_file
+        # Upper bound of worker threads used to run blocking Mist API calls
+        self.max_workers: int = max_workers
+        # API sessions kept for reuse, idle timeout in seconds, and size of the
+        # per-host HTTP connection pool (0 = same as max_workers)
+        self.session_pool_size: int = session_pool_size
+        self.session_idle_ttl: int = session_idle_ttl
+        self.session_connections: int = session_connections
+        # "threads" runs every Mist API call in the request executor, "async"
+        # sends the GET requests with a shared httpx.AsyncClient instead
+        self.http_backend: str = http_backend
+        self.async_max_connections: int = async_max_connections
+        # Mist API calls allowed per hour and per API token (0 = no limit),
+        # calls kept for the normal priority calls, and max seconds a call
+        # waits for the budget to refill before being rejected
+        self.rate_limit: int = rate_limit
+        self.rate_limit_reserve: int = rate_limit_reserve
+        self.rate_limit_max_wait: int = rate_limit_max_wait
+        # Retries of the transient Mist API failures (backoff in seconds), and
+        # time budget in seconds of a tool call for these retries (0 = none)
+        self.retry_max: int = retry_max
+        self.retry_base_delay: float = retry_base_delay
+        self.retry_max_delay: float = retry_max_delay
+        self.tool_deadline: int = tool_deadline
+        # Max age in seconds of the cached Mist constants, and age after which
+        # they are refreshed in the background
+        self.constants_ttl: int = constants_ttl
+        self.constants_refresh: int = constants_refresh
+        # Seconds the configuration objects are cached (0 = no cache), and max
+        # size in bytes of the cached configuration objects
+        self.config_cache_ttl: int = config_cache_ttl
+        self.config_cache_max_bytes: int = config_cache_max_bytes
+        # Max number of pages of a list retrieved at the same time
+        self.page_concurrency: int = page_concurrency
+        # Seconds the configuration object indexes are kept (0 = no index), and
+        # max number of indexed lists of configuration objects
+        self.object_index_ttl: int = object_index_ttl
+        self.object_index_max_entries: int = object_index_max_entries
+        # Max number of sites or orgs queried at the same time by a fan-out call
+        self.fan_out_concurrency: int = fan_out_concurrency
+        # Whether the default fields projection of the tools is applied
+        self.field_profiles: bool = field_profiles
+        # JSON serializer of the responses: auto (orjson if installed), orjson or json
+        self.serializer: str = serializer
+        # Seconds the result sets paginated by the server are kept (0 = never),
+        # and max size in bytes of the kept result sets
+        self.cursor_ttl: int = cursor_ttl
+        self.cursor_max_bytes: int = cursor_max_bytes
+        # Whether the next page of the paginated responses is fetched in the
+        # background, seconds a prefetched page is kept, and max number of
+        # prefetched pages kept per API token
+        self.prefetch: bool = prefetch
+        self.prefetch_ttl: int = prefetch_ttl
+        self.prefetch_max_pages: int = prefetch_max_pages
+        # Max value of the ``max_records`` parameter of the search tools, and
+        # max size in bytes of the records returned in one response
+        self.max_records: int = max_records
+        self.max_response_bytes: int = max_response_bytes
+        # Max number of time windows searched in parallel by a sharded search
+        self.max_search_shards: int = max_search_shards
+        # Max number of records counted by an ``aggregate`` search, and max
+        # number of groups returned
+        self.aggregate_max_records: int = aggregate_max_records
+        self.aggregate_max_groups: int = aggregate_max_groups
+        # Seconds a ``since=last`` watermark is kept since its last update,
+        # and optional JSON file where the watermarks are saved
+        self.watermark_ttl: int = watermark_ttl
+        self.watermark_file: str | None = watermark_file
 
 
 # Global config instance
@@ -0,0 +1,186 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+import mistapi
+from mistapi.__api_response import APIResponse
+
+from mistmcp.config import config
+from mistmcp.logger import logger
+from mistmcp.rate_limiter import session_key
+from mistmcp.serializer import dumps
+from mistmcp.single_flight import copy_result
+
+# Read object types affected by a write on a change_configuration_objects
+# object type, when they are not the same
+_INVALIDATED_TYPES = {
+    "org_info": ("org",),
+    "org_settings": ("org",),
+    "site_settings": ("org_sites",),
+}
+
+
+class ConfigObjectCache:
+    """TTL/LRU cache of the ``mist_get_configuration_objects`` responses.
+
+    The agents read the same configuration objects many times while working
+    on a change. The responses are cached for ``config.config_cache_ttl``
+    seconds, keyed by API token, org, site, object type, object ID or name,
+    computed flag and limit. The least recently used entries are dropped
+    when the cached data is larger than ``config.config_cache_max_bytes``.
+
+    Every write done with ``mist_change_configuration_objects`` invalidates
+    the entries it may have changed (see ``invalidate()``), for every API
+    token, so a read following a write never returns the old object.
+    """
+
+    def __init__(self, ttl: float | None = None, max_bytes: int | None = None) -> None:
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[APIResponse, float, int]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl if self._ttl is not None else config.config_cache_ttl
+
+    @property
+    def max_bytes(self) -> int:
+        return (
+            self._max_bytes
+            if self._max_bytes is not None
+            else config.config_cache_max_bytes
+        )
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "bytes": self._size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+            }
+
+    @staticmethod
+    def key(
+        apisession: mistapi.APISession,
+        object_type: str,
+        org_id: str | None = None,
+        site_id: str | None = None,
+        object_id: str | None = None,
+        name: str | None = None,
+        computed: bool | None = None,
+        limit: int | None = None,
+    ) -> tuple:
+        """Return the cache key of a configuration object request."""
+        return (
+            session_key(apisession),
+            org_id,
+            site_id,
+            object_type,
+            object_id,
+            name.lower() if name else None,
+            bool(computed),
+            limit,
+        )
+
+    def _drop(self, key: tuple) -> None:
+        # Must be called with the lock held
+        _, _, size = self._entries.pop(key)
+        self._size -= size
+
+    def get(self, key: tuple) -> APIResponse | None:
+        """Return a copy of the cached response, or None."""
+        if self.ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[1] >= self.ttl:
+                if entry is not None:
+                    self._drop(key)
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return copy_result(entry[0])
+
+    def put(self, key: tuple, response: APIResponse) -> None:
+        """Cache a copy of a successful response."""
+        if self.ttl <= 0 or response.status_code != 200:
+            return
+        size = len(dumps(response.data))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (copy_result(response), time.monotonic(), size)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(
+        self,
+        object_type: str,
+        org_id: str | None = None,
+        site_id: str | None = None,
+        object_id: str | None = None,
+    ) -> None:
+        """Drop the entries a write on ``object_type`` may have changed.
+
+        In the org (``org_id``) or site (``site_id``) of the write, this drops
+        the entries of the same object type that are not about another
+        object ID, and every computed entry since they include the inherited
+        objects.
+        """
+        types = _INVALIDATED_TYPES.get(object_type, (object_type,))
+        with self._lock:
+            for key in list(self._entries):
+                _, k_org, k_site, k_type, k_id, _, k_computed, _ = key
+                if not (org_id and k_org == org_id) and not (
+                    site_id and k_site == site_id
+                ):
+                    continue
+                if k_computed or (
+                    k_type in types
+                    and (object_id is None or k_id is None or k_id == object_id)
+                ):
+                    self._drop(key)
+                    self._invalidations += 1
+        logger.debug(
+            "Config cache: invalidated %s (org %s, site %s, object %s)",
+            object_type,
+            org_id,
+            site_id,
+            object_id,
+        )
+
+    def clear(self) -> None:
+        """Forget every cached response."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+# Process-wide cache shared by every tool
+config_cache = ConfigObjectCache()
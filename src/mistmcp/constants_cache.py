@@ -0,0 +1,148 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from mistapi.__api_response import APIResponse
+
+from mistmcp.config import config
+from mistmcp.logger import logger
+from mistmcp.retry_policy import RETRY_EXCEPTIONS
+from mistmcp.single_flight import copy_result
+
+
+def is_constants_call(func: Callable[..., Any]) -> bool:
+    """Return True if ``func`` is one of the ``mistapi`` constants endpoints."""
+    module = getattr(func, "__module__", "") or ""
+    return module.startswith("mistapi.api.v1.const.")
+
+
+class ConstantsCache:
+    """Process-wide cache of the Mist constants (``/api/v1/const/*``).
+
+    The constants (device models, event and alarm definitions, insight
+    metrics, ...) are the same for every API token of a Mist Cloud and
+    rarely change, but the LLM retrieves them before almost every search.
+    The responses are cached per cloud host and URL:
+
+    - entries older than ``config.constants_refresh`` seconds are still
+      served, and refreshed in the background
+    - entries older than ``config.constants_ttl`` seconds are retrieved
+      again before being served
+    - when the Mist Cloud cannot be reached, the expired entry is served
+      instead, if any
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        refresh: float | None = None,
+    ) -> None:
+        self._ttl = ttl
+        self._refresh = refresh
+        self._entries: dict[tuple[str, str], tuple[APIResponse, float]] = {}
+        self._refreshing: dict[tuple[str, str], asyncio.Task] = {}
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._fallbacks = 0
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl if self._ttl is not None else config.constants_ttl
+
+    @property
+    def refresh(self) -> float:
+        return self._refresh if self._refresh is not None else config.constants_refresh
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the cache counters."""
+        return {
+            "size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "refreshes": self._refreshes,
+            "fallbacks": self._fallbacks,
+        }
+
+    async def _fetch(
+        self, key: tuple[str, str], fetch: Callable[[], Awaitable[APIResponse]]
+    ) -> APIResponse:
+        response = await fetch()
+        if isinstance(response, APIResponse) and response.status_code == 200:
+            self._entries[key] = (copy_result(response), time.monotonic())
+        return response
+
+    async def _refresh_entry(
+        self, key: tuple[str, str], fetch: Callable[[], Awaitable[APIResponse]]
+    ) -> None:
+        try:
+            await self._fetch(key, fetch)
+        except RETRY_EXCEPTIONS as exc:
+            logger.debug("Constants cache: unable to refresh %s: %s", key[1], exc)
+
+    async def get(
+        self,
+        cloud: str,
+        uri: str,
+        url: str,
+        fetch: Callable[[], Awaitable[APIResponse]],
+    ) -> APIResponse:
+        """Return the cached response for ``url``, calling ``fetch()`` when needed."""
+        key = (cloud, url)
+        entry = self._entries.get(key)
+        if entry is not None:
+            cached, fetched_at = entry
+            age = time.monotonic() - fetched_at
+            if age < self.ttl:
+                self._hits += 1
+                if age >= self.refresh and key not in self._refreshing:
+                    self._refreshes += 1
+                    task = asyncio.ensure_future(self._refresh_entry(key, fetch))
+                    self._refreshing[key] = task
+                    task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+                return copy_result(cached)
+
+        self._misses += 1
+        try:
+            response = await self._fetch(key, fetch)
+        except RETRY_EXCEPTIONS:
+            fallback = self._fallback(entry, uri)
+            if fallback is None:
+                raise
+            return fallback
+        if response.status_code is None or response.status_code >= 500:
+            fallback = self._fallback(entry, uri)
+            if fallback is not None:
+                return fallback
+        return response
+
+    def _fallback(
+        self, entry: tuple[APIResponse, float] | None, uri: str
+    ) -> APIResponse | None:
+        """Return the expired entry, if any"""
+        if entry is None:
+            return None
+        self._fallbacks += 1
+        logger.warning("Constants cache: Mist Cloud unreachable, serving %s", uri)
+        return copy_result(entry[0])
+
+    def clear(self) -> None:
+        """Forget every cached constant."""
+        self._entries.clear()
+
+
+# Process-wide cache shared by every tool and API token
+constants_cache = ConstantsCache()
@@ -0,0 +1,171 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import copy
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
+
+from mistmcp.config import config
+from mistmcp.logger import logger
+from mistmcp.serializer import dumps
+
+# Scheme of the ``next`` URLs served from the cursor store
+CURSOR_SCHEME = "mistmcp-cursor"
+
+
+def is_cursor(url: str) -> bool:
+    """Return True if ``url`` is a cursor of the cursor store."""
+    return url.startswith(f"{CURSOR_SCHEME}://")
+
+
+class _ResultSet:
+    def __init__(
+        self, session: str, records: list, size: int, next_url: str | None
+    ) -> None:
+        self.session = session
+        self.records = records
+        self.size = size
+        self.next_url = next_url
+        self.created = time.monotonic()
+
+
+class CursorStore:
+    """TTL/LRU store of the result sets paginated by the server.
+
+    When a tool has the whole result set in memory (e.g. a name search on
+    the full list of objects) but only returns its first page, the result
+    set is kept here and the response ``next`` is an opaque cursor
+    (``mistmcp-cursor://<handle>?offset=<n>&limit=<n>``). The next pages
+    are then returned by ``mist_get_next_page`` without calling the Mist
+    API.
+
+    The result sets are kept for ``config.cursor_ttl`` seconds, and only
+    for the API token that retrieved them. The least recently used ones are
+    dropped when the stored data is larger than ``config.cursor_max_bytes``.
+    """
+
+    def __init__(self, ttl: float | None = None, max_bytes: int | None = None) -> None:
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._result_sets: OrderedDict[str, _ResultSet] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl if self._ttl is not None else config.cursor_ttl
+
+    @property
+    def max_bytes(self) -> int:
+        return (
+            self._max_bytes if self._max_bytes is not None else config.cursor_max_bytes
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_bytes > 0
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the cursor store counters."""
+        with self._lock:
+            return {
+                "size": len(self._result_sets),
+                "bytes": self._size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def _drop(self, handle: str) -> None:
+        # Must be called with the lock held
+        self._size -= self._result_sets.pop(handle).size
+
+    def put(
+        self, session: str, records: list, limit: int, next_url: str | None = None
+    ) -> str | None:
+        """Store ``records`` and return the cursor of their second page.
+
+        ``session`` is the key of the API session (see
+        ``rate_limiter.session_key()``). ``next_url`` is the ``next`` of the
+        last page, when the records are followed by more results from the
+        Mist API. Returns None if the store is disabled, or the records fit
+        in one page or are too large to store.
+        """
+        if not self.enabled or limit <= 0 or len(records) <= limit:
+            return None
+        size = len(dumps(records))
+        if size > self.max_bytes:
+            return None
+        handle = secrets.token_urlsafe(16)
+        with self._lock:
+            self._result_sets[handle] = _ResultSet(session, records, size, next_url)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._drop(next(iter(self._result_sets)))
+                self._evictions += 1
+        logger.debug("Cursor store: stored %d records (%d bytes)", len(records), size)
+        return self._cursor(handle, limit, limit)
+
+    @staticmethod
+    def _cursor(handle: str, offset: int, limit: int) -> str:
+        return f"{CURSOR_SCHEME}://{handle}?offset={offset}&limit={limit}"
+
+    def page(self, session: str, cursor: str) -> dict | None:
+        """Return the page of ``cursor``, or None if it is unknown or expired."""
+        parsed = urlsplit(cursor)
+        query = parse_qs(parsed.query)
+        try:
+            offset = max(0, int(query["offset"][0]))
+            limit = max(1, int(query["limit"][0]))
+        except (KeyError, ValueError):
+            return None
+        with self._lock:
+            result_set = self._result_sets.get(parsed.netloc)
+            if result_set is not None and (
+                time.monotonic() - result_set.created >= self.ttl
+            ):
+                self._drop(parsed.netloc)
+                result_set = None
+            if result_set is None or result_set.session != session:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._result_sets.move_to_end(parsed.netloc)
+            records = result_set.records[offset : offset + limit]
+            total = len(result_set.records)
+            next_url = result_set.next_url
+        data = {"results": copy.deepcopy(records), "total": total}
+        if offset + limit < total:
+            data["next"] = self._cursor(parsed.netloc, offset + limit, limit)
+            data["has_more"] = True
+        elif next_url:
+            data["next"] = next_url
+            data["has_more"] = True
+        else:
+            data["has_more"] = False
+        return data
+
+    def clear(self) -> None:
+        """Forget every result set."""
+        with self._lock:
+            self._result_sets.clear()
+            self._size = 0
+
+
+# Process-wide store shared by every tool
+cursor_store = CursorStore()
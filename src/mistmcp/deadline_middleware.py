@@ -0,0 +1,35 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import mcp.types
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+
+from mistmcp.config import config
+from mistmcp.retry_policy import tool_deadline
+
+
+class DeadlineMiddleware(Middleware):
+    """Set the time budget of each tool call.
+
+    The Mist API calls made by the tool are retried on transient failures
+    only while the tool call is within ``config.tool_deadline`` seconds, so
+    a single tool call cannot keep retrying for minutes.
+    """
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mcp.types.CallToolRequestParams],
+        call_next,
+    ) -> ToolResult:
+        with tool_deadline(config.tool_deadline):
+            return await call_next(context)
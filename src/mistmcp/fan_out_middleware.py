@@ -0,0 +1,313 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import asyncio
+import threading
+from collections.abc import Sequence
+
+import mcp.types
+import mistapi
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools.tool import Tool, ToolResult
+
+from mistmcp.config import config
+from mistmcp.logger import logger
+from mistmcp.paginator import get_all_pages
+from mistmcp.rate_limiter import rate_limiter
+from mistmcp.request_executor import MIST_CALL_ERRORS, mist_call
+from mistmcp.request_processor import get_apisession
+from mistmcp.response_formatter import tool_result_data
+from mistmcp.response_processor import process_response
+from mistmcp.serializer import dumps
+
+# Site scoped read-only tools accepting a ``site_ids`` list
+SITE_FAN_OUT_TOOLS = {
+    "mist_get_stats",
+    "mist_list_rogue_devices",
+    "mist_get_site_rrm_info",
+    "mist_get_site_sle",
+    "mist_list_site_sle_info",
+    "mist_get_insight_metrics",
+}
+# Org scoped read-only tools accepting an ``org_ids`` list
+ORG_FAN_OUT_TOOLS = {
+    "mist_get_org_sle",
+    "mist_get_org_licenses",
+    "mist_search_alarms",
+    "mist_get_stats",
+}
+
+_SITE_IDS_SCHEMA = {
+    "anyOf": [
+        {"type": "array", "items": {"type": "string", "format": "uuid"}},
+        {"type": "string", "enum": ["*"]},
+    ],
+    "description": 'List of site IDs to run the same query on every site at once, or "*" for every site of the org (requires `org_id`). Replaces `site_id`. The result is keyed by site ID, with the failures under `errors`',
+}
+_ORG_ID_SCHEMA = {
+    "type": "string",
+    "format": "uuid",
+    "description": 'Organization ID, only used to resolve `site_ids="*"`',
+}
+_ORG_IDS_SCHEMA = {
+    "anyOf": [
+        {"type": "array", "items": {"type": "string", "format": "uuid"}},
+        {"type": "string", "enum": ["*"]},
+    ],
+    "description": 'List of organization IDs to run the same query on every org at once, or "*" for every org the account has privileges on (including the orgs of its MSPs). Replaces `org_id`. The result is keyed by org ID, with the failures under `errors`',
+}
+
+# fan-out parameter -> (parameter it replaces, tools, key of the results)
+_SCOPES = {
+    "site_ids": ("site_id", SITE_FAN_OUT_TOOLS, "sites"),
+    "org_ids": ("org_id", ORG_FAN_OUT_TOOLS, "orgs"),
+}
+
+
+def _tool_error(exc: Exception) -> dict:
+    """Return the status code and message of a failed call"""
+    if isinstance(exc, ToolError) and exc.args and isinstance(exc.args[0], dict):
+        return exc.args[0]
+    return {"status_code": 500, "message": str(exc)}
+
+
+class FanOutMiddleware(Middleware):
+    """Run a read-only tool on many sites or orgs with a single call.
+
+    The tools of ``SITE_FAN_OUT_TOOLS`` are listed with an additional
+    ``site_ids`` parameter (a list of site IDs, or ``"*"`` for every site of
+    ``org_id``), and the tools of ``ORG_FAN_OUT_TOOLS`` with an additional
+    ``org_ids`` parameter (a list of org IDs, or ``"*"`` for every org in
+    the privileges of the account, from ``getSelf``). When one of them is
+    used, the tool is called once per site or org,
+    ``config.fan_out_concurrency`` at a time, and the results are merged
+    into one response keyed by site or org ID. The calls that failed are
+    reported under ``errors`` instead of failing the whole call.
+
+    The fan-out is refused when the API token does not have enough calls
+    left in its hourly budget for every site or org.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._fan_outs = 0
+        self._calls = 0
+        self._failures = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the fan-out counters."""
+        with self._lock:
+            return {
+                "fan_outs": self._fan_outs,
+                "calls": self._calls,
+                "failures": self._failures,
+            }
+
+    async def on_list_tools(
+        self,
+        context: MiddlewareContext[mcp.types.ListToolsRequest],
+        call_next,
+    ) -> Sequence[Tool]:
+        tools = await call_next(context)
+        return [self._with_fan_out(tool) for tool in tools]
+
+    @staticmethod
+    def _with_fan_out(tool: Tool) -> Tool:
+        if tool.name not in SITE_FAN_OUT_TOOLS | ORG_FAN_OUT_TOOLS:
+            return tool
+        parameters = dict(tool.parameters)
+        properties = dict(parameters.get("properties", {}))
+        required = list(parameters.get("required", []))
+        if tool.name in SITE_FAN_OUT_TOOLS:
+            properties["site_ids"] = _SITE_IDS_SCHEMA
+            properties.setdefault("org_id", _ORG_ID_SCHEMA)
+            required = [name for name in required if name != "site_id"]
+        if tool.name in ORG_FAN_OUT_TOOLS:
+            properties["org_ids"] = _ORG_IDS_SCHEMA
+            required = [name for name in required if name != "org_id"]
+        parameters["properties"] = properties
+        parameters["required"] = required
+        return tool.model_copy(update={"parameters": parameters})
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mcp.types.CallToolRequestParams],
+        call_next,
+    ) -> ToolResult:
+        message = context.message
+        arguments = message.arguments or {}
+        scopes = [
+            name
+            for name, (_, tools, _) in _SCOPES.items()
+            if name in arguments and message.name in tools
+        ]
+        if not scopes:
+            return await call_next(context)
+        if len(scopes) > 1:
+            raise ToolError(
+                {
+                    "status_code": 400,
+                    "message": "`site_ids` and `org_ids` cannot be used together",
+                }
+            )
+        fan_out = scopes[0]
+        id_name, _, results_key = _SCOPES[fan_out]
+
+        arguments = dict(arguments)
+        ids = arguments.pop(fan_out)
+        arguments.pop(id_name, None)
+        names: dict[str, str] = {}
+        apisession, _ = await get_apisession()
+        if fan_out == "site_ids":
+            if "org_id" not in await self._tool_parameters(context):
+                org_id = arguments.pop("org_id", None)
+            else:
+                org_id = arguments.get("org_id")
+            ids = await self._resolve_site_ids(apisession, ids, org_id)
+        else:
+            ids, names = await self._resolve_org_ids(apisession, ids)
+        self._check_budget(apisession, len(ids), results_key)
+
+        logger.debug(
+            "FanOutMiddleware: calling %s on %d %s", message.name, len(ids), results_key
+        )
+        semaphore = asyncio.Semaphore(max(1, config.fan_out_concurrency))
+
+        async def _call(object_id: str) -> tuple[str, object, dict | None]:
+            object_message = message.model_copy(
+                update={"arguments": {**arguments, id_name: object_id}}
+            )
+            async with semaphore:
+                try:
+                    result = await call_next(context.copy(message=object_message))
+                except MIST_CALL_ERRORS as exc:
+                    return object_id, None, _tool_error(exc)
+            return object_id, tool_result_data(result), None
+
+        results = await asyncio.gather(*(_call(object_id) for object_id in ids))
+        data: dict = {results_key: {}, "errors": {}}
+        for object_id, object_data, error in results:
+            if error is None:
+                data[results_key][object_id] = object_data
+            else:
+                data["errors"][object_id] = error
+        if names:
+            data["names"] = names
+        with self._lock:
+            self._fan_outs += 1
+            self._calls += len(ids)
+            self._failures += len(data["errors"])
+        return ToolResult(
+            content=dumps(data),
+            structured_content={"result": data},
+        )
+
+    @staticmethod
+    async def _tool_parameters(context: MiddlewareContext) -> dict:
+        server = context.fastmcp_context.fastmcp if context.fastmcp_context else None
+        tool = await server.get_tool(context.message.name) if server else None
+        return tool.parameters.get("properties", {}) if tool else {}
+
+    @staticmethod
+    def _explicit_ids(ids, parameter: str) -> list[str]:
+        if isinstance(ids, str):
+            ids = [ids]
+        if not isinstance(ids, list) or not ids:
+            raise ToolError(
+                {
+                    "status_code": 400,
+                    "message": f'`{parameter}` must be a non-empty list of IDs or "*"',
+                }
+            )
+        return list(dict.fromkeys(str(object_id) for object_id in ids))
+
+    @classmethod
+    async def _resolve_site_ids(
+        cls, apisession: mistapi.APISession, site_ids, org_id: str | None
+    ) -> list[str]:
+        if site_ids not in ("*", ["*"]):
+            return cls._explicit_ids(site_ids, "site_ids")
+        if not org_id:
+            raise ToolError(
+                {
+                    "status_code": 400,
+                    "message": '`org_id` is required when `site_ids` is "*"',
+                }
+            )
+        response = await mist_call(
+            mistapi.api.v1.orgs.sites.listOrgSites,
+            apisession,
+            org_id=str(org_id),
+            limit=1000,
+        )
+        await process_response(response)
+        sites = await get_all_pages(apisession, response)
+        return [site["id"] for site in sites if site.get("id")]
+
+    @classmethod
+    async def _resolve_org_ids(
+        cls, apisession: mistapi.APISession, org_ids
+    ) -> tuple[list[str], dict[str, str]]:
+        """Return the org IDs, and the org names when resolved from getSelf"""
+        if org_ids not in ("*", ["*"]):
+            return cls._explicit_ids(org_ids, "org_ids"), {}
+        response = await mist_call(mistapi.api.v1.self.self.getSelf, apisession)
+        await process_response(response)
+        privileges = (
+            response.data.get("privileges", []) or []
+            if isinstance(response.data, dict)
+            else []
+        )
+        names: dict[str, str] = {}
+        msp_ids = []
+        for privilege in privileges:
+            if privilege.get("scope") == "org" and privilege.get("org_id"):
+                names[privilege["org_id"]] = privilege.get("name", "")
+            elif privilege.get("scope") == "msp" and privilege.get("msp_id"):
+                msp_ids.append(privilege["msp_id"])
+        msp_orgs = await asyncio.gather(
+            *(
+                mist_call(
+                    mistapi.api.v1.msps.orgs.listMspOrgs, apisession, msp_id=msp_id
+                )
+                for msp_id in msp_ids
+            )
+        )
+        for msp_response in msp_orgs:
+            await process_response(msp_response)
+            for org in await get_all_pages(apisession, msp_response):
+                if isinstance(org, dict) and org.get("id"):
+                    names.setdefault(org["id"], org.get("name", ""))
+        if not names:
+            raise ToolError(
+                {
+                    "status_code": 404,
+                    "message": "The account has no privileges on any organization",
+                }
+            )
+        return list(names), names
+
+    @staticmethod
+    def _check_budget(apisession: mistapi.APISession, calls: int, kind: str) -> None:
+        remaining = rate_limiter.session_remaining(apisession)
+        if calls > remaining - rate_limiter.reserve:
+            raise ToolError(
+                {
+                    "status_code": 429,
+                    "message": f"Not enough Mist API calls left in the hourly quota to query {calls} {kind} ({remaining} calls left). Reduce the number of {kind} to query.",
+                }
+            )
+
+
+# Shared instance, registered in the server middleware and read by /metrics
+fan_out_middleware = FanOutMiddleware()
@@ -0,0 +1,178 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import contextlib
+import contextvars
+import threading
+from collections.abc import Iterator
+
+from mistmcp.config import config
+from mistmcp.serializer import dumps
+
+# Default projection of the records returned by a tool, used when the
+# ``fields`` parameter is not provided. The paths missing from a record are
+# ignored, so a profile can list the attributes of every record type
+# returned by the tool.
+DEFAULT_FIELDS: dict[str, tuple[str, ...]] = {
+    "mist_search_device": (
+        "id",
+        "mac",
+        "serial",
+        "model",
+        "type",
+        "name",
+        "hostname",
+        "site_id",
+        "connected",
+        "version",
+        "vc_mac",
+    ),
+    "mist_search_client": (
+        "mac",
+        "hostname",
+        "last_hostname",
+        "ip",
+        "last_ip",
+        "username",
+        "last_username",
+        "ssid",
+        "last_ssid",
+        "vlan",
+        "last_vlan",
+        "ap",
+        "last_ap",
+        "device_mac",
+        "last_device_mac",
+        "port_id",
+        "last_port_id",
+        "site_id",
+        "timestamp",
+    ),
+}
+
+# Fields projected by the tool being executed (None = no projection)
+_fields: contextvars.ContextVar[tuple[str, ...] | None] = contextvars.ContextVar(
+    "mistmcp_fields", default=None
+)
+
+
+@contextlib.contextmanager
+def projected_fields(tool_name: str, fields: list[str] | None) -> Iterator[None]:
+    """Project the records returned by ``tool_name`` on ``fields``.
+
+    Without ``fields``, the default profile of the tool is used (see
+    ``DEFAULT_FIELDS``), if enabled. ``["*"]`` returns every field.
+    """
+    if fields is None and config.field_profiles:
+        fields = DEFAULT_FIELDS.get(tool_name)
+    paths = tuple(fields) if fields and "*" not in fields else None
+    token = _fields.set(paths)
+    try:
+        yield
+    finally:
+        _fields.reset(token)
+
+
+def _project_record(record, paths: list[list[str]]):
+    if isinstance(record, list):
+        return [_project_record(item, paths) for item in record]
+    if not isinstance(record, dict):
+        return record
+    # first key -> remaining paths (None when the whole value is kept)
+    groups: dict[str, list[list[str]] | None] = {}
+    for key, *rest in paths:
+        if key not in record:
+            continue
+        if not rest or groups.get(key, []) is None:
+            groups[key] = None
+        else:
+            groups.setdefault(key, []).append(rest)
+    projected = {}
+    for key, rests in groups.items():
+        if rests is None:
+            projected[key] = record[key]
+        elif isinstance(record[key], (dict, list)):
+            projected[key] = _project_record(record[key], rests)
+    return projected
+
+
+def project(data, paths: tuple[str, ...]):
+    """Return ``data`` with each record projected on the dotted ``paths``.
+
+    The records are the items of a list, of the ``results`` list of a search
+    response, or the object itself. Lists found along a path are projected
+    item by item.
+    """
+    split = [path.split(".") for path in paths if path]
+    if isinstance(data, list):
+        return [_project_record(record, split) for record in data]
+    if isinstance(data, dict) and isinstance(data.get("results"), list):
+        return {
+            **data,
+            "results": [_project_record(record, split) for record in data["results"]],
+        }
+    return _project_record(data, split)
+
+
+class ProjectionStats:
+    """Counters of the bytes removed from the responses by the projections.
+
+    Measuring the sizes serializes the response twice, so they are only
+    measured on one projection out of ``sample_rate``.
+    """
+
+    def __init__(self, sample_rate: int = 16) -> None:
+        self._lock = threading.Lock()
+        self._sample_rate = max(1, sample_rate)
+        self._projections = 0
+        self._sampled = 0
+        self._bytes_in = 0
+        self._bytes_out = 0
+
+    def count(self) -> bool:
+        """Count a projection, and return True if its sizes must be measured."""
+        with self._lock:
+            self._projections += 1
+            return (self._projections - 1) % self._sample_rate == 0
+
+    def record(self, bytes_in: int, bytes_out: int) -> None:
+        """Record the sizes of a sampled projection."""
+        with self._lock:
+            self._sampled += 1
+            self._bytes_in += bytes_in
+            self._bytes_out += bytes_out
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the projection counters (the sizes are the
+        ones of the sampled projections)."""
+        with self._lock:
+            return {
+                "projections": self._projections,
+                "sampled": self._sampled,
+                "bytes_in": self._bytes_in,
+                "bytes_out": self._bytes_out,
+                "bytes_saved": self._bytes_in - self._bytes_out,
+            }
+
+
+projection_stats = ProjectionStats()
+
+
+def apply_projection(data):
+    """Project ``data`` on the fields of the tool being executed, if any."""
+    paths = _fields.get()
+    if not paths or not isinstance(data, (dict, list)):
+        return data
+    projected = project(data, paths)
+    if projection_stats.count():
+        projection_stats.record(len(dumps(data)), len(dumps(projected)))
+    return projected
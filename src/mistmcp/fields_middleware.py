@@ -0,0 +1,77 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+from collections.abc import Sequence
+
+import mcp.types
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools.tool import Tool, ToolResult
+
+from mistmcp.config import config
+from mistmcp.field_projection import DEFAULT_FIELDS, projected_fields
+from mistmcp.logger import logger
+
+_FIELDS_DESCRIPTION = 'List of the fields to return for each record, as dotted paths (e.g. `["mac", "name", "port_stat.ge-0/0/0.up"]`). Use it to only retrieve the fields needed to answer, it makes the response smaller and faster'
+
+
+def _fields_schema(tool_name: str) -> dict:
+    description = _FIELDS_DESCRIPTION
+    if config.field_profiles and tool_name in DEFAULT_FIELDS:
+        description += f'. Default: `{list(DEFAULT_FIELDS[tool_name])}`, use `["*"]` to return every field'
+    return {"type": "array", "items": {"type": "string"}, "description": description}
+
+
+class FieldsMiddleware(Middleware):
+    """Add a ``fields`` projection parameter to every read-only tool.
+
+    The parameter is removed from the arguments before the tool is called,
+    and the records of the tool response are projected on these fields by
+    ``response_formatter.format_response_data`` (see
+    ``field_projection.projected_fields()``).
+    """
+
+    async def on_list_tools(
+        self,
+        context: MiddlewareContext[mcp.types.ListToolsRequest],
+        call_next,
+    ) -> Sequence[Tool]:
+        tools = await call_next(context)
+        return [self._with_fields(tool) for tool in tools]
+
+    @staticmethod
+    def _with_fields(tool: Tool) -> Tool:
+        if not (tool.annotations and tool.annotations.readOnlyHint):
+            return tool
+        parameters = dict(tool.parameters)
+        properties = dict(parameters.get("properties", {}))
+        properties.setdefault("fields", _fields_schema(tool.name))
+        parameters["properties"] = properties
+        return tool.model_copy(update={"parameters": parameters})
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mcp.types.CallToolRequestParams],
+        call_next,
+    ) -> ToolResult:
+        message = context.message
+        arguments = message.arguments or {}
+        fields = arguments.get("fields")
+        if "fields" in arguments:
+            arguments = {k: v for k, v in arguments.items() if k != "fields"}
+            context = context.copy(
+                message=message.model_copy(update={"arguments": arguments})
+            )
+            if isinstance(fields, str):
+                fields = [field.strip() for field in fields.split(",")]
+            logger.debug("FieldsMiddleware: projecting %s on %s", message.name, fields)
+        with projected_fields(message.name, fields):
+            return await call_next(context)
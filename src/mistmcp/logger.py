@@ -10,6 +10,7 @@
 --------------------------------------------------------------------------------
 """
 
+import hashlib
 import logging
 import sys
 
@@ -23,6 +24,11 @@ def mask_token(token: str) -> str:
     return f"{token[:4]}...{token[-4:]}"
 
 
+def token_hash(apitoken: str) -> str:
+    """Return a stable, non-reversible identifier for an API token."""
+    return hashlib.sha256(apitoken.encode("utf-8")).hexdigest()[:32]
+
+
 def setup_logging(debug: bool = False, log_file: str | None = None) -> None:
     """Configure the mistmcp logger.
 
@@ -0,0 +1,247 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import bisect
+import copy
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+import mistapi
+
+from mistmcp.config import config
+from mistmcp.logger import logger
+from mistmcp.rate_limiter import session_key
+
+# Length of the n-grams of the substring index
+NGRAM = 3
+
+
+def parse_name(name: str) -> tuple[str, str]:
+    """Return the search mode and the lower-cased text of a name pattern.
+
+    ``x*`` is a prefix search, ``*x`` a suffix search, ``*x*`` and ``x`` are
+    substring searches.
+    """
+    pattern = name.lower()
+    if pattern.endswith("*") and not pattern.startswith("*"):
+        return "prefix", pattern[:-1]
+    if pattern.startswith("*") and not pattern.endswith("*"):
+        return "suffix", pattern[1:]
+    return "contains", pattern.strip("*")
+
+
+def name_matcher(name: str) -> Callable[[str], bool]:
+    """Return the function matching a lower-cased value against ``name``."""
+    mode, text = parse_name(name)
+    if mode == "prefix":
+        return lambda value: value.startswith(text)
+    if mode == "suffix":
+        return lambda value: value.endswith(text)
+    return lambda value: text in value
+
+
+def _successor(prefix: str) -> str | None:
+    """Return the smallest string greater than every string starting with
+    ``prefix``, or None if there is none."""
+    while prefix:
+        last = ord(prefix[-1])
+        if last < sys.maxunicode:
+            return prefix[:-1] + chr(last + 1)
+        prefix = prefix[:-1]
+    return None
+
+
+def _sorted_range(entries: list[tuple[str, int]], prefix: str) -> list[int]:
+    start = bisect.bisect_left(entries, (prefix,))
+    successor = _successor(prefix)
+    end = (
+        len(entries) if successor is None else bisect.bisect_left(entries, (successor,))
+    )
+    return [position for _, position in entries[start:end]]
+
+
+class _Index:
+    """Name and ID index of one list of configuration objects"""
+
+    def __init__(self, objects: list[dict], attribute: str) -> None:
+        self.objects = objects
+        self.attribute = attribute
+        self.built = time.monotonic()
+        self.values = [str(obj.get(attribute) or "").lower() for obj in objects]
+        # Sorted (value, position) arrays for the prefix and suffix searches
+        self.prefixes = sorted((value, i) for i, value in enumerate(self.values))
+        self.suffixes = sorted((value[::-1], i) for i, value in enumerate(self.values))
+        # n-gram -> positions of the values containing it
+        self.ngrams: dict[str, set[int]] = {}
+        for position, value in enumerate(self.values):
+            for start in range(len(value) - NGRAM + 1):
+                self.ngrams.setdefault(value[start : start + NGRAM], set()).add(
+                    position
+                )
+
+    def search(self, name: str) -> list[int]:
+        """Return the positions of the objects matching ``name``, in list order."""
+        mode, text = parse_name(name)
+        if mode == "prefix":
+            positions = _sorted_range(self.prefixes, text)
+        elif mode == "suffix":
+            positions = _sorted_range(self.suffixes, text[::-1])
+        elif len(text) < NGRAM:
+            positions = [i for i, value in enumerate(self.values) if text in value]
+        else:
+            candidates = None
+            for start in range(len(text) - NGRAM + 1):
+                postings = self.ngrams.get(text[start : start + NGRAM], set())
+                candidates = (
+                    set(postings) if candidates is None else candidates & postings
+                )
+                if not candidates:
+                    return []
+            # The n-grams match, check they are contiguous
+            positions = [i for i in candidates or () if text in self.values[i]]
+        return sorted(positions)
+
+
+class ObjectIndex:
+    """In-memory index of the configuration objects, by name.
+
+    Searching configuration objects by name requires the whole list of
+    objects. The first search of an object type in an org (or site) builds an
+    index of the list, kept for ``config.object_index_ttl`` seconds and
+    keyed by API token, org, site and object type. The following searches
+    are answered from the index without calling the Mist API:
+
+    - prefix (``x*``) and suffix (``*x``) searches use sorted arrays,
+    - substring searches use an index of the 3-grams of the names.
+
+    At most ``config.object_index_max_entries`` lists are indexed, the least
+    recently used ones are dropped first. The writes done with
+    ``mist_change_configuration_objects`` drop the index of the object type
+    (see ``invalidate()``).
+    """
+
+    def __init__(
+        self, ttl: float | None = None, max_entries: int | None = None
+    ) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._indexes: OrderedDict[tuple, _Index] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._builds = 0
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl if self._ttl is not None else config.object_index_ttl
+
+    @property
+    def max_entries(self) -> int:
+        return (
+            self._max_entries
+            if self._max_entries is not None
+            else config.object_index_max_entries
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the index counters."""
+        with self._lock:
+            return {
+                "size": len(self._indexes),
+                "objects": sum(len(index.objects) for index in self._indexes.values()),
+                "hits": self._hits,
+                "misses": self._misses,
+                "builds": self._builds,
+            }
+
+    @staticmethod
+    def key(
+        apisession: mistapi.APISession,
+        object_type: str,
+        org_id: str | None = None,
+        site_id: str | None = None,
+    ) -> tuple:
+        """Return the index key of a list of configuration objects."""
+        return (session_key(apisession), org_id, site_id, object_type)
+
+    def _get(self, key: tuple) -> _Index | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None or time.monotonic() - index.built >= self.ttl:
+                if index is not None:
+                    del self._indexes[key]
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._indexes.move_to_end(key)
+            return index
+
+    def build(self, key: tuple, objects: list[dict], attribute: str = "name") -> None:
+        """Index the full list ``objects`` by ``attribute`` and ID."""
+        if not self.enabled:
+            return
+        index = _Index([obj for obj in objects if isinstance(obj, dict)], attribute)
+        with self._lock:
+            self._indexes.pop(key, None)
+            self._indexes[key] = index
+            self._builds += 1
+            while len(self._indexes) > self.max_entries:
+                self._indexes.popitem(last=False)
+        logger.debug("Object index: indexed %d objects for %s", len(objects), key[1:])
+
+    def search(
+        self, key: tuple, name: str, limit: int | None = None
+    ) -> tuple[list, int] | None:
+        """Return copies of the first ``limit`` (default: all) objects matching
+        ``name`` and the number of matches, or None when the list is not
+        indexed."""
+        index = self._get(key)
+        if index is None:
+            return None
+        positions = index.search(name)
+        return (
+            [copy.deepcopy(index.objects[i]) for i in positions[:limit]],
+            len(positions),
+        )
+
+    def invalidate(
+        self,
+        object_type: str,
+        org_id: str | None = None,
+        site_id: str | None = None,
+    ) -> None:
+        """Drop the indexes of ``object_type`` in the org or site of a write."""
+        with self._lock:
+            for key in list(self._indexes):
+                _, k_org, k_site, k_type = key
+                if k_type == object_type and (
+                    (org_id and k_org == org_id) or (site_id and k_site == site_id)
+                ):
+                    del self._indexes[key]
+
+    def clear(self) -> None:
+        """Forget every index."""
+        with self._lock:
+            self._indexes.clear()
+
+
+# Process-wide index shared by every tool
+object_index = ObjectIndex()
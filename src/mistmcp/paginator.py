@@ -0,0 +1,140 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import asyncio
+import itertools
+import urllib.parse
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
+import mistapi
+from mistapi.__api_response import APIResponse
+
+from mistmcp.config import config
+from mistmcp.logger import logger
+from mistmcp.request_executor import mist_call
+from mistmcp.response_processor import process_response
+
+
+def _page_items(response: APIResponse) -> list:
+    """Return the items of one page (list response or ``results`` of a search)"""
+    if isinstance(response.data, list):
+        return response.data
+    if isinstance(response.data, dict):
+        return response.data.get("results", [])
+    return []
+
+
+def _page_uri(url: str, page: int) -> str:
+    """Return the URI of the request ``url`` for the page number ``page``"""
+    parsed = urllib.parse.urlsplit(url)
+    query = [(k, v) for k, v in urllib.parse.parse_qsl(parsed.query) if k != "page"]
+    query.append(("page", str(page)))
+    return f"{parsed.path}?{urllib.parse.urlencode(query)}"
+
+
+def _page_count(response: APIResponse) -> tuple[int, int] | None:
+    """Return the current page number and the number of pages, from the X-Page headers"""
+    headers = response.headers or {}
+    try:
+        total = int(headers.get("X-Page-Total", ""))
+        limit = int(headers.get("X-Page-Limit", ""))
+        page = int(headers.get("X-Page-Page", "1"))
+    except ValueError:
+        return None
+    if limit <= 0:
+        return None
+    return page, -(-total // limit)
+
+
+async def _fetch_page(apisession: mistapi.APISession, url: str, number: int) -> list:
+    response = await mist_call(apisession.mist_get, _page_uri(url, number))
+    await process_response(response)
+    return _page_items(response)
+
+
+async def iter_pages(
+    apisession: mistapi.APISession,
+    response: APIResponse,
+    concurrency: int | None = None,
+) -> AsyncIterator[list]:
+    """Yield the items of a first list response, then of every following page.
+
+    When the response has the ``X-Page-Total``/``X-Page-Limit`` headers, the
+    number of pages is known upfront and the next pages are retrieved ahead,
+    at most ``concurrency`` (default ``config.page_concurrency``) at a time,
+    while the caller processes the current one. The pages are yielded in
+    order. Cursor based responses (search endpoints) can only be followed
+    one page after the other.
+
+    The caller can stop the iteration at any time, the pages requested ahead
+    are then cancelled. Use ``contextlib.aclosing()`` so this happens as soon
+    as the caller leaves the loop.
+
+    Raises a ToolError if one of the pages cannot be retrieved.
+    """
+    yield _page_items(response)
+    page_count = _page_count(response)
+
+    if page_count is not None:
+        page, pages = page_count
+        window = max(1, concurrency or config.page_concurrency)
+        numbers = iter(range(page + 1, pages + 1))
+        pending: deque[asyncio.Task] = deque()
+        if page < pages:
+            logger.debug("Paginator: retrieving pages %d to %d", page + 1, pages)
+        try:
+            for number in itertools.islice(numbers, window):
+                pending.append(
+                    asyncio.ensure_future(_fetch_page(apisession, response.url, number))
+                )
+            while pending:
+                items = await pending.popleft()
+                for number in itertools.islice(numbers, 1):
+                    pending.append(
+                        asyncio.ensure_future(
+                            _fetch_page(apisession, response.url, number)
+                        )
+                    )
+                yield items
+        finally:
+            for task in pending:
+                if not task.cancel() and not task.cancelled():
+                    # Already done: retrieve the exception so it is not logged
+                    task.exception()
+        return
+
+    while response.next:
+        response = await mist_call(apisession.mist_get, response.next)
+        await process_response(response)
+        yield _page_items(response)
+
+
+async def get_all_pages(
+    apisession: mistapi.APISession,
+    response: APIResponse,
+    concurrency: int | None = None,
+) -> list:
+    """Return the items of every page following a first list response.
+
+    Replacement of ``mistapi.get_all``, retrieving the pages concurrently
+    when possible (see ``iter_pages()``). The items are returned in page
+    order.
+
+    Raises a ToolError if one of the pages cannot be retrieved.
+    """
+    data: list = []
+    async with aclosing(iter_pages(apisession, response, concurrency)) as pages:
+        async for items in pages:
+            data += items
+    return data
@@ -0,0 +1,181 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+
+import mcp.types
+import mistapi
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+from mistapi.__api_response import APIResponse
+
+from mistmcp.config import config
+from mistmcp.logger import logger
+from mistmcp.rate_limiter import low_priority, rate_limiter, session_key
+from mistmcp.request_executor import MIST_CALL_ERRORS, mist_call
+from mistmcp.request_processor import get_apisession
+from mistmcp.retry_policy import tool_deadline
+
+
+class _Prefetch:
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+        self.created = time.monotonic()
+
+
+def _next_url(result: ToolResult) -> str | None:
+    """Return the Mist API URL of the next page of a tool result, if any"""
+    data = result.structured_content
+    if isinstance(data, dict) and set(data) == {"result"}:
+        data = data["result"]
+    if not isinstance(data, dict) or not data.get("has_more"):
+        return None
+    url = data.get("next")
+    if not isinstance(url, str) or not url.startswith(("http://", "https://", "/")):
+        return None
+    return url
+
+
+class PrefetchMiddleware(Middleware):
+    """Fetch the next page of a paginated tool result in the background.
+
+    When a tool returns a page with ``has_more: true``, the agent usually
+    calls ``mist_get_next_page`` right after. With ``config.prefetch``
+    enabled, the ``next`` URL is fetched as soon as the page is returned
+    and kept for ``config.prefetch_ttl`` seconds, at most
+    ``config.prefetch_max_pages`` pages per API token. ``mist_get_next_page``
+    then returns the prefetched page (see ``take()``) instead of calling
+    the Mist API.
+
+    The prefetches are low priority calls, and are skipped when less than
+    twice ``config.rate_limit_reserve`` calls are left in the hourly budget
+    of the API token.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pages: dict[str, OrderedDict[str, _Prefetch]] = {}
+        self._prefetched = 0
+        self._skipped = 0
+        self._hits = 0
+        self._misses = 0
+        self._wasted = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """Return a snapshot of the prefetch counters."""
+        with self._lock:
+            taken = self._hits + self._misses
+            return {
+                "prefetched": self._prefetched,
+                "skipped": self._skipped,
+                "hits": self._hits,
+                "misses": self._misses,
+                "wasted": self._wasted,
+                "hit_rate": round(self._hits / taken, 3) if taken else 0.0,
+            }
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mcp.types.CallToolRequestParams],
+        call_next,
+    ) -> ToolResult:
+        result = await call_next(context)
+        if config.prefetch:
+            url = _next_url(result)
+            if url is not None:
+                apisession, _ = await get_apisession()
+                self.schedule(apisession, url)
+        return result
+
+    def _expire(self, pages: OrderedDict[str, _Prefetch]) -> None:
+        # Must be called with the lock held
+        now = time.monotonic()
+        for url in [
+            url
+            for url, prefetch in pages.items()
+            if now - prefetch.created >= config.prefetch_ttl
+        ]:
+            self._drop(pages, url)
+
+    def _drop(self, pages: OrderedDict[str, _Prefetch], url: str) -> None:
+        # Must be called with the lock held
+        prefetch = pages.pop(url)
+        prefetch.task.cancel()
+        self._wasted += 1
+
+    def schedule(self, apisession: mistapi.APISession, url: str) -> None:
+        """Start fetching ``url`` in the background, if the budget allows it."""
+        key = session_key(apisession)
+        if (
+            rate_limiter.limit > 0
+            and rate_limiter.session_remaining(apisession) < 2 * rate_limiter.reserve
+        ):
+            with self._lock:
+                self._skipped += 1
+            logger.debug("Prefetch: skipped, API call budget under pressure")
+            return
+        with self._lock:
+            pages = self._pages.setdefault(key, OrderedDict())
+            self._expire(pages)
+            if url in pages:
+                return
+            with low_priority():
+                task = asyncio.ensure_future(self._fetch(apisession, url))
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            pages[url] = _Prefetch(task)
+            self._prefetched += 1
+            while len(pages) > max(1, config.prefetch_max_pages):
+                self._drop(pages, next(iter(pages)))
+        logger.debug("Prefetch: fetching the next page %s", url)
+
+    @staticmethod
+    async def _fetch(apisession: mistapi.APISession, url: str) -> APIResponse:
+        with tool_deadline(config.tool_deadline):
+            return await mist_call(apisession.mist_get, url)
+
+    async def take(
+        self, apisession: mistapi.APISession, url: str
+    ) -> APIResponse | None:
+        """Return the prefetched page of ``url``, or None if it was not
+        prefetched or the prefetch failed."""
+        if not config.prefetch:
+            return None
+        key = session_key(apisession)
+        with self._lock:
+            pages = self._pages.get(key)
+            if pages is not None:
+                self._expire(pages)
+            prefetch = pages.pop(url, None) if pages is not None else None
+        response = None
+        if prefetch is not None:
+            try:
+                response = await prefetch.task
+            except MIST_CALL_ERRORS as exc:
+                logger.debug("Prefetch: the prefetch of %s failed: %s", url, exc)
+        hit = isinstance(response, APIResponse) and response.status_code == 200
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+        if not hit:
+            return None
+        logger.debug("Prefetch: serving %s from the prefetched page", url)
+        return response
+
+
+# Shared instance, registered in the server middleware and used by
+# mist_get_next_page
+prefetch_middleware = PrefetchMiddleware()
@@ -0,0 +1,234 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import mistapi
+from fastmcp.exceptions import ToolError
+
+from mistmcp.config import config
+from mistmcp.logger import logger, token_hash
+
+# Priority of the Mist API calls made by the current tool call
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "mistmcp_request_priority", default="normal"
+)
+
+
+@contextmanager
+def low_priority() -> Iterator[None]:
+    """Mark the Mist API calls made inside this block as low priority.
+
+    Low priority calls are rejected early, keeping the last part of the hourly
+    budget (``config.rate_limit_reserve``) for the other calls.
+    """
+    reset = _priority.set("low")
+    try:
+        yield
+    finally:
+        _priority.reset(reset)
+
+
+def session_key(apisession: mistapi.APISession) -> str:
+    """Return the key of an APISession (hash of its API token(s))."""
+    return token_hash(",".join(apisession._apitoken))
+
+
+def token_keys(apisession: mistapi.APISession) -> list[str]:
+    """Return the rate limiter keys of the API tokens of an APISession.
+
+    Each API token has its own hourly quota, so its own budget.
+    """
+    return [token_hash(token) for token in apisession._apitoken or [""]]
+
+
+def token_key(apisession: mistapi.APISession) -> str:
+    """Return the rate limiter key of the API token currently used by an
+    APISession."""
+    keys = token_keys(apisession)
+    return keys[getattr(apisession, "_apitoken_index", 0) % len(keys)]
+
+
+class _Bucket:
+    """Token bucket and rolling-hour call log of one API token."""
+
+    def __init__(self, capacity: float) -> None:
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.calls: deque[float] = deque()
+
+
+class RateLimiter:
+    """Per-token rate limiter for the Mist API hourly quota.
+
+    The Mist Cloud allows 5000 API calls per hour and per API token, and
+    answers with HTTP 429 once the quota is reached, which also locks out
+    every other user of the same token. Each token gets a token bucket
+    holding up to ``config.rate_limit`` calls and refilled at
+    ``rate_limit / 3600`` calls per second, so the calls are slowed down or
+    rejected here before the Mist Cloud starts rejecting them.
+
+    - a call waits up to ``config.rate_limit_max_wait`` seconds for the
+      bucket to refill, then is rejected with a 429 ToolError
+    - low priority calls (see ``low_priority()``) also need
+      ``config.rate_limit_reserve`` calls left in the bucket
+    - the bucket is reconciled with the usage reported by ``getSelfApiUsage``
+      and emptied when the Mist Cloud answers with HTTP 429
+    """
+
+    def __init__(
+        self,
+        limit: int | None = None,
+        reserve: int | None = None,
+        max_wait: float | None = None,
+    ) -> None:
+        self._limit = limit
+        self._reserve = reserve
+        self._max_wait = max_wait
+        self._buckets: dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+        self._waited = 0
+        self._rejected = 0
+
+    @property
+    def limit(self) -> int:
+        return self._limit if self._limit is not None else config.rate_limit
+
+    @property
+    def reserve(self) -> int:
+        return self._reserve if self._reserve is not None else config.rate_limit_reserve
+
+    @property
+    def max_wait(self) -> float:
+        return (
+            self._max_wait if self._max_wait is not None else config.rate_limit_max_wait
+        )
+
+    def _bucket(self, key: str) -> _Bucket:
+        # Must be called with the lock held
+        bucket = self._buckets.get(key)
+        now = time.monotonic()
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.limit)
+        else:
+            refill = (now - bucket.updated) * self.limit / 3600
+            bucket.tokens = min(self.limit, bucket.tokens + refill)
+            bucket.updated = now
+        while bucket.calls and bucket.calls[0] <= now - 3600:
+            bucket.calls.popleft()
+        return bucket
+
+    def _try_acquire(self, key: str, cost: int, threshold: float) -> float:
+        """Take ``cost`` tokens if possible, otherwise return the seconds to wait"""
+        with self._lock:
+            bucket = self._bucket(key)
+            if bucket.tokens - cost >= threshold:
+                bucket.tokens -= cost
+                bucket.calls.extend([bucket.updated] * cost)
+                return 0
+            return (cost + threshold - bucket.tokens) * 3600 / self.limit
+
+    async def acquire(self, key: str, cost: int = 1) -> None:
+        """Wait for ``cost`` calls to be available in the ``key`` budget.
+
+        Raises a 429 ToolError when the budget is not refilled within
+        ``max_wait`` seconds.
+        """
+        if self.limit <= 0:
+            return
+        low = _priority.get() == "low"
+        threshold = min(self.reserve, self.limit - cost) if low else 0
+        deadline = time.monotonic() + self.max_wait
+        while True:
+            wait = self._try_acquire(key, cost, threshold)
+            if wait <= 0:
+                return
+            if time.monotonic() + wait > deadline:
+                self._rejected += 1
+                remaining = self.remaining(key)
+                logger.warning(
+                    "Rate limiter: rejecting %s priority call, %d call(s) left",
+                    "low" if low else "normal",
+                    remaining,
+                )
+                raise ToolError(
+                    {
+                        "status_code": 429,
+                        "message": f"API call budget of the API token almost exhausted ({remaining} of {self.limit} calls per hour left). Retry in {int(wait) + 1} seconds, or narrow the request instead of paginating.",
+                    }
+                )
+            self._waited += 1
+            logger.debug("Rate limiter: waiting %.1fs for the API call budget", wait)
+            await asyncio.sleep(wait)
+
+    def remaining(self, key: str) -> int:
+        """Return the number of calls left in the ``key`` budget."""
+        with self._lock:
+            return int(self._bucket(key).tokens)
+
+    def session_remaining(self, apisession: mistapi.APISession) -> int:
+        """Return the number of calls left in the budgets of every API token
+        of ``apisession``."""
+        return sum(self.remaining(key) for key in token_keys(apisession))
+
+    def calls_last_hour(self, key: str) -> int:
+        """Return the number of calls made with the ``key`` budget in the last hour."""
+        with self._lock:
+            return len(self._bucket(key).calls)
+
+    def reconcile(self, key: str, usage: dict) -> None:
+        """Align the ``key`` budget with a ``getSelfApiUsage`` response."""
+        requests = usage.get("requests")
+        request_limit = usage.get("request_limit") or self.limit
+        if not isinstance(requests, int):
+            return
+        with self._lock:
+            bucket = self._bucket(key)
+            bucket.tokens = max(0, min(self.limit, request_limit - requests))
+        logger.debug(
+            "Rate limiter: reconciled with API usage, %d/%d call(s) used",
+            requests,
+            request_limit,
+        )
+
+    def exhausted(self, key: str) -> None:
+        """Empty the ``key`` budget after the Mist Cloud answered HTTP 429."""
+        with self._lock:
+            self._bucket(key).tokens = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the rate limiter counters."""
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "tokens": len(self._buckets),
+                "min_remaining": min(
+                    (int(self._bucket(key).tokens) for key in list(self._buckets)),
+                    default=self.limit,
+                ),
+                "max_calls_last_hour": max(
+                    (len(bucket.calls) for bucket in self._buckets.values()),
+                    default=0,
+                ),
+                "waited": self._waited,
+                "rejected": self._rejected,
+            }
+
+
+# Process-wide rate limiter shared by every tool
+rate_limiter = RateLimiter()
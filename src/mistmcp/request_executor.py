@@ -0,0 +1,345 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import threading
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+import httpx
+import mistapi
+import requests
+from fastmcp.exceptions import ToolError
+from mistapi.__api_response import APIResponse
+
+from mistmcp.async_transport import async_transport
+from mistmcp.config import config
+from mistmcp.constants_cache import constants_cache, is_constants_call
+from mistmcp.logger import logger
+from mistmcp.rate_limiter import rate_limiter, session_key, token_key, token_keys
+from mistmcp.retry_policy import retry_policy
+from mistmcp.single_flight import single_flight
+
+T = TypeVar("T")
+
+# Errors of a failed Mist API call: the ToolError of the rate limiter or of
+# an error response (see ``response_processor``), or a network error
+MIST_CALL_ERRORS = (ToolError, httpx.HTTPError, requests.RequestException)
+
+
+class RequestExecutor:
+    """Bounded thread pool running the blocking Mist API calls off the event loop.
+
+    ``mistapi`` is built on ``requests`` and every call blocks until the HTTP
+    round trip is done (including its own 429 back-off sleeps). Running these
+    calls directly inside the tool coroutines freezes the event loop, so in
+    HTTP mode a single slow request stalls every other client.
+
+    All the tools go through one shared executor so the number of worker
+    threads is capped per process (``config.max_workers``). Calls waiting for
+    a free worker are counted as queued, and a call cancelled while still
+    queued is dropped before it reaches the Mist API.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._cancelled = 0
+        self._max_queue_depth = 0
+
+    @property
+    def max_workers(self) -> int:
+        return max(1, self._max_workers or config.max_workers)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Created lazily so the worker cap loaded from the CLI/env is applied
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="mistmcp"
+                )
+            return self._executor
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the executor counters."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "cancelled": self._cancelled,
+                "max_queue_depth": self._max_queue_depth,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads. A new pool is created on the next call."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run ``func(*args, **kwargs)`` in the worker pool and await its result.
+
+        The caller context variables are copied into the worker thread. If the
+        awaiting task is cancelled, the call is removed from the queue when it
+        has not started yet; a call already running cannot be interrupted and
+        its result is discarded.
+        """
+        executor = self._get_executor()
+        context = contextvars.copy_context()
+
+        def _call() -> T:
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+            try:
+                return context.run(func, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        with self._lock:
+            self._queued += 1
+            queue_depth = self._queued + self._running - self.max_workers
+            self._max_queue_depth = max(self._max_queue_depth, queue_depth)
+        if queue_depth > 0:
+            logger.debug(
+                "Request executor saturated — %d call(s) waiting for a worker",
+                queue_depth,
+            )
+
+        future = executor.submit(_call)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+                    self._cancelled += 1
+            raise
+
+
+# Process-wide executor shared by every tool
+request_executor = RequestExecutor()
+
+
+class SessionLeases:
+    """Number of calls in flight on each ``mistapi.APISession``.
+
+    A pooled session evicted while calls still use it (see ``SessionPool``)
+    is only closed when the last of these calls releases its lease.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # id of the session -> number of calls in flight
+        self._leases: dict[int, int] = {}
+        # id of the session -> close function, called on the last release
+        self._closing: dict[int, Callable[[], None]] = {}
+
+    @contextlib.contextmanager
+    def lease(self, apisession: mistapi.APISession) -> Iterator[None]:
+        """Hold ``apisession`` open during the block."""
+        key = id(apisession)
+        with self._lock:
+            self._leases[key] = self._leases.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._leases[key] -= 1
+                close = None
+                if not self._leases[key]:
+                    del self._leases[key]
+                    close = self._closing.pop(key, None)
+            if close is not None:
+                close()
+
+    def close(self, apisession: mistapi.APISession, close: Callable[[], None]) -> bool:
+        """Call ``close`` now if ``apisession`` has no call in flight,
+        otherwise when its last call releases its lease.
+
+        Returns True if ``close`` was called now.
+        """
+        key = id(apisession)
+        with self._lock:
+            if self._leases.get(key):
+                self._closing[key] = close
+                return False
+        close()
+        return True
+
+
+# Process-wide leases of the sessions used by mist_call()
+session_leases = SessionLeases()
+
+
+def _call_session(func: Callable[..., Any], args: tuple) -> mistapi.APISession | None:
+    """Return the APISession used by a ``mistapi`` call, if any"""
+    bound_session = getattr(func, "__self__", None)
+    if isinstance(bound_session, mistapi.APISession):
+        return bound_session
+    if args and isinstance(args[0], mistapi.APISession):
+        return args[0]
+    return None
+
+
+def _call_cost(func: Callable[..., Any], args: tuple) -> int:
+    """Return the number of Mist API requests a call is expected to send"""
+    if func is not mistapi.get_all or len(args) < 2:
+        return 1
+    # get_all requests the pages following the first response
+    headers = args[1].headers or {}
+    try:
+        total = int(headers.get("X-Page-Total", 0))
+        limit = int(headers.get("X-Page-Limit", 0))
+        page = int(headers.get("X-Page-Page", 1))
+    except ValueError:
+        return 1
+    if not limit:
+        return 1
+    return max(1, -(-total // limit) - page)
+
+
+def _rotate_apitoken(apisession: mistapi.APISession) -> None:
+    """Switch ``apisession`` to its next API token after an HTTP 429.
+
+    Replaces the token rotation of the mistapi 429 retries, disabled in the
+    session pool (see ``SessionPool``).
+    """
+    if len(getattr(apisession, "_apitoken", None) or []) > 1:
+        apisession._next_apitoken()
+
+
+def _select_apitoken(apisession: mistapi.APISession, cost: int) -> None:
+    """Switch ``apisession`` to the API token with the most calls left in its
+    budget, when its current token has less than ``cost`` calls left."""
+    keys = token_keys(apisession)
+    if rate_limiter.limit <= 0 or len(keys) < 2:
+        return
+    if rate_limiter.remaining(token_key(apisession)) >= cost:
+        return
+    best = max(keys, key=rate_limiter.remaining)
+    for _ in keys:
+        if token_key(apisession) == best:
+            return
+        apisession._next_apitoken()
+
+
+def _leased(apisession: mistapi.APISession, func: Callable[..., T]) -> Callable[..., T]:
+    # The lease is held by the worker thread, which keeps running when the
+    # awaiting task is cancelled
+    def _call(*args: Any, **kwargs: Any) -> T:
+        with session_leases.lease(apisession):
+            return func(*args, **kwargs)
+
+    return _call
+
+
+async def _dispatch(
+    apisession: mistapi.APISession,
+    request: tuple | None,
+    func: Callable[..., T],
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    if config.http_backend == "async":
+        if func is mistapi.get_all:
+            with session_leases.lease(apisession):
+                return await async_transport.get_all(*args, **kwargs)
+        if request is not None:
+            with session_leases.lease(apisession):
+                return await async_transport.get(*request)
+    return await request_executor.run(_leased(apisession, func), *args, **kwargs)
+
+
+async def mist_call(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a blocking ``mistapi`` call through the shared request executor.
+
+    The call is counted against the hourly budget of the API token used
+    (see ``RateLimiter``), switching to another API token of the session
+    when its budget is exhausted, and the transient failures are retried
+    (see ``RetryPolicy``). Identical concurrent GET requests are sent only once
+    (see ``SingleFlight``), and the constants are served from a shared cache
+    (see ``ConstantsCache``). With ``--http-backend async``, the GET requests are sent
+    by the native asyncio transport instead of the executor.
+
+    Usage: ``response = await mist_call(mistapi.api.v1.orgs.sites.listOrgSites, apisession, org_id=org_id)``
+    """
+    apisession = _call_session(func, args)
+    if apisession is None:
+        return await request_executor.run(func, *args, **kwargs)
+
+    key = session_key(apisession)
+    # rate limiter key of the API token used by the last request sent
+    used_key = token_key(apisession)
+    cost = _call_cost(func, args)
+    request = async_transport.record(func, args, kwargs)
+    idempotent = request is not None or func is mistapi.get_all
+
+    async def _send() -> T:
+        nonlocal used_key
+        _select_apitoken(apisession, cost)
+        used_key = token_key(apisession)
+        await rate_limiter.acquire(used_key, cost)
+        return await _dispatch(apisession, request, func, *args, **kwargs)
+
+    def _on_rate_limited() -> None:
+        rate_limiter.exhausted(used_key)
+        _rotate_apitoken(apisession)
+
+    if request is not None:
+        apisession, uri, query = request
+        url = apisession._url(uri) + apisession._gen_query(query)
+        flight_key = (key, "GET", url)
+    elif func is mistapi.get_all:
+        flight_key = (key, "GET_ALL", args[1].url)
+    else:
+        flight_key = None
+
+    def _retry() -> Awaitable[T]:
+        return retry_policy.run(
+            _send,
+            idempotent=idempotent,
+            on_rate_limited=_on_rate_limited,
+        )
+
+    async def _fetch() -> T:
+        if flight_key is None:
+            return await _retry()
+        return await single_flight.do(flight_key, _retry)
+
+    if request is not None and is_constants_call(func):
+        response = await constants_cache.get(apisession._cloud_uri, uri, url, _fetch)
+    else:
+        response = await _fetch()
+    if isinstance(response, APIResponse):
+        if response.status_code == 429:
+            rate_limiter.exhausted(used_key)
+        elif (
+            func is mistapi.api.v1.self.usage.getSelfApiUsage
+            and response.status_code == 200
+            and isinstance(response.data, dict)
+        ):
+            rate_limiter.reconcile(used_key, response.data)
+    return response
@@ -17,6 +17,7 @@ from starlette.requests import Request
 
 from mistmcp.config import config
 from mistmcp.logger import logger, mask_token
+from mistmcp.session_pool import session_pool
 
 
 async def get_apisession() -> tuple[mistapi.APISession, str]:
@@ -47,8 +48,9 @@ async def get_apisession() -> tuple[mistapi.APISession, str]:
                     "Bearer ", ""
                 )
 
-            if request.query_params.get("output", "").lower() == "string":
-                response_format = "string"
+            output = request.query_params.get("output", "").lower()
+            if output in ("string", "table"):
+                response_format = output
         except NotFoundError as exc:
             raise ClientError(
                 "HTTP request context not found. Are you using HTTP transport?"
@@ -82,9 +84,6 @@ async def get_apisession() -> tuple[mistapi.APISession, str]:
 
     logger.info("API request — host: %s, token: %s", cloud, mask_token(apitoken))
 
-    apisession = mistapi.APISession(
-        host=cloud,
-        apitoken=apitoken,
-    )
+    apisession = await session_pool.get(cloud, apitoken)
 
     return apisession, response_format
@@ -10,11 +10,37 @@
 --------------------------------------------------------------------------------
 """
 
+import contextlib
+import contextvars
 import json
+from collections.abc import Iterator
 
+import mcp.types
+from fastmcp.tools.tool import ToolResult
 from mistapi.__api_response import APIResponse
 
+from mistmcp.field_projection import apply_projection
 from mistmcp.logger import logger
+from mistmcp.serializer import dumps
+
+# Response format forced by a middleware post-processing the tool result
+_format_override: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "mistmcp_response_format", default=None
+)
+
+
+@contextlib.contextmanager
+def response_format_override(response_format: str) -> Iterator[None]:
+    """Make the tools called inside this block return ``response_format``.
+
+    Used by the middlewares combining the data of several tool calls, which
+    format the combined response themselves.
+    """
+    token = _format_override.set(response_format)
+    try:
+        yield
+    finally:
+        _format_override.reset(token)
 
 
 def _get_total(response: APIResponse) -> int | None:
@@ -53,10 +79,13 @@ def format_response_data(response: APIResponse) -> dict | list:
     Returns a plain ``dict`` or ``list``.  If ``response.next`` is set the
     return value is enriched with a ``"_next"`` key so the caller can pass
     that URL to ``getNextPage`` to fetch the subsequent page.
+
+    The records are projected on the ``fields`` requested for the tool being
+    executed, if any (see ``field_projection``).
     """
     total = _get_total(response)
 
-    data = response.data
+    data = apply_projection(response.data)
 
     if response.next:
         if isinstance(data, list):
@@ -77,21 +106,90 @@ def format_response_data(response: APIResponse) -> dict | list:
     return data
 
 
+def _table(records: list) -> dict | list:
+    """Convert a list of objects into a ``{"columns", "rows"}`` table.
+
+    The columns are the keys of the objects, in the order they are first
+    seen, and the missing values are ``null``. The string columns with many
+    repeated values are dictionary encoded: the distinct values are listed
+    once under ``dictionaries`` and the rows hold their index.
+    """
+    if not records or not all(isinstance(record, dict) for record in records):
+        return records
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    rows = [[record.get(column) for column in columns] for record in records]
+    dictionaries = {}
+    for position, column in enumerate(columns):
+        values = [row[position] for row in rows if row[position] is not None]
+        if not values or not all(isinstance(value, str) for value in values):
+            continue
+        distinct = list(dict.fromkeys(values))
+        if len(distinct) * 2 > len(values):
+            continue
+        indexes = {value: i for i, value in enumerate(distinct)}
+        for row in rows:
+            if row[position] is not None:
+                row[position] = indexes[row[position]]
+        dictionaries[column] = distinct
+    table: dict = {"columns": columns, "rows": rows}
+    if dictionaries:
+        table["dictionaries"] = dictionaries
+    return table
+
+
+def format_table(data: dict | list) -> dict | list:
+    """Return ``data`` with its list of objects in the columnar table format.
+
+    The list is the response itself, or its ``results`` list (search
+    responses and paginated lists). Other responses are returned unchanged.
+    """
+    if isinstance(data, list):
+        return _table(data)
+    if isinstance(data, dict) and isinstance(data.get("results"), list):
+        return {**data, "results": _table(data["results"])}
+    return data
+
+
 def format_response(
     response: APIResponse | dict | list, response_format: str
 ) -> dict | list | str:
     """Format an API response with pagination metadata and optional string serialisation.
 
     Combines :func:`format_response_data` (pagination injection) with the
-    ``response_format`` preference coming from :func:`get_apisession`.
+    ``response_format`` preference coming from :func:`get_apisession`:
+    ``json`` returns the data, ``string`` its JSON serialisation and ``table``
+    the lists of objects as columns and rows (see :func:`format_table`).
     """
+    response_format = _format_override.get() or response_format
     if isinstance(response, APIResponse):
         logger.debug("Formatting API response with pagination metadata")
         data = format_response_data(response)
     else:
-        data = response
+        data = apply_projection(response)
     if response_format == "string":
         logger.debug("Serializing response data to JSON string")
-        return json.dumps(data)
+        return dumps(data)
+    if response_format == "table":
+        logger.debug("Converting response data to table")
+        return format_table(data)
     logger.debug("Returning response data as dict/list")
     return data
+
+
+def tool_result_data(result: ToolResult):
+    """Return the data of a tool result, parsed if it was serialized"""
+    data = result.structured_content
+    if isinstance(data, dict) and set(data) == {"result"}:
+        data = data["result"]
+    elif data is None:
+        data = "".join(
+            block.text
+            for block in result.content
+            if isinstance(block, mcp.types.TextContent)
+        )
+    if isinstance(data, str):
+        try:
+            return json.loads(data)
+        except ValueError:
+            pass
+    return data
@@ -10,12 +10,12 @@
 --------------------------------------------------------------------------------
 """
 
-import json
-
 from fastmcp.exceptions import ToolError
 from fastmcp.server.dependencies import get_context
 from mistapi.__api_response import APIResponse
 
+from mistmcp.serializer import dumps
+
 STATUS_MESSAGES = {
     400: "Bad Request. The API endpoint exists but its syntax/payload is incorrect, detail may be given",
     401: "Unauthorized",
@@ -25,34 +25,41 @@ STATUS_MESSAGES = {
 }
 
 
-async def process_response(response: APIResponse):
+def response_error(response: APIResponse) -> ToolError:
+    """Return the ToolError of a failed Mist API response"""
     if response.status_code is None:
-        raise ToolError(
+        return ToolError(
             {
                 "status_code": 503,
                 "message": "No response received from Mist API. Check network connectivity and host configuration.",
             }
         )
-    if response.status_code == 200:
-        return
-    ctx = get_context()
-    api_error = {"status_code": response.status_code, "message": ""}
     if response.status_code == 403:
-        await ctx.error(f"Got HTTP{response.status_code} with details {response.data}")
-        raise ToolError(
+        return ToolError(
             {
                 "status_code": 403,
                 "message": "Permission Denied. This usually means the you are trying to use a tool with an invalid id (e.g. `org_id`, `site_id`, ...). Do not assume the ids, make sure to retrieve them from another tool (e.g. use the `mist_get_self` tool to retrieve the correct `org_id`)",
             }
         )
-    elif response.data:
-        await ctx.error(f"Got HTTP{response.status_code} with details {response.data}")
-        api_error["message"] = json.dumps(response.data)
+    if response.data:
+        message = dumps(response.data)
     else:
-        message = STATUS_MESSAGES.get(response.status_code or 0, "Unknown error")
-        await ctx.error(f"Got HTTP{response.status_code}")
-        api_error["message"] = json.dumps(message)
-    raise ToolError(api_error)
+        message = dumps(STATUS_MESSAGES.get(response.status_code or 0, "Unknown error"))
+    return ToolError({"status_code": response.status_code, "message": message})
+
+
+async def process_response(response: APIResponse):
+    if response.status_code == 200:
+        return
+    if response.status_code is not None:
+        ctx = get_context()
+        if response.data or response.status_code == 403:
+            await ctx.error(
+                f"Got HTTP{response.status_code} with details {response.data}"
+            )
+        else:
+            await ctx.error(f"Got HTTP{response.status_code}")
+    raise response_error(response)
 
 
 async def handle_network_error(exc: Exception) -> None:
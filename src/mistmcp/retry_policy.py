@@ -0,0 +1,191 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import asyncio
+import contextvars
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+import httpx
+import requests
+from mistapi.__api_response import APIResponse
+
+from mistmcp.config import config
+from mistmcp.logger import logger
+
+T = TypeVar("T")
+
+# HTTP status codes worth retrying on idempotent requests
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+# Network errors raised by the async transport (the threaded mistapi calls
+# return an APIResponse without status code instead)
+RETRY_EXCEPTIONS = (httpx.TransportError, requests.exceptions.ConnectionError)
+
+# Monotonic time at which the current tool call must have returned
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "mistmcp_tool_deadline", default=None
+)
+
+
+@contextmanager
+def tool_deadline(seconds: float) -> Iterator[None]:
+    """Give the Mist API calls made inside this block ``seconds`` to complete.
+
+    Retries are only attempted while the deadline is not reached. A value of
+    0 or less disables the deadline.
+    """
+    reset = _deadline.set(time.monotonic() + seconds if seconds > 0 else None)
+    try:
+        yield
+    finally:
+        _deadline.reset(reset)
+
+
+class RetryPolicy:
+    """Retry policy for the transient Mist API failures.
+
+    Idempotent (GET) requests answered with HTTP 429/5xx, or failing with a
+    network error, are sent again after a jittered exponential backoff
+    (``retry_base_delay * 2**attempt``, capped at ``retry_max_delay``). When
+    the Mist Cloud sends a ``Retry-After`` header, its value is used
+    instead, also capped at ``retry_max_delay``. HTTP 429 is retried for every method since the request was not
+    processed by the Mist Cloud, after switching to the next API token when
+    the session has several (``on_rate_limited``).
+
+    A request is retried at most ``retry_max`` times, and never beyond the
+    current tool deadline (see ``tool_deadline()``), so the caller only gets
+    the failures that outlive the policy.
+    """
+
+    def __init__(
+        self,
+        max_retries: int | None = None,
+        base_delay: float | None = None,
+        max_delay: float | None = None,
+    ) -> None:
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._retries = 0
+        self._recovered = 0
+        self._exhausted = 0
+        self._deadline_exceeded = 0
+
+    @property
+    def max_retries(self) -> int:
+        return self._max_retries if self._max_retries is not None else config.retry_max
+
+    @property
+    def base_delay(self) -> float:
+        return (
+            self._base_delay
+            if self._base_delay is not None
+            else config.retry_base_delay
+        )
+
+    @property
+    def max_delay(self) -> float:
+        return (
+            self._max_delay if self._max_delay is not None else config.retry_max_delay
+        )
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the retry counters."""
+        return {
+            "retries": self._retries,
+            "recovered": self._recovered,
+            "exhausted": self._exhausted,
+            "deadline_exceeded": self._deadline_exceeded,
+        }
+
+    @staticmethod
+    def should_retry(response: Any, idempotent: bool) -> bool:
+        """Return True if ``response`` is a transient failure worth retrying."""
+        if not isinstance(response, APIResponse):
+            return False
+        if response.status_code == 429:
+            return True
+        if not idempotent:
+            return False
+        if response.status_code is None:
+            # No response received (connection error), except proxy errors
+            return not response.proxy_error
+        return response.status_code in RETRY_STATUS_CODES
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Return the number of seconds to wait before the retry ``attempt``."""
+        if retry_after:
+            try:
+                return min(self.max_delay, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        backoff = min(self.max_delay, self.base_delay * 2**attempt)
+        # Equal jitter, so concurrent calls do not retry at the same time
+        return backoff / 2 + random.uniform(0, backoff / 2)
+
+    def _next_delay(self, attempt: int, retry_after: str | None) -> float | None:
+        """Return the delay before the next attempt, or None to give up"""
+        if attempt >= self.max_retries:
+            self._exhausted += 1
+            return None
+        wait = self.delay(attempt, retry_after)
+        deadline = _deadline.get()
+        if deadline is not None and time.monotonic() + wait > deadline:
+            self._deadline_exceeded += 1
+            return None
+        return wait
+
+    async def run(
+        self,
+        send: Callable[[], Awaitable[T]],
+        idempotent: bool = True,
+        on_rate_limited: Callable[[], None] | None = None,
+    ) -> T:
+        """Call ``send()`` and retry it while the policy allows it.
+
+        ``on_rate_limited`` is called before retrying an HTTP 429.
+        """
+        attempt = 0
+        while True:
+            try:
+                response = await send()
+            except RETRY_EXCEPTIONS as exc:
+                wait = self._next_delay(attempt, None) if idempotent else None
+                if wait is None:
+                    raise
+                logger.warning("Mist API call failed: %s. Retrying in %.1fs", exc, wait)
+            else:
+                if not self.should_retry(response, idempotent):
+                    if attempt:
+                        self._recovered += 1
+                    return response
+                headers = response.headers or {}
+                wait = self._next_delay(attempt, headers.get("Retry-After"))
+                if wait is None:
+                    return response
+                if response.status_code == 429 and on_rate_limited is not None:
+                    on_rate_limited()
+                logger.warning(
+                    "Mist API call returned HTTP%s. Retrying in %.1fs",
+                    response.status_code,
+                    wait,
+                )
+            attempt += 1
+            self._retries += 1
+            await asyncio.sleep(wait)
+
+
+# Process-wide retry policy shared by every tool
+retry_policy = RetryPolicy()
@@ -0,0 +1,69 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import datetime
+import json
+import uuid
+
+from mistmcp.config import config
+from mistmcp.logger import logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SERIALIZERS = ("auto", "orjson", "json")
+
+
+def _default(value):
+    """Serialize the values the stdlib encoder does not support."""
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return str(value)
+
+
+def backend() -> str:
+    """Return the name of the serializer in use (``orjson`` or ``json``).
+
+    ``config.serializer`` selects it: ``auto`` uses orjson when it is
+    installed, ``json`` always uses the standard library.
+    """
+    if config.serializer == "json" or orjson is None:
+        if config.serializer == "orjson":
+            logger.warning("orjson is not installed, using the json serializer")
+            config.serializer = "json"
+        return "json"
+    return "orjson"
+
+
+def dumps(data, pretty: bool = False) -> str:
+    """Serialize ``data`` to a JSON string.
+
+    The output is compact unless ``pretty`` is set. UUIDs and dates are
+    serialized as strings (ISO 8601 for the dates), and any other
+    unsupported value with ``str()``.
+    """
+    if backend() == "orjson":
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=_default, option=option).decode()
+        except TypeError:
+            # e.g. integers larger than 64 bits, left to the json module
+            pass
+    if pretty:
+        return json.dumps(data, default=_default, indent=2)
+    return json.dumps(data, default=_default, separators=(",", ":"))
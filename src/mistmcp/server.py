@@ -14,12 +14,34 @@ import importlib
 
 from fastmcp import FastMCP
 from fastmcp.server.transforms import Visibility
+from starlette.requests import Request
+from starlette.responses import JSONResponse
 
+from mistmcp.aggregate_middleware import aggregate_middleware
+from mistmcp.async_transport import async_transport
+from mistmcp.auto_paginate_middleware import auto_paginate_middleware
 from mistmcp.config import ServerConfig
+from mistmcp.config_cache import config_cache
+from mistmcp.constants_cache import constants_cache
+from mistmcp.cursor_store import cursor_store
+from mistmcp.deadline_middleware import DeadlineMiddleware
 from mistmcp.elicitation_middleware import ElicitationMiddleware
+from mistmcp.fan_out_middleware import fan_out_middleware
+from mistmcp.field_projection import projection_stats
+from mistmcp.fields_middleware import FieldsMiddleware
 from mistmcp.logger import logger
 from mistmcp.null_strip_middleware import NullStripMiddleware
+from mistmcp.object_index import object_index
+from mistmcp.prefetch_middleware import prefetch_middleware
+from mistmcp.rate_limiter import rate_limiter
+from mistmcp.request_executor import request_executor
+from mistmcp.retry_policy import retry_policy
+from mistmcp.session_pool import session_pool
+from mistmcp.sharded_search_middleware import sharded_search_middleware
+from mistmcp.single_flight import single_flight
 from mistmcp.tool_helper import TOOLS
+from mistmcp.watermark_middleware import watermark_middleware
+from mistmcp.watermark_store import watermark_store
 
 _instructions = """
 Juniper Mist Cloud MCP server for managing and monitoring Wi-Fi, LAN, WAN, and NAC networks.
@@ -149,7 +171,18 @@ mcp = FastMCP(
     instructions=_instructions,
     on_duplicate="replace",
     mask_error_details=True,
-    middleware=[NullStripMiddleware(), ElicitationMiddleware()],
+    middleware=[
+        NullStripMiddleware(),
+        ElicitationMiddleware(),
+        FieldsMiddleware(),
+        prefetch_middleware,
+        watermark_middleware,
+        aggregate_middleware,
+        sharded_search_middleware,
+        auto_paginate_middleware,
+        fan_out_middleware,
+        DeadlineMiddleware(),
+    ],
 )
 
 # Write tools are disabled by default and enabled per-session by
@@ -158,6 +191,33 @@ mcp = FastMCP(
 mcp.add_transform(Visibility(False, tags={"write"}, components={"tool"}))
 
 
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> JSONResponse:
+    """Expose the server runtime counters (HTTP transport only)."""
+    return JSONResponse(
+        {
+            "executor": request_executor.stats(),
+            "sessions": session_pool.stats(),
+            "async_transport": async_transport.stats(),
+            "rate_limiter": rate_limiter.stats(),
+            "retries": retry_policy.stats(),
+            "single_flight": single_flight.stats(),
+            "constants_cache": constants_cache.stats(),
+            "config_cache": config_cache.stats(),
+            "object_index": object_index.stats(),
+            "cursor_store": cursor_store.stats(),
+            "fan_out": fan_out_middleware.stats(),
+            "field_projection": projection_stats.stats(),
+            "prefetch": prefetch_middleware.stats(),
+            "auto_paginate": auto_paginate_middleware.stats(),
+            "sharded_search": sharded_search_middleware.stats(),
+            "aggregate": aggregate_middleware.stats(),
+            "watermark_store": watermark_store.stats(),
+            "watermark": watermark_middleware.stats(),
+        }
+    )
+
+
 def _load_tools(config: ServerConfig) -> list[str]:
     """Load all available tools into the MCP server"""
     loaded_tools: list[str] = []
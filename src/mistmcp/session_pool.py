@@ -0,0 +1,163 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+
+import mistapi
+from requests.adapters import HTTPAdapter
+
+from mistmcp.config import config
+from mistmcp.logger import logger, mask_token, token_hash
+from mistmcp.request_executor import request_executor, session_leases
+
+
+class SessionPool:
+    """LRU/TTL pool of ``mistapi.APISession`` objects keyed by cloud and token.
+
+    Creating an APISession validates the API token against the Mist Cloud and
+    starts a new ``requests`` session, so building one per tool call costs an
+    extra round trip and a new TCP+TLS handshake every time. Sessions are kept
+    here and reused by the following calls with the same cloud and token,
+    which keeps the HTTPS keep-alive connections warm.
+
+    - ``max_size``: max number of sessions kept, the least recently used one
+      is closed when the pool is full
+    - ``idle_ttl``: sessions not used for this number of seconds are closed
+
+    An evicted session still used by calls in flight is only closed when
+    the last of them completes (see ``request_executor.SessionLeases``).
+    - ``connections``: size of the per-host HTTP connection pool mounted on
+      each session (defaults to the request executor worker cap)
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        idle_ttl: float | None = None,
+        connections: int | None = None,
+    ) -> None:
+        self._max_size = max_size
+        self._idle_ttl = idle_ttl
+        self._connections = connections
+        self._sessions: OrderedDict[
+            tuple[str, str], tuple[mistapi.APISession, float]
+        ] = OrderedDict()
+        self._pending: dict[tuple[str, str], asyncio.Future] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        return max(1, self._max_size or config.session_pool_size)
+
+    @property
+    def idle_ttl(self) -> float:
+        return self._idle_ttl if self._idle_ttl is not None else config.session_idle_ttl
+
+    @property
+    def connections(self) -> int:
+        return max(
+            1, self._connections or config.session_connections or config.max_workers
+        )
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the pool counters."""
+        return {
+            "size": len(self._sessions),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+    def _create_session(self, cloud: str, apitoken: str) -> mistapi.APISession:
+        apisession = mistapi.APISession(host=cloud, apitoken=apitoken)
+        adapter = HTTPAdapter(
+            pool_connections=self.connections, pool_maxsize=self.connections
+        )
+        apisession._session.mount("https://", adapter)
+        # HTTP 429 are retried by the retry policy without blocking a worker,
+        # rotating the API tokens of the session (see request_executor)
+        apisession._MAX_429_RETRIES = 0
+        return apisession
+
+    def _close(self, key: tuple[str, str]) -> None:
+        apisession, _ = self._sessions.pop(key)
+        self._evictions += 1
+        session_leases.close(apisession, apisession._session.close)
+
+    def _evict(self) -> None:
+        if self.idle_ttl > 0:
+            expiry = time.monotonic() - self.idle_ttl
+            for key in [k for k, (_, used) in self._sessions.items() if used < expiry]:
+                logger.debug("Session pool: closing idle session for %s", key[0])
+                self._close(key)
+        while len(self._sessions) > self.max_size:
+            key = next(iter(self._sessions))
+            logger.debug(
+                "Session pool: closing least recently used session for %s", key[0]
+            )
+            self._close(key)
+
+    async def get(self, cloud: str, apitoken: str) -> mistapi.APISession:
+        """Return a pooled APISession for this cloud/token, creating it if needed."""
+        key = (cloud, token_hash(apitoken))
+        self._evict()
+
+        entry = self._sessions.get(key)
+        if entry is not None:
+            self._hits += 1
+            self._sessions[key] = (entry[0], time.monotonic())
+            self._sessions.move_to_end(key)
+            return entry[0]
+
+        # Concurrent calls with the same token share the session being created.
+        # The creation runs in its own task so a cancelled caller does not
+        # abort it for the others.
+        task = self._pending.get(key)
+        if task is None:
+            self._misses += 1
+            logger.debug(
+                "Session pool: creating session for %s, token: %s",
+                cloud,
+                mask_token(apitoken),
+            )
+            task = asyncio.ensure_future(
+                request_executor.run(self._create_session, cloud, apitoken)
+            )
+            self._pending[key] = task
+            task.add_done_callback(lambda done: self._store(key, done))
+        else:
+            self._hits += 1
+        return await asyncio.shield(task)
+
+    def _store(self, key: tuple[str, str], task: asyncio.Future) -> None:
+        self._pending.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        apisession = task.result()
+        # Do not keep sessions whose token was rejected by the Mist Cloud
+        if apisession._apitoken:
+            self._sessions[key] = (apisession, time.monotonic())
+            self._evict()
+
+    def clear(self) -> None:
+        """Close and forget every pooled session."""
+        for key in list(self._sessions):
+            self._close(key)
+
+
+# Process-wide pool shared by every tool
+session_pool = SessionPool()
@@ -0,0 +1,329 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import asyncio
+import heapq
+import threading
+from collections.abc import Iterable, Sequence
+
+import mcp.types
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools.tool import Tool, ToolResult
+
+from mistmcp.auto_paginate_middleware import (
+    MAX_PAGE_SIZE,
+    combine_records,
+    follow_pages,
+    page_records,
+    report_progress,
+    tool_result,
+)
+from mistmcp.config import config
+from mistmcp.logger import logger
+from mistmcp.rate_limiter import rate_limiter
+from mistmcp.request_processor import get_apisession
+from mistmcp.response_formatter import (
+    format_response,
+    response_format_override,
+    tool_result_data,
+)
+from mistmcp.serializer import dumps
+
+# Search tools accepting a ``shards`` parameter
+SHARDED_SEARCH_TOOLS = {"mist_search_events"}
+
+# Shortest time window queried by a shard, in seconds
+MIN_SHARD_SECONDS = 60
+
+
+def _shards_schema() -> dict:
+    return {
+        "type": "integer",
+        "minimum": 2,
+        "maximum": config.max_search_shards,
+        "description": f"Split the `start`/`end` time range into this number of time windows (max {config.max_search_shards}), searched in parallel, and return every event of the time range at once, sorted by timestamp. Use it for time ranges with many events (e.g. a week of device events of an org). Requires `start` and `end`. `max_records` limits the number of events retrieved (default: {config.max_records})",
+    }
+
+
+def time_windows(start: int, end: int, shards: int) -> list[tuple[int, int]]:
+    """Split ``start``-``end`` into ``shards`` windows, most recent first"""
+    shards = max(1, min(shards, (end - start) // MIN_SHARD_SECONDS))
+    bounds = [start + (end - start) * i // shards for i in range(shards + 1)]
+    return [(bounds[i], bounds[i + 1]) for i in reversed(range(shards))]
+
+
+def _timestamp(record) -> float:
+    if isinstance(record, dict):
+        try:
+            return float(record.get("timestamp") or 0)
+        except (TypeError, ValueError):
+            pass
+    return 0
+
+
+def merge_windows(windows: Iterable[list]) -> list:
+    """K-way merge the records of the time windows, most recent first.
+
+    The records of each window are sorted by timestamp, most recent first,
+    as returned by the Mist API. The events at the edge of two windows may
+    be returned by both searches, identical records with the same timestamp
+    are only kept once.
+    """
+    merged = []
+    current = None
+    seen: set[str] = set()
+    for record in heapq.merge(*windows, key=_timestamp, reverse=True):
+        timestamp = _timestamp(record)
+        if timestamp != current:
+            current = timestamp
+            seen = set()
+        key = dumps(record)
+        if key in seen:
+            continue
+        seen.add(key)
+        merged.append(record)
+    return merged
+
+
+async def _gather(aws: Iterable) -> list:
+    """Like ``asyncio.gather()``, but cancel the other awaitables as soon as
+    one of them fails (``asyncio.TaskGroup`` requires Python 3.11)."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def complete_until(window_records: Iterable[tuple[list, str | None, int]]) -> float:
+    """Return the timestamp from which the merged records are complete.
+
+    ``window_records`` are the records of each window, the ``next`` URL of
+    its last page retrieved and the window end. The events older than the
+    last record of a truncated window were not retrieved, so the events of
+    the older windows cannot follow the ones of the truncated window.
+    """
+    until = float("-inf")
+    for records, next_url, end in window_records:
+        if next_url:
+            until = max(until, _timestamp(records[-1]) if records else end)
+    return until
+
+
+class ShardedSearchMiddleware(Middleware):
+    """Search a large time range as parallel searches of smaller windows.
+
+    The Mist API returns the events of a search through a chain of ``next``
+    pages, retrieved one after the other. The tools of
+    ``SHARDED_SEARCH_TOOLS`` are listed with an additional ``shards``
+    parameter: when it is used, the ``start``-``end`` range is split into
+    ``shards`` time windows searched in parallel, each one following its
+    own ``next`` pages. The events of the windows are merged by timestamp
+    (see ``merge_windows()``) and returned in a single response (see
+    ``auto_paginate_middleware.combine_records()``).
+
+    The number of events retrieved is limited by ``max_records`` if set,
+    otherwise by ``config.max_records``, first shared between the windows.
+    When a window is truncated, only the merged events more recent than its
+    last event are returned (see ``complete_until()``): the most recent
+    truncated window is then paged further, with the budget left unused by
+    the windows before it, until ``max_records`` contiguous events are
+    retrieved. When a window search fails, the other ones are cancelled.
+    When less than twice
+    ``config.rate_limit_reserve`` calls are left in the hourly budget of the
+    API token, the time range is searched as a single window.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._searches = 0
+        self._shards = 0
+        self._pages = 0
+        self._duplicates = 0
+        self._throttled = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the sharded search counters."""
+        with self._lock:
+            return {
+                "searches": self._searches,
+                "shards": self._shards,
+                "pages": self._pages,
+                "duplicates": self._duplicates,
+                "throttled": self._throttled,
+            }
+
+    async def on_list_tools(
+        self,
+        context: MiddlewareContext[mcp.types.ListToolsRequest],
+        call_next,
+    ) -> Sequence[Tool]:
+        tools = await call_next(context)
+        return [self._with_shards(tool) for tool in tools]
+
+    @staticmethod
+    def _with_shards(tool: Tool) -> Tool:
+        if tool.name not in SHARDED_SEARCH_TOOLS:
+            return tool
+        parameters = dict(tool.parameters)
+        properties = dict(parameters.get("properties", {}))
+        properties["shards"] = _shards_schema()
+        parameters["properties"] = properties
+        return tool.model_copy(update={"parameters": parameters})
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mcp.types.CallToolRequestParams],
+        call_next,
+    ) -> ToolResult:
+        message = context.message
+        arguments = message.arguments or {}
+        if message.name not in SHARDED_SEARCH_TOOLS or "shards" not in arguments:
+            return await call_next(context)
+
+        arguments = dict(arguments)
+        shards = arguments.pop("shards")
+        max_records = arguments.pop("max_records", None) or config.max_records
+        try:
+            start, end = int(arguments["start"]), int(arguments["end"])
+        except (KeyError, TypeError, ValueError):
+            start = end = 0
+        if start >= end:
+            raise ToolError(
+                {
+                    "status_code": 400,
+                    "message": "`shards` requires the `start` and `end` of the time range, with `start` before `end`",
+                }
+            )
+        if not isinstance(shards, int) or shards < 1:
+            raise ToolError(
+                {"status_code": 400, "message": "`shards` must be a positive integer"}
+            )
+        shards = min(shards, config.max_search_shards)
+        max_records = min(max_records, config.max_records)
+
+        apisession, response_format = await get_apisession()
+        if (
+            rate_limiter.limit > 0
+            and rate_limiter.session_remaining(apisession) < 2 * rate_limiter.reserve
+        ):
+            with self._lock:
+                self._throttled += 1
+            logger.debug(
+                "ShardedSearchMiddleware: single window, API call budget under pressure"
+            )
+            shards = 1
+        windows = time_windows(start, end, shards)
+        # records first retrieved by each window, its share of max_records
+        window_records = -(-max_records // len(windows))
+        if arguments.get("limit") is None:
+            arguments["limit"] = min(MAX_PAGE_SIZE, window_records)
+        # records, next URL of the last page retrieved and pages of each window
+        shard_records: list[list] = [[] for _ in windows]
+        next_urls: list[str | None] = [None] * len(windows)
+        pages = [0] * len(windows)
+        errors: list[str] = []
+
+        async def _on_page() -> None:
+            await report_progress(context, sum(map(len, shard_records)), max_records)
+
+        async def _follow(position: int, limit: int) -> None:
+            next_urls[position], window_pages, error = await follow_pages(
+                apisession,
+                shard_records[position],
+                next_urls[position],
+                limit,
+                _on_page,
+            )
+            pages[position] += window_pages
+            if error is not None:
+                errors.append(error)
+
+        async def _search(position: int, window: tuple[int, int]) -> None:
+            window_message = message.model_copy(
+                update={
+                    "arguments": {**arguments, "start": window[0], "end": window[1]}
+                }
+            )
+            with response_format_override("json"):
+                data = tool_result_data(
+                    await call_next(context.copy(message=window_message))
+                )
+            shard_records[position] += page_records(data)
+            next_urls[position] = data.get("next") if isinstance(data, dict) else None
+            pages[position] = 1
+            await _on_page()
+            await _follow(position, window_records)
+
+        await _gather(
+            _search(position, window) for position, window in enumerate(windows)
+        )
+        # Only the events more recent than the last event of the most recent
+        # truncated window are contiguous: keep paging this window, with the
+        # budget left unused by the windows before it, until max_records
+        # contiguous events are retrieved or the window is complete
+        while not errors:
+            position = next(
+                (position for position, url in enumerate(next_urls) if url), None
+            )
+            if position is None:
+                break
+            contiguous = sum(map(len, shard_records[: position + 1]))
+            if contiguous >= max_records:
+                break
+            await _follow(
+                position, len(shard_records[position]) + max_records - contiguous
+            )
+
+        fetched = sum(map(len, shard_records))
+        until = complete_until(
+            (found, next_url, window[1])
+            for found, next_url, window in zip(shard_records, next_urls, windows)
+        )
+        merged = merge_windows(shard_records)
+        records = [record for record in merged if _timestamp(record) >= until]
+        complete = all(next_url is None for next_url in next_urls)
+
+        with self._lock:
+            self._searches += 1
+            self._shards += len(windows)
+            self._pages += sum(pages)
+            self._duplicates += fetched - len(merged)
+        logger.debug(
+            "ShardedSearchMiddleware: %s retrieved %d records from %d windows",
+            message.name,
+            len(records),
+            len(windows),
+        )
+
+        # Each window retrieved its most recent events, so the events kept
+        # are the most recent of the time range
+        combined = combine_records(
+            apisession,
+            records[:max_records],
+            None,
+            None,
+            errors[0] if errors else None,
+        )
+        if not complete or len(records) > max_records:
+            combined["has_more"] = True
+            if not errors and "message" not in combined:
+                combined["message"] = (
+                    f"Only the {min(len(records), max_records)} most recent events of the time range were retrieved. Narrow the time range, or increase `max_records`, to retrieve the others."
+                )
+        return tool_result(format_response(combined, response_format))
+
+
+# Shared instance, registered in the server middleware and read by /metrics
+sharded_search_middleware = ShardedSearchMiddleware()
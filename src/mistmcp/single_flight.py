@@ -0,0 +1,90 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import asyncio
+import copy
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from mistapi.__api_response import APIResponse
+
+from mistmcp.logger import logger
+
+T = TypeVar("T")
+
+
+def copy_result(result: Any) -> Any:
+    """Return a copy of a shared result that a caller can modify freely"""
+    if isinstance(result, APIResponse):
+        response = copy.copy(result)
+        response.data = copy.deepcopy(result.data)
+        return response
+    return copy.deepcopy(result)
+
+
+class _Flight:
+    """Request in flight and the number of callers waiting for it."""
+
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+        self.waiters = 1
+
+
+class SingleFlight:
+    """Share one upstream request between identical concurrent calls.
+
+    When several tool calls send the same GET request (same API token,
+    method, URL and query string) at the same time, only the first one is
+    sent to the Mist Cloud and the others wait for its result. Each caller
+    gets its own copy of the result when it was shared, since the tools
+    modify the responses they receive.
+
+    The request runs in its own task, so a cancelled caller does not abort
+    it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[tuple, _Flight] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the single-flight counters."""
+        return {
+            "in_flight": len(self._flights),
+            "leaders": self._leaders,
+            "coalesced": self._coalesced,
+        }
+
+    async def do(self, key: tuple, func: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of ``func()``, shared with the calls using the same key.
+
+        ``key`` starts with the API token hash, which is left out of the logs.
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            self._leaders += 1
+            flight = _Flight(asyncio.ensure_future(func()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._flights.pop(key, None))
+        else:
+            self._coalesced += 1
+            flight.waiters += 1
+            logger.debug("Single-flight: joining request in flight for %s", key[1:])
+        result = await asyncio.shield(flight.task)
+        if flight.waiters > 1:
+            return copy_result(result)
+        return result
+
+
+# Process-wide single-flight group shared by every tool
+single_flight = SingleFlight()
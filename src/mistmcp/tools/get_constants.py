@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -68,64 +69,62 @@ async def get_constants(
     try:
         match object_type.value:
             case "fingerprint_types":
-                response = mistapi.api.v1.const.fingerprint_types.listFingerprintTypes(
-                    apisession
+                response = await mist_call(
+                    mistapi.api.v1.const.fingerprint_types.listFingerprintTypes,
+                    apisession,
                 )
                 await process_response(response)
             case "insight_metrics":
-                response = mistapi.api.v1.const.insight_metrics.listInsightMetrics(
-                    apisession
+                response = await mist_call(
+                    mistapi.api.v1.const.insight_metrics.listInsightMetrics, apisession
                 )
                 await process_response(response)
             case "license_types":
-                response = mistapi.api.v1.const.license_types.listLicenseTypes(
-                    apisession
+                response = await mist_call(
+                    mistapi.api.v1.const.license_types.listLicenseTypes, apisession
                 )
                 await process_response(response)
             case "webhook_topics":
-                response = mistapi.api.v1.const.webhook_topics.listWebhookTopics(
-                    apisession
+                response = await mist_call(
+                    mistapi.api.v1.const.webhook_topics.listWebhookTopics, apisession
                 )
                 await process_response(response)
             case "device_models":
-                response = mistapi.api.v1.const.device_models.listDeviceModels(
-                    apisession
+                response = await mist_call(
+                    mistapi.api.v1.const.device_models.listDeviceModels, apisession
                 )
                 await process_response(response)
             case "device_events":
-                response = (
-                    mistapi.api.v1.const.device_events.listDeviceEventsDefinitions(
-                        apisession
-                    )
+                response = await mist_call(
+                    mistapi.api.v1.const.device_events.listDeviceEventsDefinitions,
+                    apisession,
                 )
                 await process_response(response)
             case "mxedge_models":
-                response = mistapi.api.v1.const.mxedge_models.listMxEdgeModels(
-                    apisession
+                response = await mist_call(
+                    mistapi.api.v1.const.mxedge_models.listMxEdgeModels, apisession
                 )
                 await process_response(response)
             case "alarm_definitions":
-                response = mistapi.api.v1.const.alarm_defs.listAlarmDefinitions(
-                    apisession
+                response = await mist_call(
+                    mistapi.api.v1.const.alarm_defs.listAlarmDefinitions, apisession
                 )
                 await process_response(response)
             case "client_events":
-                response = (
-                    mistapi.api.v1.const.client_events.listClientEventsDefinitions(
-                        apisession
-                    )
+                response = await mist_call(
+                    mistapi.api.v1.const.client_events.listClientEventsDefinitions,
+                    apisession,
                 )
                 await process_response(response)
             case "mxedge_events":
-                response = (
-                    mistapi.api.v1.const.mxedge_events.listMxEdgeEventsDefinitions(
-                        apisession
-                    )
+                response = await mist_call(
+                    mistapi.api.v1.const.mxedge_events.listMxEdgeEventsDefinitions,
+                    apisession,
                 )
                 await process_response(response)
             case "nac_events":
-                response = mistapi.api.v1.const.nac_events.listNacEventsDefinitions(
-                    apisession
+                response = await mist_call(
+                    mistapi.api.v1.const.nac_events.listNacEventsDefinitions, apisession
                 )
                 await process_response(response)
 
@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -114,7 +115,8 @@ async def get_insight_metrics(
     try:
         match object_type.value:
             case "site":
-                response = mistapi.api.v1.sites.insights.getSiteInsightMetrics(
+                response = await mist_call(
+                    mistapi.api.v1.sites.insights.getSiteInsightMetrics,
                     apisession,
                     site_id=str(site_id),
                     metrics=str(metric),
@@ -127,7 +129,8 @@ async def get_insight_metrics(
                 )
                 await process_response(response)
             case "client":
-                response = mistapi.api.v1.sites.insights.getSiteInsightMetricsForClient(
+                response = await mist_call(
+                    mistapi.api.v1.sites.insights.getSiteInsightMetricsForClient,
                     apisession,
                     site_id=str(site_id),
                     client_mac=str(mac),
@@ -141,7 +144,8 @@ async def get_insight_metrics(
                 )
                 await process_response(response)
             case "ap":
-                response = mistapi.api.v1.sites.insights.getSiteInsightMetricsForDevice(
+                response = await mist_call(
+                    mistapi.api.v1.sites.insights.getSiteInsightMetricsForDevice,
                     apisession,
                     site_id=str(site_id),
                     device_mac=str(mac),
@@ -155,23 +159,23 @@ async def get_insight_metrics(
                 )
                 await process_response(response)
             case "gateway":
-                response = (
-                    mistapi.api.v1.sites.insights.getSiteInsightMetricsForGateway(
-                        apisession,
-                        site_id=str(site_id),
-                        device_id=str(device_id),
-                        metrics=str(metric),
-                        start=str(start) if start else None,
-                        end=str(end) if end else None,
-                        duration=str(duration) if duration else None,
-                        interval=str(interval) if interval else None,
-                        limit=limit,
-                        page=page,
-                    )
+                response = await mist_call(
+                    mistapi.api.v1.sites.insights.getSiteInsightMetricsForGateway,
+                    apisession,
+                    site_id=str(site_id),
+                    device_id=str(device_id),
+                    metrics=str(metric),
+                    start=str(start) if start else None,
+                    end=str(end) if end else None,
+                    duration=str(duration) if duration else None,
+                    interval=str(interval) if interval else None,
+                    limit=limit,
+                    page=page,
                 )
                 await process_response(response)
             case "mxedge":
-                response = mistapi.api.v1.sites.insights.getSiteInsightMetricsForMxEdge(
+                response = await mist_call(
+                    mistapi.api.v1.sites.insights.getSiteInsightMetricsForMxEdge,
                     apisession,
                     site_id=str(site_id),
                     device_mac=str(mac),
@@ -185,7 +189,8 @@ async def get_insight_metrics(
                 )
                 await process_response(response)
             case "switch":
-                response = mistapi.api.v1.sites.insights.getSiteInsightMetricsForSwitch(
+                response = await mist_call(
+                    mistapi.api.v1.sites.insights.getSiteInsightMetricsForSwitch,
                     apisession,
                     site_id=str(site_id),
                     device_mac=str(mac),
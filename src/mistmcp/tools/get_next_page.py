@@ -16,6 +16,10 @@ from pydantic import Field
 
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.cursor_store import cursor_store, is_cursor
+from mistmcp.prefetch_middleware import prefetch_middleware
+from mistmcp.rate_limiter import low_priority, session_key
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -47,8 +51,22 @@ async def get_next_page(
 
     apisession, response_format = await get_apisession()
 
+    if is_cursor(url):
+        data = cursor_store.page(session_key(apisession), url)
+        if data is None:
+            raise ToolError(
+                {
+                    "status_code": 404,
+                    "message": "The results of this cursor expired. Repeat the initial request to get them again.",
+                }
+            )
+        return format_response(data, response_format)
+
     try:
-        response = apisession.mist_get(url)
+        response = await prefetch_middleware.take(apisession, url)
+        if response is None:
+            with low_priority():
+                response = await mist_call(apisession.mist_get, url)
         await process_response(response)
     except ToolError:
         raise
@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -65,18 +66,24 @@ async def get_org_licenses(
         object_type = response_type
         match object_type.value:
             case "claim_status":
-                response = mistapi.api.v1.orgs.claim.GetOrgLicenseAsyncClaimStatus(
-                    apisession, org_id=str(org_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.claim.GetOrgLicenseAsyncClaimStatus,
+                    apisession,
+                    org_id=str(org_id),
                 )
                 await process_response(response)
             case "by_site":
-                response = mistapi.api.v1.orgs.licenses.getOrgLicensesBySite(
-                    apisession, org_id=str(org_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.licenses.getOrgLicensesBySite,
+                    apisession,
+                    org_id=str(org_id),
                 )
                 await process_response(response)
             case "summary":
-                response = mistapi.api.v1.orgs.licenses.getOrgLicensesSummary(
-                    apisession, org_id=str(org_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.licenses.getOrgLicensesSummary,
+                    apisession,
+                    org_id=str(org_id),
                 )
                 await process_response(response)
 
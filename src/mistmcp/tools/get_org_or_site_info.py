@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -68,19 +69,23 @@ async def get_org_or_site_info(
         object_type = info_type
         match object_type.value:
             case "org":
-                response = mistapi.api.v1.orgs.orgs.getOrg(
-                    apisession, org_id=str(org_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.orgs.getOrg, apisession, org_id=str(org_id)
                 )
                 await process_response(response)
             case "site":
                 if site_id:
-                    response = mistapi.api.v1.sites.sites.getSiteInfo(
-                        apisession, site_id=str(site_id)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.sites.getSiteInfo,
+                        apisession,
+                        site_id=str(site_id),
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.sites.listOrgSites(
-                        apisession, org_id=str(org_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.sites.listOrgSites,
+                        apisession,
+                        org_id=str(org_id),
                     )
                     await process_response(response)
 
@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -76,7 +77,8 @@ async def get_org_sites_sle(
     apisession, response_format = await get_apisession()
 
     try:
-        response = mistapi.api.v1.orgs.insights.getOrgSitesSle(
+        response = await mist_call(
+            mistapi.api.v1.orgs.insights.getOrgSitesSle,
             apisession,
             org_id=str(org_id),
             sle=sle.value,
@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -73,7 +74,8 @@ async def get_org_sle(
     apisession, response_format = await get_apisession()
 
     try:
-        response = mistapi.api.v1.orgs.insights.getOrgSle(
+        response = await mist_call(
+            mistapi.api.v1.orgs.insights.getOrgSle,
             apisession,
             org_id=str(org_id),
             metric=str(metric),
@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -69,14 +70,16 @@ async def get_self(
         object_type = action_type
         match object_type.value:
             case "account_info":
-                response = mistapi.api.v1.self.self.getSelf(apisession)
+                response = await mist_call(mistapi.api.v1.self.self.getSelf, apisession)
                 await process_response(response)
             case "api_usage":
-                response = mistapi.api.v1.self.usage.getSelfApiUsage(apisession)
+                response = await mist_call(
+                    mistapi.api.v1.self.usage.getSelfApiUsage, apisession
+                )
                 await process_response(response)
             case "login_failures":
-                response = mistapi.api.v1.self.login_failures.getSelfLoginFailures(
-                    apisession
+                response = await mist_call(
+                    mistapi.api.v1.self.login_failures.getSelfLoginFailures, apisession
                 )
                 await process_response(response)
 
@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -177,7 +178,8 @@ async def get_site_rrm_info(
 
         match object_type.value:
             case "channel_scores":
-                response = mistapi.api.v1.sites.rrm.getSiteChannelScores(
+                response = await mist_call(
+                    mistapi.api.v1.sites.rrm.getSiteChannelScores,
                     apisession,
                     site_id=str(site_id),
                     band=str(band.value),
@@ -186,12 +188,15 @@ async def get_site_rrm_info(
                 )
                 await process_response(response)
             case "current_channel_planning":
-                response = mistapi.api.v1.sites.rrm.getSiteCurrentChannelPlanning(
-                    apisession, site_id=str(site_id)
+                response = await mist_call(
+                    mistapi.api.v1.sites.rrm.getSiteCurrentChannelPlanning,
+                    apisession,
+                    site_id=str(site_id),
                 )
                 await process_response(response)
             case "current_rrm_considerations":
-                response = mistapi.api.v1.sites.rrm.getSiteCurrentRrmConsiderations(
+                response = await mist_call(
+                    mistapi.api.v1.sites.rrm.getSiteCurrentRrmConsiderations,
                     apisession,
                     site_id=str(site_id),
                     device_id=str(device_id),
@@ -199,12 +204,16 @@ async def get_site_rrm_info(
                 )
                 await process_response(response)
             case "current_rrm_neighbors":
-                response = mistapi.api.v1.sites.rrm.listSiteCurrentRrmNeighbors(
-                    apisession, site_id=str(site_id), band=str(band.value)
+                response = await mist_call(
+                    mistapi.api.v1.sites.rrm.listSiteCurrentRrmNeighbors,
+                    apisession,
+                    site_id=str(site_id),
+                    band=str(band.value),
                 )
                 await process_response(response)
             case "events":
-                response = mistapi.api.v1.sites.rrm.listSiteRrmEvents(
+                response = await mist_call(
+                    mistapi.api.v1.sites.rrm.listSiteRrmEvents,
                     apisession,
                     site_id=str(site_id),
                     band=band.value if band else None,
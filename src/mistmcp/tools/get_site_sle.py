@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -129,7 +130,8 @@ async def get_site_sle(
 
         match object_type.value:
             case "summary":
-                response = mistapi.api.v1.sites.sle.getSiteSleSummary(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.getSiteSleSummary,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -141,7 +143,8 @@ async def get_site_sle(
                 )
                 await process_response(response)
             case "impact_summary":
-                response = mistapi.api.v1.sites.sle.getSiteSleImpactSummary(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.getSiteSleImpactSummary,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -153,7 +156,8 @@ async def get_site_sle(
                 )
                 await process_response(response)
             case "summary_trend":
-                response = mistapi.api.v1.sites.sle.getSiteSleSummaryTrend(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.getSiteSleSummaryTrend,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -165,7 +169,8 @@ async def get_site_sle(
                 )
                 await process_response(response)
             case "impacted_applications":
-                response = mistapi.api.v1.sites.sle.listSiteSleImpactedApplications(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.listSiteSleImpactedApplications,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -177,7 +182,8 @@ async def get_site_sle(
                 )
                 await process_response(response)
             case "impacted_aps":
-                response = mistapi.api.v1.sites.sle.listSiteSleImpactedAps(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.listSiteSleImpactedAps,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -189,7 +195,8 @@ async def get_site_sle(
                 )
                 await process_response(response)
             case "impacted_gateways":
-                response = mistapi.api.v1.sites.sle.listSiteSleImpactedGateways(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.listSiteSleImpactedGateways,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -201,7 +208,8 @@ async def get_site_sle(
                 )
                 await process_response(response)
             case "impacted_interfaces":
-                response = mistapi.api.v1.sites.sle.listSiteSleImpactedInterfaces(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.listSiteSleImpactedInterfaces,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -213,7 +221,8 @@ async def get_site_sle(
                 )
                 await process_response(response)
             case "impacted_switches":
-                response = mistapi.api.v1.sites.sle.listSiteSleImpactedSwitches(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.listSiteSleImpactedSwitches,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -225,7 +234,8 @@ async def get_site_sle(
                 )
                 await process_response(response)
             case "impacted_wireless_clients":
-                response = mistapi.api.v1.sites.sle.listSiteSleImpactedWirelessClients(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.listSiteSleImpactedWirelessClients,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -237,7 +247,8 @@ async def get_site_sle(
                 )
                 await process_response(response)
             case "impacted_wired_clients":
-                response = mistapi.api.v1.sites.sle.listSiteSleImpactedWiredClients(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.listSiteSleImpactedWiredClients,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -249,7 +260,8 @@ async def get_site_sle(
                 )
                 await process_response(response)
             case "impacted_chassis":
-                response = mistapi.api.v1.sites.sle.listSiteSleImpactedChassis(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.listSiteSleImpactedChassis,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -261,7 +273,8 @@ async def get_site_sle(
                 )
                 await process_response(response)
             case "histogram":
-                response = mistapi.api.v1.sites.sle.getSiteSleHistogram(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.getSiteSleHistogram,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -273,7 +286,8 @@ async def get_site_sle(
                 )
                 await process_response(response)
             case "classifier_summary_trend":
-                response = mistapi.api.v1.sites.sle.getSiteSleClassifierSummaryTrend(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.getSiteSleClassifierSummaryTrend,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -286,7 +300,8 @@ async def get_site_sle(
                 )
                 await process_response(response)
             case "threshold":
-                response = mistapi.api.v1.sites.sle.getSiteSleThreshold(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.getSiteSleThreshold,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -177,29 +178,40 @@ async def get_stats(
 
         match object_type.value:
             case "org":
-                response = mistapi.api.v1.orgs.stats.getOrgStats(
-                    apisession, org_id=str(org_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.stats.getOrgStats,
+                    apisession,
+                    org_id=str(org_id),
                 )
                 await process_response(response)
             case "sites":
                 if object_id:
-                    response = mistapi.api.v1.sites.stats.getSiteStats(
-                        apisession, site_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.stats.getSiteStats,
+                        apisession,
+                        site_id=str(object_id),
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.stats.listOrgSiteStats(
-                        apisession, org_id=str(org_id), limit=limit
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.stats.listOrgSiteStats,
+                        apisession,
+                        org_id=str(org_id),
+                        limit=limit,
                     )
                     await process_response(response)
             case "org_mxedges":
                 if object_id:
-                    response = mistapi.api.v1.orgs.stats.getOrgMxEdgeStats(
-                        apisession, org_id=str(org_id), mxedge_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.stats.getOrgMxEdgeStats,
+                        apisession,
+                        org_id=str(org_id),
+                        mxedge_id=str(object_id),
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.stats.listOrgMxEdgesStats(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.stats.listOrgMxEdgesStats,
                         apisession,
                         org_id=str(org_id),
                         start=str(start) if start else None,
@@ -208,7 +220,8 @@ async def get_stats(
                     )
                     await process_response(response)
             case "org_devices":
-                response = mistapi.api.v1.orgs.stats.listOrgDevicesStats(
+                response = await mist_call(
+                    mistapi.api.v1.orgs.stats.listOrgDevicesStats,
                     apisession,
                     org_id=str(org_id),
                     type=device_type.value if device_type else None,
@@ -219,7 +232,8 @@ async def get_stats(
                 )
                 await process_response(response)
             case "org_bgp":
-                response = mistapi.api.v1.orgs.stats.searchOrgBgpStats(
+                response = await mist_call(
+                    mistapi.api.v1.orgs.stats.searchOrgBgpStats,
                     apisession,
                     org_id=str(org_id),
                     start=str(start) if start else None,
@@ -229,7 +243,8 @@ async def get_stats(
                 )
                 await process_response(response)
             case "org_ospf":
-                response = mistapi.api.v1.orgs.stats.searchOrgOspfStats(
+                response = await mist_call(
+                    mistapi.api.v1.orgs.stats.searchOrgOspfStats,
                     apisession,
                     org_id=str(org_id),
                     start=str(start) if start else None,
@@ -238,7 +253,8 @@ async def get_stats(
                 )
                 await process_response(response)
             case "org_peer_paths":
-                response = mistapi.api.v1.orgs.stats.searchOrgPeerPathStats(
+                response = await mist_call(
+                    mistapi.api.v1.orgs.stats.searchOrgPeerPathStats,
                     apisession,
                     org_id=str(org_id),
                     start=str(start) if start else None,
@@ -248,7 +264,8 @@ async def get_stats(
                 )
                 await process_response(response)
             case "org_ports":
-                response = mistapi.api.v1.orgs.stats.searchOrgSwOrGwPorts(
+                response = await mist_call(
+                    mistapi.api.v1.orgs.stats.searchOrgSwOrGwPorts,
                     apisession,
                     org_id=str(org_id),
                     mac=str(object_id) if object_id else None,
@@ -257,7 +274,8 @@ async def get_stats(
                 await process_response(response)
             case "site_mxedges":
                 if object_id:
-                    response = mistapi.api.v1.sites.stats.getSiteMxEdgeStats(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.stats.getSiteMxEdgeStats,
                         apisession,
                         site_id=str(site_id),
                         start=str(start) if start else None,
@@ -266,7 +284,8 @@ async def get_stats(
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.sites.stats.listSiteMxEdgesStats(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.stats.listSiteMxEdgesStats,
                         apisession,
                         site_id=str(site_id),
                         start=str(start) if start else None,
@@ -276,12 +295,16 @@ async def get_stats(
                     await process_response(response)
             case "site_wireless_clients":
                 if object_id:
-                    response = mistapi.api.v1.sites.stats.getSiteWirelessClientStats(
-                        apisession, site_id=str(site_id), client_mac=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.stats.getSiteWirelessClientStats,
+                        apisession,
+                        site_id=str(site_id),
+                        client_mac=str(object_id),
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.sites.stats.listSiteWirelessClientsStats(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.stats.listSiteWirelessClientsStats,
                         apisession,
                         site_id=str(site_id),
                         start=str(start) if start else None,
@@ -291,12 +314,16 @@ async def get_stats(
                     await process_response(response)
             case "site_devices":
                 if object_id:
-                    response = mistapi.api.v1.sites.stats.getSiteDeviceStats(
-                        apisession, site_id=str(site_id), device_id=str(object_id)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.stats.getSiteDeviceStats,
+                        apisession,
+                        site_id=str(site_id),
+                        device_id=str(object_id),
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.sites.stats.listSiteDevicesStats(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.stats.listSiteDevicesStats,
                         apisession,
                         site_id=str(site_id),
                         type=device_type.value if device_type else None,
@@ -304,7 +331,8 @@ async def get_stats(
                     )
                     await process_response(response)
             case "site_bgp":
-                response = mistapi.api.v1.sites.stats.searchSiteBgpStats(
+                response = await mist_call(
+                    mistapi.api.v1.sites.stats.searchSiteBgpStats,
                     apisession,
                     site_id=str(site_id),
                     start=str(start) if start else None,
@@ -314,7 +342,8 @@ async def get_stats(
                 )
                 await process_response(response)
             case "site_ospf":
-                response = mistapi.api.v1.sites.stats.searchSiteOspfStats(
+                response = await mist_call(
+                    mistapi.api.v1.sites.stats.searchSiteOspfStats,
                     apisession,
                     site_id=str(site_id),
                     start=str(start) if start else None,
@@ -324,7 +353,8 @@ async def get_stats(
                 )
                 await process_response(response)
             case "site_ports":
-                response = mistapi.api.v1.sites.stats.searchSiteSwOrGwPorts(
+                response = await mist_call(
+                    mistapi.api.v1.sites.stats.searchSiteSwOrGwPorts,
                     apisession,
                     site_id=str(site_id),
                     mac=str(object_id) if object_id else None,
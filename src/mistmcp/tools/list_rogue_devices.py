@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -99,7 +100,8 @@ async def list_rogue_devices(
 
         match object_type.value:
             case "ap":
-                response = mistapi.api.v1.sites.insights.listSiteRogueAPs(
+                response = await mist_call(
+                    mistapi.api.v1.sites.insights.listSiteRogueAPs,
                     apisession,
                     site_id=str(site_id),
                     type=rogue_ap_type.value if rogue_ap_type else None,
@@ -109,7 +111,8 @@ async def list_rogue_devices(
                 )
                 await process_response(response)
             case "client":
-                response = mistapi.api.v1.sites.insights.listSiteRogueClients(
+                response = await mist_call(
+                    mistapi.api.v1.sites.insights.listSiteRogueClients,
                     apisession,
                     site_id=str(site_id),
                     limit=limit,
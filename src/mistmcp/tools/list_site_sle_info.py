@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -106,7 +107,8 @@ async def list_site_sle_info(
 
         match object_type.value:
             case "metrics":
-                response = mistapi.api.v1.sites.sle.listSiteSlesMetrics(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.listSiteSlesMetrics,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
@@ -114,7 +116,8 @@ async def list_site_sle_info(
                 )
                 await process_response(response)
             case "classifiers":
-                response = mistapi.api.v1.sites.sle.listSiteSleMetricClassifiers(
+                response = await mist_call(
+                    mistapi.api.v1.sites.sle.listSiteSleMetricClassifiers,
                     apisession,
                     site_id=str(site_id),
                     scope=scope.value,
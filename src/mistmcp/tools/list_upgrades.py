@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -184,72 +185,103 @@ async def list_upgrades(
         match object_type.value:
             case "ap":
                 if upgrade_id:
-                    response = mistapi.api.v1.orgs.devices.getOrgDeviceUpgrade(
-                        apisession, org_id=str(org_id), upgrade_id=str(upgrade_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.devices.getOrgDeviceUpgrade,
+                        apisession,
+                        org_id=str(org_id),
+                        upgrade_id=str(upgrade_id),
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.devices.listOrgDeviceUpgrades(
-                        apisession, org_id=str(org_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.devices.listOrgDeviceUpgrades,
+                        apisession,
+                        org_id=str(org_id),
                     )
                     await process_response(response)
             case "switch":
                 if upgrade_id:
-                    response = mistapi.api.v1.orgs.devices.getOrgDeviceUpgrade(
-                        apisession, org_id=str(org_id), upgrade_id=str(upgrade_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.devices.getOrgDeviceUpgrade,
+                        apisession,
+                        org_id=str(org_id),
+                        upgrade_id=str(upgrade_id),
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.devices.listOrgDeviceUpgrades(
-                        apisession, org_id=str(org_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.devices.listOrgDeviceUpgrades,
+                        apisession,
+                        org_id=str(org_id),
                     )
                     await process_response(response)
             case "srx":
                 if upgrade_id:
-                    response = mistapi.api.v1.orgs.devices.getOrgDeviceUpgrade(
-                        apisession, org_id=str(org_id), upgrade_id=str(upgrade_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.devices.getOrgDeviceUpgrade,
+                        apisession,
+                        org_id=str(org_id),
+                        upgrade_id=str(upgrade_id),
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.devices.listOrgDeviceUpgrades(
-                        apisession, org_id=str(org_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.devices.listOrgDeviceUpgrades,
+                        apisession,
+                        org_id=str(org_id),
                     )
                     await process_response(response)
             case "org_mxedge":
                 if upgrade_id:
-                    response = mistapi.api.v1.orgs.mxedges.getOrgMxEdgeUpgrade(
-                        apisession, org_id=str(org_id), upgrade_id=str(upgrade_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.mxedges.getOrgMxEdgeUpgrade,
+                        apisession,
+                        org_id=str(org_id),
+                        upgrade_id=str(upgrade_id),
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.mxedges.listOrgMxEdgeUpgrades(
-                        apisession, org_id=str(org_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.mxedges.listOrgMxEdgeUpgrades,
+                        apisession,
+                        org_id=str(org_id),
                     )
                     await process_response(response)
             case "site_mxedge":
                 if upgrade_id:
-                    response = mistapi.api.v1.sites.mxedges.getSiteMxEdgeUpgrade(
-                        apisession, site_id=str(site_id), upgrade_id=str(upgrade_id)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.mxedges.getSiteMxEdgeUpgrade,
+                        apisession,
+                        site_id=str(site_id),
+                        upgrade_id=str(upgrade_id),
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.sites.mxedges.listSiteMxEdgeUpgrades(
-                        apisession, site_id=str(site_id)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.mxedges.listSiteMxEdgeUpgrades,
+                        apisession,
+                        site_id=str(site_id),
                     )
                     await process_response(response)
             case "ssr":
                 if upgrade_id:
-                    response = mistapi.api.v1.orgs.ssr.getOrgSsrUpgrade(
-                        apisession, org_id=str(org_id), upgrade_id=str(upgrade_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.ssr.getOrgSsrUpgrade,
+                        apisession,
+                        org_id=str(org_id),
+                        upgrade_id=str(upgrade_id),
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.ssr.listOrgSsrUpgrades(
-                        apisession, org_id=str(org_id)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.ssr.listOrgSsrUpgrades,
+                        apisession,
+                        org_id=str(org_id),
                     )
                     await process_response(response)
             case "available_device_versions":
-                response = mistapi.api.v1.orgs.devices.listOrgAvailableDeviceVersions(
+                response = await mist_call(
+                    mistapi.api.v1.orgs.devices.listOrgAvailableDeviceVersions,
                     apisession,
                     org_id=str(org_id),
                     type=firmware_type.value if firmware_type else None,
@@ -257,7 +289,8 @@ async def list_upgrades(
                 )
                 await process_response(response)
             case "available_ssr_versions":
-                response = mistapi.api.v1.orgs.ssr.listOrgAvailableSsrVersions(
+                response = await mist_call(
+                    mistapi.api.v1.orgs.ssr.listOrgAvailableSsrVersions,
                     apisession,
                     org_id=str(org_id),
                     channel=channel.value if channel else "stable",
@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -177,7 +178,8 @@ async def search_alarms(
 
         match object_type.value:
             case "org":
-                response = mistapi.api.v1.orgs.alarms.searchOrgAlarms(
+                response = await mist_call(
+                    mistapi.api.v1.orgs.alarms.searchOrgAlarms,
                     apisession,
                     org_id=str(org_id),
                     group=group if group else None,
@@ -190,7 +192,8 @@ async def search_alarms(
                 )
                 await process_response(response)
             case "site":
-                response = mistapi.api.v1.sites.alarms.searchSiteAlarms(
+                response = await mist_call(
+                    mistapi.api.v1.sites.alarms.searchSiteAlarms,
                     apisession,
                     site_id=str(site_id),
                     group=group if group else None,
@@ -203,8 +206,10 @@ async def search_alarms(
                 )
                 await process_response(response)
             case "suppressed":
-                response = mistapi.api.v1.orgs.alarmtemplates.listOrgSuppressedAlarms(
-                    apisession, org_id=str(org_id)
+                response = await mist_call(
+                    mistapi.api.v1.orgs.alarmtemplates.listOrgSuppressedAlarms,
+                    apisession,
+                    org_id=str(org_id),
                 )
                 await process_response(response)
 
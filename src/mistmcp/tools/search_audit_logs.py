@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -96,7 +97,8 @@ async def search_audit_logs(
 
         match object_type.value:
             case "self":
-                response = mistapi.api.v1.self.logs.listSelfAuditLogs(
+                response = await mist_call(
+                    mistapi.api.v1.self.logs.listSelfAuditLogs,
                     apisession,
                     start=str(start) if start else None,
                     end=str(end) if end else None,
@@ -105,7 +107,8 @@ async def search_audit_logs(
                 )
                 await process_response(response)
             case "org":
-                response = mistapi.api.v1.orgs.logs.listOrgAuditLogs(
+                response = await mist_call(
+                    mistapi.api.v1.orgs.logs.listOrgAuditLogs,
                     apisession,
                     org_id=str(org_id),
                     start=str(start) if start else None,
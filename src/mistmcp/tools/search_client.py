@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -162,7 +163,8 @@ async def search_client(
 
         match object_type.value:
             case "wan":
-                response = mistapi.api.v1.orgs.wan_clients.searchOrgWanClients(
+                response = await mist_call(
+                    mistapi.api.v1.orgs.wan_clients.searchOrgWanClients,
                     apisession,
                     org_id=str(org_id),
                     site_id=str(site_id) if site_id else None,
@@ -175,7 +177,8 @@ async def search_client(
                 )
                 await process_response(response)
             case "wired":
-                response = mistapi.api.v1.orgs.wired_clients.searchOrgWiredClients(
+                response = await mist_call(
+                    mistapi.api.v1.orgs.wired_clients.searchOrgWiredClients,
                     apisession,
                     org_id=str(org_id),
                     site_id=str(site_id) if site_id else None,
@@ -188,7 +191,8 @@ async def search_client(
                 )
                 await process_response(response)
             case "wireless":
-                response = mistapi.api.v1.orgs.clients.searchOrgWirelessClients(
+                response = await mist_call(
+                    mistapi.api.v1.orgs.clients.searchOrgWirelessClients,
                     apisession,
                     org_id=str(org_id),
                     site_id=str(site_id) if site_id else None,
@@ -204,7 +208,8 @@ async def search_client(
                 )
                 await process_response(response)
             case "nac":
-                response = mistapi.api.v1.orgs.nac_clients.searchOrgNacClients(
+                response = await mist_call(
+                    mistapi.api.v1.orgs.nac_clients.searchOrgNacClients,
                     apisession,
                     org_id=str(org_id),
                     site_id=str(site_id) if site_id else None,
@@ -19,6 +19,7 @@ from fastmcp.exceptions import ToolError
 from pydantic import Field
 
 from mistmcp.logger import logger
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_formatter import format_response
 from mistmcp.response_processor import handle_network_error, process_response
@@ -123,7 +124,8 @@ async def search_device(
     apisession, response_format = await get_apisession()
 
     try:
-        response = mistapi.api.v1.orgs.inventory.searchOrgInventory(
+        response = await mist_call(
+            mistapi.api.v1.orgs.inventory.searchOrgInventory,
             apisession,
             org_id=str(org_id),
             serial=serial if serial else None,
@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -99,7 +100,8 @@ async def search_device_config_history(
         object_type = query_type
         match object_type.value:
             case "history":
-                response = mistapi.api.v1.sites.devices.searchSiteDeviceConfigHistory(
+                response = await mist_call(
+                    mistapi.api.v1.sites.devices.searchSiteDeviceConfigHistory,
                     apisession,
                     site_id=str(site_id),
                     type=device_type.value if device_type else None,
@@ -110,7 +112,8 @@ async def search_device_config_history(
                 )
                 await process_response(response)
             case "last_configs":
-                response = mistapi.api.v1.sites.devices.searchSiteDeviceLastConfigs(
+                response = await mist_call(
+                    mistapi.api.v1.sites.devices.searchSiteDeviceLastConfigs,
                     apisession,
                     site_id=str(site_id),
                     device_type=device_type.value if device_type else None,
@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -179,7 +180,8 @@ async def search_events(
         match object_type.value:
             case "device":
                 if site_id:
-                    response = mistapi.api.v1.sites.devices.searchSiteDeviceEvents(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.devices.searchSiteDeviceEvents,
                         apisession,
                         site_id=str(site_id),
                         start=str(start) if start else None,
@@ -191,7 +193,8 @@ async def search_events(
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.devices.searchOrgDeviceEvents(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.devices.searchOrgDeviceEvents,
                         apisession,
                         org_id=str(org_id),
                         start=str(start) if start else None,
@@ -204,7 +207,8 @@ async def search_events(
                     await process_response(response)
             case "mxedge":
                 if site_id:
-                    response = mistapi.api.v1.sites.mxedges.searchSiteMistEdgeEvents(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.mxedges.searchSiteMistEdgeEvents,
                         apisession,
                         site_id=str(site_id),
                         start=str(start) if start else None,
@@ -217,7 +221,8 @@ async def search_events(
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.mxedges.searchOrgMistEdgeEvents(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.mxedges.searchOrgMistEdgeEvents,
                         apisession,
                         org_id=str(org_id),
                         start=str(start) if start else None,
@@ -231,20 +236,20 @@ async def search_events(
                     await process_response(response)
             case "wan_client":
                 if site_id:
-                    response = (
-                        mistapi.api.v1.sites.wan_clients.searchSiteWanClientEvents(
-                            apisession,
-                            site_id=str(site_id),
-                            start=str(start) if start else None,
-                            end=str(end) if end else None,
-                            type=str(event_type) if event_type else None,
-                            mac=str(mac) if mac else None,
-                            limit=limit,
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.sites.wan_clients.searchSiteWanClientEvents,
+                        apisession,
+                        site_id=str(site_id),
+                        start=str(start) if start else None,
+                        end=str(end) if end else None,
+                        type=str(event_type) if event_type else None,
+                        mac=str(mac) if mac else None,
+                        limit=limit,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.wan_clients.searchOrgWanClientEvents(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.wan_clients.searchOrgWanClientEvents,
                         apisession,
                         org_id=str(org_id),
                         start=str(start) if start else None,
@@ -256,49 +261,47 @@ async def search_events(
                     await process_response(response)
             case "wireless_client":
                 if site_id:
-                    response = (
-                        mistapi.api.v1.sites.clients.searchSiteWirelessClientEvents(
-                            apisession,
-                            site_id=str(site_id),
-                            start=str(start) if start else None,
-                            end=str(end) if end else None,
-                            type=str(event_type) if event_type else None,
-                            ssid=str(ssid) if ssid else None,
-                            limit=limit,
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.sites.clients.searchSiteWirelessClientEvents,
+                        apisession,
+                        site_id=str(site_id),
+                        start=str(start) if start else None,
+                        end=str(end) if end else None,
+                        type=str(event_type) if event_type else None,
+                        ssid=str(ssid) if ssid else None,
+                        limit=limit,
                     )
                     await process_response(response)
                 else:
-                    response = (
-                        mistapi.api.v1.orgs.clients.searchOrgWirelessClientEvents(
-                            apisession,
-                            org_id=str(org_id),
-                            start=str(start) if start else None,
-                            end=str(end) if end else None,
-                            type=str(event_type) if event_type else None,
-                            ssid=str(ssid) if ssid else None,
-                            limit=limit,
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.clients.searchOrgWirelessClientEvents,
+                        apisession,
+                        org_id=str(org_id),
+                        start=str(start) if start else None,
+                        end=str(end) if end else None,
+                        type=str(event_type) if event_type else None,
+                        ssid=str(ssid) if ssid else None,
+                        limit=limit,
                     )
                     await process_response(response)
             case "nac_client":
                 if site_id:
-                    response = (
-                        mistapi.api.v1.sites.nac_clients.searchSiteNacClientEvents(
-                            apisession,
-                            site_id=str(site_id),
-                            start=str(start) if start else None,
-                            end=str(end) if end else None,
-                            type=str(event_type) if event_type else None,
-                            mac=str(mac) if mac else None,
-                            text=str(text) if text else None,
-                            ssid=str(ssid) if ssid else None,
-                            limit=limit,
-                        )
+                    response = await mist_call(
+                        mistapi.api.v1.sites.nac_clients.searchSiteNacClientEvents,
+                        apisession,
+                        site_id=str(site_id),
+                        start=str(start) if start else None,
+                        end=str(end) if end else None,
+                        type=str(event_type) if event_type else None,
+                        mac=str(mac) if mac else None,
+                        text=str(text) if text else None,
+                        ssid=str(ssid) if ssid else None,
+                        limit=limit,
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.nac_clients.searchOrgNacClientEvents(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.nac_clients.searchOrgNacClientEvents,
                         apisession,
                         org_id=str(org_id),
                         start=str(start) if start else None,
@@ -311,7 +314,8 @@ async def search_events(
                     )
                     await process_response(response)
             case "roaming":
-                response = mistapi.api.v1.sites.events.listSiteRoamingEvents(
+                response = await mist_call(
+                    mistapi.api.v1.sites.events.listSiteRoamingEvents,
                     apisession,
                     site_id=str(site_id),
                     start=str(start) if start else None,
@@ -321,7 +325,8 @@ async def search_events(
                 )
                 await process_response(response)
             case "rogue":
-                response = mistapi.api.v1.sites.rogues.searchSiteRogueEvents(
+                response = await mist_call(
+                    mistapi.api.v1.sites.rogues.searchSiteRogueEvents,
                     apisession,
                     site_id=str(site_id),
                     start=str(start) if start else None,
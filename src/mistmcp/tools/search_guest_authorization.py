@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -123,12 +124,16 @@ async def search_guest_authorization(
         match object_type.value:
             case "org":
                 if guest_mac:
-                    response = mistapi.api.v1.orgs.guests.getOrgGuestAuthorization(
-                        apisession, org_id=str(org_id), guest_mac=str(guest_mac)
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.guests.getOrgGuestAuthorization,
+                        apisession,
+                        org_id=str(org_id),
+                        guest_mac=str(guest_mac),
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.orgs.guests.searchOrgGuestAuthorization(
+                    response = await mist_call(
+                        mistapi.api.v1.orgs.guests.searchOrgGuestAuthorization,
                         apisession,
                         org_id=str(org_id),
                         wlan_id=str(wlan_id) if wlan_id else None,
@@ -141,12 +146,16 @@ async def search_guest_authorization(
                     await process_response(response)
             case "site":
                 if guest_mac:
-                    response = mistapi.api.v1.sites.guests.getSiteGuestAuthorization(
-                        apisession, site_id=str(site_id), guest_mac=str(guest_mac)
+                    response = await mist_call(
+                        mistapi.api.v1.sites.guests.getSiteGuestAuthorization,
+                        apisession,
+                        site_id=str(site_id),
+                        guest_mac=str(guest_mac),
                     )
                     await process_response(response)
                 else:
-                    response = mistapi.api.v1.sites.guests.searchSiteGuestAuthorization(
+                    response = await mist_call(
+                        mistapi.api.v1.sites.guests.searchSiteGuestAuthorization,
                         apisession,
                         site_id=str(site_id),
                         wlan_id=str(wlan_id) if wlan_id else None,
@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -79,12 +80,16 @@ async def search_nac_user_macs(
 
     try:
         if usermac_id:
-            response = mistapi.api.v1.orgs.usermacs.getOrgUserMac(
-                apisession, org_id=str(org_id), usermac_id=str(usermac_id)
+            response = await mist_call(
+                mistapi.api.v1.orgs.usermacs.getOrgUserMac,
+                apisession,
+                org_id=str(org_id),
+                usermac_id=str(usermac_id),
             )
             await process_response(response)
         else:
-            response = mistapi.api.v1.orgs.usermacs.searchOrgUserMacs(
+            response = await mist_call(
+                mistapi.api.v1.orgs.usermacs.searchOrgUserMacs,
                 apisession,
                 org_id=str(org_id),
                 mac=str(mac) if mac else None,
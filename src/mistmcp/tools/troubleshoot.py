@@ -13,6 +13,7 @@
 import mistapi
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mistmcp.request_executor import mist_call
 from mistmcp.request_processor import get_apisession
 from mistmcp.response_processor import process_response, handle_network_error
 from mistmcp.response_formatter import format_response
@@ -82,7 +83,8 @@ async def troubleshoot(
     apisession, response_format = await get_apisession()
 
     try:
-        response = mistapi.api.v1.orgs.troubleshoot.troubleshootOrg(
+        response = await mist_call(
+            mistapi.api.v1.orgs.troubleshoot.troubleshootOrg,
             apisession,
             org_id=str(org_id),
             site_id=str(site_id) if site_id else None,
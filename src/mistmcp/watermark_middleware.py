@@ -0,0 +1,333 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import math
+import threading
+from collections.abc import Sequence
+
+import mcp.types
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools.tool import Tool, ToolResult
+
+from mistmcp.auto_paginate_middleware import (
+    MAX_PAGE_SIZE,
+    combine_records,
+    follow_pages,
+    page_records,
+    tool_result,
+)
+from mistmcp.config import config
+from mistmcp.logger import logger
+from mistmcp.rate_limiter import session_key
+from mistmcp.request_processor import get_apisession
+from mistmcp.response_formatter import (
+    format_response,
+    response_format_override,
+    tool_result_data,
+)
+from mistmcp.watermark_store import (
+    MAX_UNTIMED_IDS,
+    Watermark,
+    record_id,
+    watermark_store,
+)
+
+# Search tools accepting the ``since`` and ``watermark`` parameters
+WATERMARK_TOOLS = {
+    "mist_search_events",
+    "mist_search_alarms",
+    "mist_search_audit_logs",
+}
+
+# Parameters of the other middlewares which cannot be combined with ``since``
+_EXCLUSIVE_PARAMETERS = ("aggregate", "shards", "site_ids", "org_ids")
+
+_SINCE_SCHEMA = {
+    "type": "string",
+    "enum": ["last"],
+    "description": "`last` to only return the records newer than the records returned by the previous `since=last` call of the same search, e.g. to poll the new events every minute. The first call returns the records of the `start`-`end` time range. On the next calls, `start`, `end` and `duration` are ignored. When there are more new records than `max_records`, the most recent ones are returned and the next calls return the older ones",
+}
+
+_WATERMARK_SCHEMA = {
+    "type": "string",
+    "description": "Name of the watermark used by `since=last`, to share it between searches with different parameters. By default, each search has its own watermark",
+}
+
+
+def _timestamp(record) -> float | None:
+    if isinstance(record, dict):
+        try:
+            return float(record["timestamp"])
+        except (KeyError, TypeError, ValueError):
+            pass
+    return None
+
+
+def _delivered(record, timestamp: float, bound: Watermark) -> bool:
+    return timestamp == bound.timestamp and record_id(record) in bound.ids
+
+
+def new_records(records: list, watermark: Watermark | None) -> list:
+    """Return the ``records`` newer than ``watermark``.
+
+    The records with the timestamp of the watermark are only returned if
+    they were not returned with it. When the previous delivery was
+    truncated, only the records older than the ones delivered are returned.
+    The records without timestamp are returned once.
+    """
+    if watermark is None:
+        return records
+    untimed = set(watermark.untimed)
+    fresh = []
+    for record in records:
+        timestamp = _timestamp(record)
+        if timestamp is None:
+            if record_id(record) in untimed:
+                continue
+        elif (
+            timestamp < watermark.timestamp
+            or _delivered(record, timestamp, watermark)
+            or (
+                watermark.until is not None
+                and (
+                    timestamp > watermark.until.timestamp
+                    or _delivered(record, timestamp, watermark.until)
+                )
+            )
+        ):
+            continue
+        fresh.append(record)
+    return fresh
+
+
+def _bound(records: list, timestamp: float, bound: Watermark | None) -> Watermark:
+    # The ``timestamp`` of the ``records``, and the IDs of the records with
+    # this timestamp, merged with ``bound`` when it has the same timestamp
+    ids = {record_id(record) for record in records if _timestamp(record) == timestamp}
+    if bound is not None and bound.timestamp == timestamp:
+        ids |= bound.ids
+    return Watermark(timestamp, frozenset(ids))
+
+
+def advance(
+    watermark: Watermark | None, records: list, truncated: bool = False
+) -> Watermark | None:
+    """Return the watermark after the delivery of ``records``.
+
+    ``truncated`` is True when the records delivered are only the most
+    recent of the new records: the watermark then keeps its timestamp, and
+    the next searches only return the records older than the ones delivered
+    (see ``new_records()``), until they are all delivered.
+    """
+    timestamps = [
+        timestamp for timestamp in map(_timestamp, records) if timestamp is not None
+    ]
+    untimed = tuple(
+        record_id(record) for record in records if _timestamp(record) is None
+    )
+    if watermark is None:
+        if not timestamps:
+            return None
+        # the records older than the first delivery are not returned
+        watermark = _bound(records, min(timestamps), None)
+        truncated = False
+    if untimed:
+        watermark = watermark._replace(
+            untimed=(watermark.untimed + untimed)[-MAX_UNTIMED_IDS:]
+        )
+    if truncated:
+        if not timestamps:
+            return watermark
+        # the records delivered are older than ``until``, and newer than
+        # ``latest`` on the first truncated delivery
+        latest = watermark.latest or _bound(records, max(timestamps), watermark)
+        return watermark._replace(
+            until=_bound(records, min(timestamps), watermark.until), latest=latest
+        )
+    if watermark.latest is not None:
+        # every record older than ``until`` was delivered
+        watermark = watermark._replace(
+            timestamp=watermark.latest.timestamp,
+            ids=watermark.latest.ids,
+            until=None,
+            latest=None,
+        )
+    if not timestamps or max(timestamps) < watermark.timestamp:
+        return watermark
+    latest = _bound(records, max(timestamps), watermark)
+    return watermark._replace(timestamp=latest.timestamp, ids=latest.ids)
+
+
+class WatermarkMiddleware(Middleware):
+    """Return only the new records of a polled search.
+
+    The tools of ``WATERMARK_TOOLS`` are listed with the additional ``since``
+    and ``watermark`` parameters. With ``since=last``, the timestamp of the
+    most recent record returned, and the IDs of the records returned with
+    this timestamp, are kept in the watermark store (see
+    ``watermark_store.WatermarkStore``). The next ``since=last`` call only
+    searches from this timestamp, and the records already returned at the
+    boundary are dropped (see ``new_records()``).
+
+    Every page of the new records is retrieved, up to ``max_records`` if
+    set, otherwise ``config.max_records``. Past this limit, the most recent
+    records are returned, and the next ``since=last`` calls search the older
+    ones, up to the records delivered (see ``advance()``).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._polls = 0
+        self._records = 0
+        self._duplicates = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the watermark counters."""
+        with self._lock:
+            return {
+                "polls": self._polls,
+                "records": self._records,
+                "duplicates": self._duplicates,
+            }
+
+    async def on_list_tools(
+        self,
+        context: MiddlewareContext[mcp.types.ListToolsRequest],
+        call_next,
+    ) -> Sequence[Tool]:
+        tools = await call_next(context)
+        return [self._with_since(tool) for tool in tools]
+
+    @staticmethod
+    def _with_since(tool: Tool) -> Tool:
+        if tool.name not in WATERMARK_TOOLS:
+            return tool
+        parameters = dict(tool.parameters)
+        properties = dict(parameters.get("properties", {}))
+        properties["since"] = _SINCE_SCHEMA
+        properties["watermark"] = _WATERMARK_SCHEMA
+        parameters["properties"] = properties
+        return tool.model_copy(update={"parameters": parameters})
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mcp.types.CallToolRequestParams],
+        call_next,
+    ) -> ToolResult:
+        message = context.message
+        arguments = message.arguments or {}
+        if message.name not in WATERMARK_TOOLS or (
+            "since" not in arguments and "watermark" not in arguments
+        ):
+            return await call_next(context)
+
+        arguments = dict(arguments)
+        since = arguments.pop("since", None)
+        name = arguments.pop("watermark", None)
+        if since != "last":
+            raise ToolError(
+                {
+                    "status_code": 400,
+                    "message": '`since` must be "last" (required by `watermark`)',
+                }
+            )
+        for parameter in _EXCLUSIVE_PARAMETERS:
+            if arguments.get(parameter) is not None:
+                raise ToolError(
+                    {
+                        "status_code": 400,
+                        "message": f"`since` and `{parameter}` cannot be used together",
+                    }
+                )
+        max_records = arguments.pop("max_records", None) or config.max_records
+        max_records = min(max_records, config.max_records)
+
+        apisession, response_format = await get_apisession()
+        key = watermark_store.key(
+            session_key(apisession),
+            message.name,
+            name,
+            {
+                k: v
+                for k, v in arguments.items()
+                if k not in ("start", "end", "duration", "limit")
+            },
+        )
+        watermark = stored = watermark_store.get(key)
+        if watermark is not None:
+            # the API ``start`` and ``end`` are in seconds, the boundary
+            # records are dropped by new_records()
+            arguments.pop("duration", None)
+            arguments.pop("end", None)
+            arguments["start"] = int(watermark.timestamp)
+            if watermark.until is not None:
+                arguments["end"] = math.ceil(watermark.until.timestamp)
+        elif isinstance(arguments.get("start"), (int, float)):
+            # the records of the time range not delivered by a truncated
+            # first call are returned by the next ones
+            watermark = Watermark(float(arguments["start"]), frozenset())
+        if arguments.get("limit") is None:
+            arguments["limit"] = min(MAX_PAGE_SIZE, max_records)
+        context = context.copy(
+            message=message.model_copy(update={"arguments": arguments})
+        )
+
+        with response_format_override("json"):
+            data = tool_result_data(await call_next(context))
+        records = list(page_records(data))
+        next_url, _, error = await follow_pages(
+            apisession,
+            records,
+            data.get("next") if isinstance(data, dict) else None,
+            max_records,
+        )
+        fresh = new_records(records, watermark)
+        # the older records are returned by the next calls, not by ``next``
+        combined = combine_records(apisession, fresh, None, None, error)
+        # the records over the response budget are delivered by the cursor
+        # ``next``, if any, otherwise they were dropped
+        delivered = fresh if combined.get("next") else combined["results"]
+        truncated = bool(next_url) or len(delivered) < len(fresh)
+        advanced = advance(watermark, delivered, truncated)
+        if advanced is not None and advanced != stored:
+            watermark_store.set(key, advanced)
+
+        with self._lock:
+            self._polls += 1
+            self._records += len(fresh)
+            self._duplicates += len(records) - len(fresh)
+        logger.debug(
+            "WatermarkMiddleware: %s returned %d new records (%d already returned)",
+            message.name,
+            len(fresh),
+            len(records) - len(fresh),
+        )
+
+        if advanced is not None:
+            combined["watermark"] = advanced.timestamp
+        if truncated:
+            combined["has_more"] = True
+            combined["message"] = " ".join(
+                filter(
+                    None,
+                    [
+                        combined.get("message"),
+                        f"Only the {len(delivered)} most recent new records were returned, call the tool again with `since=last` to retrieve the older ones.",
+                    ],
+                )
+            )
+        return tool_result(format_response(combined, response_format))
+
+
+# Shared instance, registered in the server middleware and read by /metrics
+watermark_middleware = WatermarkMiddleware()
@@ -0,0 +1,224 @@
+"""
+--------------------------------------------------------------------------------
+-------------------------------- Mist MCP SERVER -------------------------------
+
+    Written by: Thomas Munzer (tmunzer@juniper.net)
+    Github    : https://github.com/tmunzer/mistmcp
+
+    This package is licensed under the MIT License.
+
+--------------------------------------------------------------------------------
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import NamedTuple
+
+from mistmcp.config import config
+from mistmcp.logger import logger
+from mistmcp.serializer import dumps
+
+# Max number of watermarks kept, the least recently updated are dropped
+MAX_WATERMARKS = 1000
+
+# Max number of IDs of the records without timestamp kept by a watermark,
+# the oldest are dropped
+MAX_UNTIMED_IDS = 1000
+
+# Version of the format of the watermark file, the files of another version
+# are ignored
+WATERMARKS_VERSION = 1
+
+
+class Watermark(NamedTuple):
+    """Timestamp of the most recent records delivered, and the IDs of the
+    records delivered with this timestamp.
+
+    ``untimed`` holds the IDs of the records delivered without a timestamp,
+    oldest first. When the delivery of the records newer than ``timestamp``
+    was truncated, ``until`` holds the timestamp and IDs of the oldest
+    records delivered, and ``latest`` the ones of the most recent records
+    delivered.
+    """
+
+    timestamp: float
+    ids: frozenset[str]
+    untimed: tuple[str, ...] = ()
+    until: "Watermark | None" = None
+    latest: "Watermark | None" = None
+
+
+def record_id(record: dict) -> str:
+    """Return the ID of a record, or the hash of its content when it has none
+    (e.g. device events)."""
+    if isinstance(record.get("id"), str):
+        return record["id"]
+    return hashlib.sha256(dumps(record).encode()).hexdigest()[:16]
+
+
+class WatermarkStore:
+    """Watermarks of the searches polled with ``since=last``.
+
+    The watermarks are keyed by API token (see ``rate_limiter.session_key()``),
+    tool and watermark name, so they survive the reconnections of the MCP
+    clients. When ``config.watermark_file`` is set, they are also saved to
+    this JSON file and survive the restarts of the server.
+
+    The file holds ``{"version": WATERMARKS_VERSION, "watermarks": {...}}``,
+    each watermark being a record of its fields (see ``_record()``). The
+    watermarks not updated for ``config.watermark_ttl`` seconds are
+    forgotten, and at most ``MAX_WATERMARKS`` are kept.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        # key -> watermark record (see ``_record()``)
+        self._watermarks: dict[str, dict] | None = None
+        self._hits = 0
+        self._misses = 0
+        self._updates = 0
+
+    @property
+    def path(self) -> str | None:
+        return self._path if self._path is not None else config.watermark_file
+
+    @staticmethod
+    def key(session: str, tool_name: str, name: str | None, arguments: dict) -> str:
+        """Return the key of a watermark.
+
+        Without ``name``, each search (the tool ``arguments``) has its own
+        watermark.
+        """
+        if name is None:
+            name = hashlib.sha256(
+                dumps(dict(sorted(arguments.items()))).encode()
+            ).hexdigest()[:16]
+        return f"{session}:{tool_name}:{name}"
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the watermark store counters."""
+        with self._lock:
+            return {
+                "size": len(self._watermarks or {}),
+                "hits": self._hits,
+                "misses": self._misses,
+                "updates": self._updates,
+            }
+
+    @staticmethod
+    def _record(watermark: Watermark) -> dict:
+        """Return the record of ``watermark`` stored in the file."""
+        return {
+            "timestamp": watermark.timestamp,
+            "ids": sorted(watermark.ids),
+            "updated": time.time(),
+            "untimed": list(watermark.untimed[-MAX_UNTIMED_IDS:]),
+            **{
+                name: None
+                if bound is None
+                else {"timestamp": bound.timestamp, "ids": sorted(bound.ids)}
+                for name, bound in (
+                    ("until", watermark.until),
+                    ("latest", watermark.latest),
+                )
+            },
+        }
+
+    @staticmethod
+    def _watermark(record: dict) -> Watermark:
+        """Return the watermark of a stored ``record``."""
+        until, latest = (
+            None
+            if record[name] is None
+            else Watermark(record[name]["timestamp"], frozenset(record[name]["ids"]))
+            for name in ("until", "latest")
+        )
+        return Watermark(
+            record["timestamp"],
+            frozenset(record["ids"]),
+            tuple(record["untimed"]),
+            until,
+            latest,
+        )
+
+    def _read(self) -> dict[str, dict]:
+        # Must be called with the lock held
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError) as exc:
+            logger.warning("Unable to load the watermarks: %s", exc)
+            return {}
+        version = data.get("version") if isinstance(data, dict) else None
+        if version != WATERMARKS_VERSION:
+            logger.warning(
+                "Ignoring the watermarks of %s: unsupported format version %s",
+                self.path,
+                version,
+            )
+            return {}
+        return data["watermarks"]
+
+    def _load(self) -> dict[str, dict]:
+        # Must be called with the lock held
+        if self._watermarks is None:
+            self._watermarks = {}
+            if self.path and os.path.exists(self.path):
+                self._watermarks = self._read()
+        now = time.time()
+        for key in [
+            key
+            for key, watermark in self._watermarks.items()
+            if now - watermark["updated"] >= config.watermark_ttl
+        ]:
+            del self._watermarks[key]
+        return self._watermarks
+
+    def _save(self, watermarks: dict[str, dict]) -> None:
+        # Must be called with the lock held
+        if not self.path:
+            return
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                file.write(
+                    dumps({"version": WATERMARKS_VERSION, "watermarks": watermarks})
+                )
+            os.replace(temp_path, self.path)
+        except OSError as exc:
+            logger.warning("Unable to save the watermarks: %s", exc)
+
+    def get(self, key: str) -> Watermark | None:
+        """Return the watermark of ``key``, or None if there is none."""
+        with self._lock:
+            watermark = self._load().get(key)
+            if watermark is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return self._watermark(watermark)
+
+    def set(self, key: str, watermark: Watermark) -> None:
+        """Store the watermark of ``key``."""
+        with self._lock:
+            watermarks = self._load()
+            watermarks.pop(key, None)
+            watermarks[key] = self._record(watermark)
+            while len(watermarks) > MAX_WATERMARKS:
+                del watermarks[next(iter(watermarks))]
+            self._updates += 1
+            self._save(watermarks)
+
+    def clear(self) -> None:
+        """Forget every watermark."""
+        with self._lock:
+            self._watermarks = {}
+            self._save(self._watermarks)
+
+
+# Process-wide store shared by every tool
+watermark_store = WatermarkStore()
@@ -0,0 +1,75 @@
+"""Micro-benchmark of the JSON serializers of mistmcp.serializer
+
+Serializes a device stats like response with the json and the orjson
+backends and prints the time per call and the output size of each one:
+
+    uv run python tests/benchmarks/bench_serializer.py [--records N]
+"""
+
+import argparse
+import datetime
+import json
+import timeit
+import uuid
+
+from mistmcp import serializer
+from mistmcp.config import config
+
+
+def _records(count: int) -> list[dict]:
+    return [
+        {
+            "id": uuid.UUID(int=i),
+            "mac": f"5c5b35{i:06x}",
+            "name": f"ap-{i}",
+            "model": "AP45",
+            "site_id": str(uuid.UUID(int=i % 50)),
+            "status": "connected",
+            "uptime": 86400 + i,
+            "last_seen": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+            "radio_stat": {
+                band: {"channel": 36 + i % 8, "power": 17, "num_clients": i % 30}
+                for band in ("band_24", "band_5", "band_6")
+            },
+            "port_stat": {
+                f"eth{port}": {"up": True, "speed": 1000, "rx_bytes": i * 1024}
+                for port in range(2)
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    data = _records(args.records)
+
+    results = {}
+    baseline = timeit.timeit(
+        lambda: json.dumps(data, indent=2, default=str), number=args.repeat
+    )
+    results["json (indent=2)"] = (
+        baseline,
+        len(json.dumps(data, indent=2, default=str)),
+    )
+    for backend in ("json", "orjson"):
+        config.serializer = backend
+        if serializer.backend() != backend:
+            print(f"{backend}: not installed")
+            continue
+        duration = timeit.timeit(lambda: serializer.dumps(data), number=args.repeat)
+        results[backend] = (duration, len(serializer.dumps(data)))
+
+    print(f"{args.records} records, {args.repeat} runs")
+    for name, (duration, size) in results.items():
+        print(
+            f"{name:>16}: {duration / args.repeat * 1000:8.2f} ms/call, "
+            f"{size / 1024:8.0f} KiB, x{baseline / duration:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Tests for the mistmcp aggregate middleware"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastmcp import Client, FastMCP
+from mistapi.__api_response import APIResponse
+
+import mistmcp.aggregate_middleware as aggregate_module
+import mistmcp.auto_paginate_middleware as auto_paginate_module
+from mistmcp.aggregate_middleware import AggregateMiddleware, Aggregator
+from mistmcp.config import config
+from mistmcp.response_formatter import format_response
+
+SESSION = SimpleNamespace(mist_get=None)
+# one event every 10 minutes, most recent first, as returned by the Mist API
+EVENTS = [
+    {
+        "timestamp": t,
+        "type": "AP_RESTARTED" if t % 1800 else "AP_CONFIGURED",
+        "mac": "5c5b35000001" if t < 3600 else "5c5b35000002",
+    }
+    for t in range(7200 - 600, -600, -600)
+]
+PAGE_SIZE = 4
+NEXT = "https://api.mist.com/api/v1/orgs/org-1/devices/events/search?offset={offset}"
+
+
+def test_aggregator() -> None:
+    aggregator = Aggregator(["type"])
+    aggregator.add(EVENTS[:6])
+    aggregator.add(EVENTS[6:])
+    assert aggregator.results() == {
+        "results": [
+            {"type": "AP_RESTARTED", "count": 8, "first": 600, "last": 6600},
+            {"type": "AP_CONFIGURED", "count": 4, "first": 0, "last": 5400},
+        ],
+        "total": 2,
+        "records": 12,
+    }
+
+    # hourly buckets, oldest first
+    aggregator = Aggregator(["mac"], interval=3600)
+    aggregator.add(EVENTS)
+    assert [
+        (group["mac"], group["time"], group["count"])
+        for group in aggregator.results()["results"]
+    ] == [("5c5b35000001", 0, 6), ("5c5b35000002", 3600, 6)]
+
+
+def test_aggregator_max_groups() -> None:
+    # the most frequent group is kept even when it is not the first one
+    aggregator = Aggregator(["type"], max_groups=1)
+    aggregator.add(reversed(EVENTS))
+    results = aggregator.results()
+    assert results["results"] == [
+        {"type": "AP_RESTARTED", "count": 4, "first": 2400, "last": 6600}
+    ]
+    assert results["records"] == 12
+    assert results["other"] == {"count": 8, "first": 0, "last": 5400}
+    # the exact count of AP_RESTARTED is 8
+    assert results["max_error"] == 4
+
+    aggregator = Aggregator(["type"], max_groups=2)
+    aggregator.add(EVENTS)
+    assert "other" not in aggregator.results()
+
+
+def test_aggregator_max_groups_batches() -> None:
+    # one frequent group among many rare ones, the rare ones are folded in
+    # batches of max_groups
+    records = [
+        {"timestamp": t, "type": "AP_RESTARTED" if t % 3 else f"TYPE_{t}"}
+        for t in range(3000)
+    ]
+    aggregator = Aggregator(["type"], max_groups=10)
+    aggregator.add(records)
+    results = aggregator.results()
+
+    counts = {group["type"]: group["count"] for group in results["results"]}
+    assert 2000 - results["max_error"] <= counts["AP_RESTARTED"] <= 2000
+    assert sum(counts.values()) + results["other"]["count"] == 3000
+    assert results["other"]["first"] == 0
+    assert results["other"]["last"] >= 2997
+
+
+@pytest.fixture
+def fetched(monkeypatch) -> list[str]:
+    urls: list[str] = []
+
+    async def fake_get_apisession():
+        return SESSION, "json"
+
+    async def fake_mist_call(func, url):
+        urls.append(url)
+        offset = int(url.split("offset=")[1])
+        return _page(offset)
+
+    async def fake_process_response(response):
+        return None
+
+    monkeypatch.setattr(aggregate_module, "get_apisession", fake_get_apisession)
+    monkeypatch.setattr(auto_paginate_module, "mist_call", fake_mist_call)
+    monkeypatch.setattr(auto_paginate_module, "process_response", fake_process_response)
+    monkeypatch.setattr(config, "aggregate_max_records", 100000)
+    return urls
+
+
+def _page(offset: int) -> APIResponse:
+    response = APIResponse(response=None, url="")
+    response.status_code = 200
+    response.data = {
+        "results": EVENTS[offset : offset + PAGE_SIZE],
+        "total": len(EVENTS),
+    }
+    if offset + PAGE_SIZE < len(EVENTS):
+        response.next = NEXT.format(offset=offset + PAGE_SIZE)
+    return response
+
+
+def _server(middleware: AggregateMiddleware, limits: list) -> FastMCP:
+    server = FastMCP("test", middleware=[middleware])
+
+    @server.tool(name="mist_search_events")
+    async def search_events(org_id: str, limit: int = 20) -> dict | list | str:
+        limits.append(limit)
+        return format_response(_page(0), "json")
+
+    return server
+
+
+@pytest.mark.asyncio
+async def test_aggregate(fetched) -> None:
+    limits: list = []
+    middleware = AggregateMiddleware()
+    async with Client(_server(middleware, limits)) as client:
+        (tool,) = await client.list_tools()
+        assert "aggregate" in tool.inputSchema["properties"]
+
+        result = await client.call_tool(
+            "mist_search_events",
+            {"org_id": "org-1", "aggregate": {"group_by": ["type"]}},
+        )
+        truncated = await client.call_tool(
+            "mist_search_events",
+            {"org_id": "org-1", "aggregate": {"group_by": ["type"]}, "max_records": 5},
+        )
+
+        with pytest.raises(Exception, match="group_by"):
+            await client.call_tool(
+                "mist_search_events", {"org_id": "org-1", "aggregate": {}}
+            )
+
+    assert limits == [1000, 1000]
+    # the truncated aggregation stops after its second page
+    assert fetched == [
+        NEXT.format(offset=4),
+        NEXT.format(offset=8),
+        NEXT.format(offset=4),
+    ]
+    assert result.data["results"] == {
+        "columns": ["type", "count", "first", "last"],
+        "rows": [["AP_RESTARTED", 8, 600, 6600], ["AP_CONFIGURED", 4, 0, 5400]],
+    }
+    assert result.data["records"] == 12
+    assert result.data["has_more"] is False
+    assert truncated.data["records"] == 8
+    assert truncated.data["has_more"] is True
+    assert middleware.stats() == {
+        "aggregations": 2,
+        "pages": 5,
+        "records": 20,
+        "groups": 4,
+    }
@@ -0,0 +1,169 @@
+"""Tests for mistmcp async transport"""
+
+import httpx
+import mistapi
+import pytest
+from fastmcp.exceptions import ToolError
+
+from mistmcp import request_executor as request_executor_module
+from mistmcp.async_transport import AsyncTransport
+from mistmcp.config import config
+
+
+def _make_session() -> mistapi.APISession:
+    """Build an APISession without contacting the Mist Cloud"""
+    apisession = mistapi.APISession.__new__(mistapi.APISession)
+    mistapi.__api_request.APIRequest.__init__(apisession)
+    apisession._cloud_uri = "api.mist.com"
+    apisession._session.headers.update({"Authorization": "Token abc"})
+    return apisession
+
+
+def _mock_client(transport: AsyncTransport, handler) -> list[httpx.Request]:
+    """Replace the transport HTTP client with a mocked one, return the sent requests"""
+    sent: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return handler(request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    transport._get_client = lambda: client  # type: ignore[method-assign]
+    return sent
+
+
+class TestAsyncTransport:
+    """Test AsyncTransport class"""
+
+    def test_record_wrapper_get_request(self) -> None:
+        """Test that the GET request built by a mistapi wrapper is captured"""
+        apisession = _make_session()
+
+        request = AsyncTransport.record(
+            mistapi.api.v1.orgs.sites.listOrgSites,
+            (apisession, "org-1"),
+            {"limit": 10, "page": 2},
+        )
+
+        assert request == (
+            apisession,
+            "/api/v1/orgs/org-1/sites",
+            {"limit": "10", "page": "2"},
+        )
+
+    def test_record_ignores_write_and_other_calls(self) -> None:
+        """Test that non GET requests and non mistapi calls are not captured"""
+        apisession = _make_session()
+
+        assert (
+            AsyncTransport.record(
+                mistapi.api.v1.orgs.sites.createOrgSite,
+                (apisession, "org-1", {"name": "x"}),
+                {},
+            )
+            is None
+        )
+        assert AsyncTransport.record(len, ([],), {}) is None
+
+        def uploadOrgFile(mist_session, org_id):
+            raise AssertionError("write wrappers must not be called")
+
+        uploadOrgFile.__module__ = "mistapi.api.v1.orgs.files"
+        assert AsyncTransport.record(uploadOrgFile, (apisession, "org-1"), {}) is None
+
+        def GetOrgLicenseAsyncClaimStatus(mist_session, org_id):
+            return mist_session.mist_get(f"/api/v1/orgs/{org_id}/claim/status")
+
+        GetOrgLicenseAsyncClaimStatus.__module__ = "mistapi.api.v1.orgs.licenses"
+        assert AsyncTransport.record(
+            GetOrgLicenseAsyncClaimStatus, (apisession, "org-1"), {}
+        ) == (apisession, "/api/v1/orgs/org-1/claim/status", None)
+        assert AsyncTransport.record(apisession.mist_get, ("/api/v1/self",), {}) == (
+            apisession,
+            "/api/v1/self",
+            None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_returns_api_response(self) -> None:
+        """Test that the httpx response is wrapped in a mistapi APIResponse"""
+        transport = AsyncTransport()
+        sent = _mock_client(
+            transport, lambda request: httpx.Response(200, json=[{"id": "a"}])
+        )
+
+        response = await transport.get(_make_session(), "/api/v1/self", {"limit": 5})
+
+        assert response.status_code == 200
+        assert response.data == [{"id": "a"}]
+        assert str(sent[0].url) == "https://api.mist.com/api/v1/self?limit=5"
+        assert sent[0].headers["Authorization"] == "Token abc"
+        assert transport.stats() == {"in_flight": 0, "completed": 1, "errors": 0}
+
+    @pytest.mark.asyncio
+    async def test_get_all_follows_pages(self) -> None:
+        """Test that get_all follows the X-Page headers like mistapi.get_all"""
+        transport = AsyncTransport()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params.get("page", "1"))
+            return httpx.Response(
+                200,
+                json=[{"id": page}],
+                headers={
+                    "X-Page-Total": "3",
+                    "X-Page-Limit": "1",
+                    "X-Page-Page": str(page),
+                },
+            )
+
+        _mock_client(transport, handler)
+        apisession = _make_session()
+        first = await transport.get(
+            apisession, "/api/v1/orgs/org-1/sites", {"limit": 1}
+        )
+
+        assert await transport.get_all(apisession, first) == [
+            {"id": 1},
+            {"id": 2},
+            {"id": 3},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_all_failed_page(self) -> None:
+        """Test that a failed page raises the error of the failed response"""
+        transport = AsyncTransport()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params.get("page") == "2":
+                return httpx.Response(404, json={"detail": "not found"})
+            return httpx.Response(
+                200,
+                json={"results": [{"id": 1}], "next": "/api/v1/orgs/org-1/x?page=2"},
+            )
+
+        _mock_client(transport, handler)
+        apisession = _make_session()
+        first = await transport.get(apisession, "/api/v1/orgs/org-1/x")
+
+        with pytest.raises(ToolError) as error:
+            await transport.get_all(apisession, first)
+        assert error.value.args[0]["status_code"] == 404
+
+    @pytest.mark.asyncio
+    async def test_mist_call_uses_async_backend(self, monkeypatch) -> None:
+        """Test that mist_call only sends GET requests with the async backend"""
+        transport = AsyncTransport()
+        sent = _mock_client(transport, lambda request: httpx.Response(200, json={}))
+        monkeypatch.setattr(request_executor_module, "async_transport", transport)
+        monkeypatch.setattr(config, "http_backend", "async")
+        apisession = _make_session()
+
+        await request_executor_module.mist_call(
+            mistapi.api.v1.orgs.sites.listOrgSites, apisession, org_id="org-1"
+        )
+        result = await request_executor_module.mist_call(lambda: "threaded")
+
+        assert len(sent) == 1
+        assert sent[0].url.path == "/api/v1/orgs/org-1/sites"
+        assert result == "threaded"
@@ -0,0 +1,191 @@
+"""Tests for the mistmcp auto-pagination middleware"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+from mistapi.__api_response import APIResponse
+
+import mistmcp.auto_paginate_middleware as auto_paginate_module
+from mistmcp.auto_paginate_middleware import AutoPaginateMiddleware
+from mistmcp.config import config
+from mistmcp.cursor_store import CursorStore
+from mistmcp.response_formatter import format_response
+
+URL = "https://api.mist.com/api/v1/orgs/org-1/alarms/search?limit={limit}&page={page}"
+SESSION = SimpleNamespace(mist_get=None)
+
+
+def _page(page: int, limit: int, pages: int = 4) -> dict:
+    data = {
+        "results": [{"id": f"{page}-{i}", "type": "device_down"} for i in range(limit)],
+        "total": pages * limit,
+    }
+    if page < pages:
+        data["next"] = URL.format(limit=limit, page=page + 1)
+    return data
+
+
+def _server(middleware: AutoPaginateMiddleware, limits: list) -> FastMCP:
+    server = FastMCP("test", middleware=[middleware])
+
+    @server.tool(name="mist_search_alarms")
+    async def search_alarms(org_id: str, limit: int = 20) -> dict | list | str:
+        limits.append(limit)
+        response = APIResponse(response=None, url=URL)
+        response.status_code = 200
+        response.data = _page(1, limit)
+        response.next = response.data.get("next")
+        return format_response(response, "string")
+
+    return server
+
+
+@pytest.fixture
+def fetched(monkeypatch) -> list[str]:
+    urls: list[str] = []
+
+    async def fake_get_apisession():
+        return SESSION, "json"
+
+    async def fake_mist_call(func, url):
+        urls.append(url)
+        query = dict(part.split("=") for part in url.split("?")[1].split("&"))
+        response = APIResponse(response=None, url=url)
+        response.status_code = 200
+        response.data = _page(int(query["page"]), int(query["limit"]))
+        response.next = response.data.get("next")
+        return response
+
+    async def fake_process_response(response):
+        return None
+
+    monkeypatch.setattr(auto_paginate_module, "get_apisession", fake_get_apisession)
+    monkeypatch.setattr(auto_paginate_module, "mist_call", fake_mist_call)
+    monkeypatch.setattr(auto_paginate_module, "process_response", fake_process_response)
+    monkeypatch.setattr(auto_paginate_module, "session_key", lambda session: "key")
+    monkeypatch.setattr(config, "max_records", 10000)
+    monkeypatch.setattr(config, "max_response_bytes", 1024 * 1024)
+    return urls
+
+
+@pytest.mark.asyncio
+async def test_pages_followed_until_max_records(fetched) -> None:
+    limits: list[int] = []
+    middleware = AutoPaginateMiddleware()
+    async with Client(_server(middleware, limits)) as client:
+        (tool,) = await client.list_tools()
+        assert "max_records" in tool.inputSchema["properties"]
+
+        progress = []
+
+        async def on_progress(done, total, message):
+            progress.append((done, total))
+
+        result = await client.call_tool(
+            "mist_search_alarms",
+            {"org_id": "org-1", "limit": 5, "max_records": 12},
+            progress_handler=on_progress,
+        )
+
+    assert [alarm["id"] for alarm in result.data["results"]][-1] == "3-4"
+    assert len(result.data["results"]) == 15
+    assert result.data["total"] == 20
+    assert result.data["next"] == URL.format(limit=5, page=4)
+    assert result.data["has_more"] is True
+    assert fetched == [URL.format(limit=5, page=2), URL.format(limit=5, page=3)]
+    assert progress == [(5, 12), (10, 12), (15, 12)]
+    assert middleware.stats() == {"calls": 1, "pages": 3, "records": 15}
+
+    async with Client(_server(middleware, limits)) as client:
+        result = await client.call_tool(
+            "mist_search_alarms", {"org_id": "org-1", "max_records": 2000}
+        )
+    # the page size defaults to the max page size
+    assert limits[-1] == 1000
+    assert len(result.data["results"]) == 2000
+    assert result.data["next"] == URL.format(limit=1000, page=3)
+
+
+@pytest.mark.asyncio
+async def test_records_over_budget_kept_in_cursor_store(fetched, monkeypatch) -> None:
+    cursors = CursorStore(ttl=60, max_bytes=1024 * 1024)
+    monkeypatch.setattr(auto_paginate_module, "cursor_store", cursors)
+    monkeypatch.setattr(config, "max_response_bytes", 100)
+
+    async with Client(_server(AutoPaginateMiddleware(), [])) as client:
+        result = await client.call_tool(
+            "mist_search_alarms",
+            {"org_id": "org-1", "limit": 5, "max_records": 10},
+        )
+
+    first = result.data["results"]
+    assert 1 <= len(first) < 10
+    assert result.data["has_more"] is True
+    page = cursors.page("key", result.data["next"])
+    assert page["results"][0]["id"] == f"{len(first) // 5 + 1}-{len(first) % 5}"
+    while page["next"].startswith("mistmcp-cursor://"):
+        page = cursors.page("key", page["next"])
+    # the cursor pages end with the next page of the Mist API
+    assert page["next"] == URL.format(limit=5, page=3)
+
+
+@pytest.mark.asyncio
+async def test_records_over_budget_dropped_without_cursor_store(
+    fetched, monkeypatch
+) -> None:
+    monkeypatch.setattr(auto_paginate_module, "cursor_store", CursorStore(ttl=0))
+    monkeypatch.setattr(config, "max_response_bytes", 100)
+
+    async with Client(_server(AutoPaginateMiddleware(), [])) as client:
+        result = await client.call_tool(
+            "mist_search_alarms",
+            {"org_id": "org-1", "limit": 5, "max_records": 10},
+        )
+
+    assert 1 <= len(result.data["results"]) < 10
+    # the next page of the Mist API is kept
+    assert result.data["next"] == URL.format(limit=5, page=3)
+    assert result.data["has_more"] is True
+    assert "were dropped" in result.data["message"]
+
+
+@pytest.mark.asyncio
+async def test_pagination_error_returned(fetched, monkeypatch) -> None:
+    async def failing_process_response(response):
+        if "page=3" in response.url:
+            raise ToolError({"status_code": 429, "message": "Too Many Requests"})
+
+    monkeypatch.setattr(
+        auto_paginate_module, "process_response", failing_process_response
+    )
+
+    async with Client(_server(AutoPaginateMiddleware(), [])) as client:
+        result = await client.call_tool(
+            "mist_search_alarms",
+            {"org_id": "org-1", "limit": 5, "max_records": 20},
+        )
+
+    assert len(result.data["results"]) == 10
+    assert result.data["error"] == "Too Many Requests"
+    assert "stopped on an error" in result.data["message"]
+    # the failed page can be retried
+    assert result.data["next"] == URL.format(limit=5, page=3)
+
+
+@pytest.mark.asyncio
+async def test_pagination_programming_error_raised(fetched, monkeypatch) -> None:
+    async def broken_process_response(response):
+        raise KeyError("results")
+
+    monkeypatch.setattr(
+        auto_paginate_module, "process_response", broken_process_response
+    )
+
+    async with Client(_server(AutoPaginateMiddleware(), [])) as client:
+        with pytest.raises(ToolError):
+            await client.call_tool(
+                "mist_search_alarms",
+                {"org_id": "org-1", "limit": 5, "max_records": 20},
+            )
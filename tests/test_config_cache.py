@@ -0,0 +1,111 @@
+"""Tests for mistmcp configuration objects cache"""
+
+import mistapi
+from mistapi.__api_request import APIRequest
+from mistapi.__api_response import APIResponse
+
+from mistmcp.config_cache import ConfigObjectCache
+
+ORG = "org-1"
+SITE = "site-1"
+
+
+def _session(token: str = "token") -> mistapi.APISession:
+    apisession = mistapi.APISession.__new__(mistapi.APISession)
+    APIRequest.__init__(apisession)
+    apisession._apitoken = [token]
+    return apisession
+
+
+def _response(data, status_code: int = 200) -> APIResponse:
+    response = APIResponse(response=None, url="")
+    response.status_code = status_code
+    response.data = data
+    return response
+
+
+class TestConfigObjectCache:
+    """Test ConfigObjectCache class"""
+
+    def test_get_returns_copy_of_cached_response(self) -> None:
+        """Test that cached responses are returned as independent copies"""
+        cache = ConfigObjectCache(ttl=60, max_bytes=1024)
+        key = cache.key(_session(), "org_wlans", org_id=ORG, limit=20)
+        assert cache.get(key) is None
+
+        cache.put(key, _response([{"id": "w1"}]))
+        first = cache.get(key)
+        first.data.append({"id": "w2"})
+
+        assert cache.get(key).data == [{"id": "w1"}]
+        assert cache.get(cache.key(_session("other"), "org_wlans", org_id=ORG)) is None
+        assert cache.stats()["hits"] == 2
+
+    def test_ttl_and_errors(self) -> None:
+        """Test that expired entries and failed responses are not served"""
+        cache = ConfigObjectCache(ttl=0, max_bytes=1024)
+        key = cache.key(_session(), "org_wlans", org_id=ORG)
+        cache.put(key, _response([]))
+        assert cache.get(key) is None
+
+        cache = ConfigObjectCache(ttl=60, max_bytes=1024)
+        cache.put(key, _response({"error": "boom"}, status_code=404))
+        assert cache.get(key) is None
+
+    def test_max_bytes_evicts_least_recently_used(self) -> None:
+        """Test that the oldest entries are dropped when the cache is full"""
+        cache = ConfigObjectCache(ttl=60, max_bytes=100)
+        keys = [
+            cache.key(_session(), "org_wlans", org_id=ORG, object_id=str(i))
+            for i in range(3)
+        ]
+        for key in keys:
+            cache.put(key, _response({"name": "x" * 30}))
+
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[2]) is not None
+        assert cache.stats()["bytes"] <= 100
+
+    def test_org_write_invalidates_affected_entries(self) -> None:
+        """Test that an org write only drops the entries it may have changed"""
+        cache = ConfigObjectCache(ttl=60, max_bytes=10240)
+        apisession = _session()
+        keys = {
+            "list": cache.key(apisession, "org_wlans", org_id=ORG),
+            "by_name": cache.key(apisession, "org_wlans", org_id=ORG, name="corp"),
+            "same_id": cache.key(apisession, "org_wlans", org_id=ORG, object_id="w1"),
+            "other_id": cache.key(apisession, "org_wlans", org_id=ORG, object_id="w2"),
+            "other_type": cache.key(apisession, "org_networks", org_id=ORG),
+            "other_org": cache.key(apisession, "org_wlans", org_id="org-2"),
+            "computed": cache.key(
+                apisession, "site_wlans", org_id=ORG, site_id=SITE, computed=True
+            ),
+            "other_token": cache.key(_session("other"), "org_wlans", org_id=ORG),
+        }
+        for key in keys.values():
+            cache.put(key, _response([]))
+
+        cache.invalidate("org_wlans", org_id=ORG, object_id="w1")
+
+        remaining = {name for name, key in keys.items() if cache.get(key) is not None}
+        assert remaining == {"other_id", "other_type", "other_org"}
+
+    def test_site_settings_write_invalidates_site_entries(self) -> None:
+        """Test that a site write drops the computed entries of the site"""
+        cache = ConfigObjectCache(ttl=60, max_bytes=10240)
+        apisession = _session()
+        computed = cache.key(
+            apisession, "site_devices", org_id=ORG, site_id=SITE, computed=True
+        )
+        site_info = cache.key(apisession, "org_sites", org_id=ORG, site_id=SITE)
+        other_site = cache.key(
+            apisession, "site_devices", org_id=ORG, site_id="site-2", computed=True
+        )
+        for key in (computed, site_info, other_site):
+            cache.put(key, _response({}))
+
+        cache.invalidate("site_settings", site_id=SITE)
+
+        assert cache.get(computed) is None
+        assert cache.get(site_info) is None
+        assert cache.get(other_site) is not None
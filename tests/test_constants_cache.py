@@ -0,0 +1,106 @@
+"""Tests for mistmcp constants cache"""
+
+import asyncio
+
+import httpx
+import mistapi
+import pytest
+from mistapi.__api_response import APIResponse
+
+from mistmcp.constants_cache import ConstantsCache, is_constants_call
+
+URI = "/api/v1/const/device_models"
+URL = f"https://api.mist.com{URI}"
+
+
+def _response(status_code: int | None, data=None) -> APIResponse:
+    response = APIResponse(response=None, url=URL)
+    response.status_code = status_code
+    response.data = data if data is not None else {}
+    return response
+
+
+class FakeFetch:
+    """Return the given results one after the other, counting the calls"""
+
+    def __init__(self, *results) -> None:
+        self.results = list(results)
+        self.calls = 0
+
+    async def __call__(self) -> APIResponse:
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TestConstantsCache:
+    """Test ConstantsCache class"""
+
+    def test_is_constants_call(self) -> None:
+        """Test that only the constants endpoints are cached"""
+        assert is_constants_call(mistapi.api.v1.const.device_models.listDeviceModels)
+        assert not is_constants_call(mistapi.api.v1.orgs.sites.listOrgSites)
+
+    @pytest.mark.asyncio
+    async def test_cached_per_cloud(self) -> None:
+        """Test that a constant is retrieved once per cloud and shared"""
+        cache = ConstantsCache(ttl=3600, refresh=3600)
+        fetch = FakeFetch(_response(200, [{"model": "AP45"}]), _response(200, []))
+
+        first = await cache.get("api.mist.com", URI, URL, fetch)
+        first.data.append({"model": "modified"})
+        second = await cache.get("api.mist.com", URI, URL, fetch)
+        await cache.get("api.eu.mist.com", URI, URL, fetch)
+
+        assert second.data == [{"model": "AP45"}]
+        assert fetch.calls == 2
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self) -> None:
+        """Test that only successful responses are cached"""
+        cache = ConstantsCache(ttl=3600, refresh=3600)
+        fetch = FakeFetch(_response(404), _response(200, []))
+
+        assert (await cache.get("api.mist.com", URI, URL, fetch)).status_code == 404
+        assert (await cache.get("api.mist.com", URI, URL, fetch)).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_refreshed_in_background(self) -> None:
+        """Test that a stale entry is served while being refreshed"""
+        cache = ConstantsCache(ttl=3600, refresh=0)
+        fetch = FakeFetch(
+            _response(200, ["old"]), _response(200, ["new"]), _response(200, ["new"])
+        )
+        await cache.get("api.mist.com", URI, URL, fetch)
+
+        stale = await cache.get("api.mist.com", URI, URL, fetch)
+        await asyncio.sleep(0)
+        fresh = await cache.get("api.mist.com", URI, URL, fetch)
+
+        assert stale.data == ["old"]
+        assert fresh.data == ["new"]
+        assert cache.stats()["refreshes"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_served_when_unreachable(self) -> None:
+        """Test that the expired entry is served when the cloud is unreachable"""
+        cache = ConstantsCache(ttl=0, refresh=0)
+
+        with pytest.raises(httpx.ConnectError):
+            await cache.get(
+                "api.mist.com", URI, URL, FakeFetch(httpx.ConnectError("down"))
+            )
+
+        await cache.get("api.mist.com", URI, URL, FakeFetch(_response(200, ["AP45"])))
+        response = await cache.get(
+            "api.mist.com", URI, URL, FakeFetch(httpx.ConnectError("down"))
+        )
+        assert response.status_code == 200
+        assert response.data == ["AP45"]
+
+        response = await cache.get("api.mist.com", URI, URL, FakeFetch(_response(None)))
+        assert response.data == ["AP45"]
+        assert cache.stats()["fallbacks"] == 2
@@ -0,0 +1,50 @@
+"""Tests for the mistmcp cursor store"""
+
+import time
+
+from mistmcp.cursor_store import CursorStore, is_cursor
+
+RECORDS = [{"id": str(i), "name": f"object-{i}"} for i in range(5)]
+
+
+def test_pages_served_from_store() -> None:
+    store = CursorStore(ttl=60, max_bytes=10240)
+    assert store.put("token", RECORDS[:2], limit=2) is None
+
+    cursor = store.put("token", RECORDS, limit=2)
+    assert is_cursor(cursor)
+    page = store.page("token", cursor)
+    assert page == {
+        "results": RECORDS[2:4],
+        "total": 5,
+        "next": page["next"],
+        "has_more": True,
+    }
+    page["results"][0]["name"] = "changed"
+    page = store.page("token", cursor)
+    assert page["results"] == RECORDS[2:4]
+
+    last = store.page("token", page["next"])
+    assert last == {"results": RECORDS[4:], "total": 5, "has_more": False}
+    # the result set is only readable with the API token that retrieved it
+    assert store.page("other-token", cursor) is None
+    assert store.page("token", "mistmcp-cursor://unknown?offset=2&limit=2") is None
+    assert store.stats()["hits"] == 3
+    assert store.stats()["misses"] == 2
+
+
+def test_expiry_and_eviction(monkeypatch) -> None:
+    store = CursorStore(ttl=60, max_bytes=150)
+    first = store.put("token", RECORDS[:3], limit=1)
+    second = store.put("token", RECORDS[2:], limit=1)
+    assert store.page("token", first) is None
+    assert store.page("token", second)["results"] == [RECORDS[3]]
+    assert store.stats()["evictions"] == 1
+    # larger than the store
+    assert store.put("token", RECORDS * 10, limit=1) is None
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert store.page("token", second) is None
+    assert store.stats()["size"] == 0
+    assert CursorStore(ttl=0, max_bytes=200).put("token", RECORDS, 1) is None
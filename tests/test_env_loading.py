@@ -1,9 +1,10 @@
 """Tests for mistmcp.__main__ environment variable loading"""
 
+import argparse
 import os
 from unittest.mock import patch
 
-from mistmcp.__main__ import load_env_file, load_env_var
+from mistmcp.__main__ import load_env_file, load_env_var, load_performance_var
 from mistmcp.config import config
 
 
@@ -88,9 +89,16 @@ class TestLoadEnvVar:
         }
 
         with patch.dict(os.environ, test_env, clear=False):
-            transport_mode, mcp_host, mcp_port, debug, enable_write_tools, disable_elicitation, response_format, _ = load_env_var(
-                "stdio", None, None, True, False, False, None, None
-            )
+            (
+                transport_mode,
+                mcp_host,
+                mcp_port,
+                debug,
+                enable_write_tools,
+                disable_elicitation,
+                response_format,
+                _,
+            ) = load_env_var("stdio", None, None, True, False, False, None, None)
 
             assert config.mist_apitoken == "test-api-token"
             assert config.mist_host == "api.mist.com"
@@ -111,9 +119,16 @@ class TestLoadEnvVar:
         }
 
         with patch.dict(os.environ, test_env, clear=False):
-            transport_mode, mcp_host, mcp_port, debug, enable_write_tools, disable_elicitation, response_format, _ = load_env_var(
-                "http", None, None, False, False, False, None, None
-            )
+            (
+                transport_mode,
+                mcp_host,
+                mcp_port,
+                debug,
+                enable_write_tools,
+                disable_elicitation,
+                response_format,
+                _,
+            ) = load_env_var("http", None, None, False, False, False, None, None)
 
             assert transport_mode == "http"
             assert debug is False
@@ -143,7 +158,8 @@ class TestLoadEnvVar:
 
             with patch.dict(os.environ, test_env, clear=False):
                 _, _, _, debug, _, _, _, _ = load_env_var(
-                    "stdio", None, None, False, False, False, None, None)
+                    "stdio", None, None, False, False, False, None, None
+                )
                 assert debug == expected, f"Failed for debug_value='{debug_value}'"
 
     def test_load_env_var_port_parsing(self) -> None:
@@ -165,7 +181,8 @@ class TestLoadEnvVar:
 
             with patch.dict(os.environ, test_env, clear=False):
                 _, _, mcp_port, _, _, _, _, _ = load_env_var(
-                    "stdio", None, None, False, False, False, None, None)
+                    "stdio", None, None, False, False, False, None, None
+                )
                 assert mcp_port == expected, f"Failed for port='{port_value}'"
 
     def test_load_env_var_host_and_port_from_env(self) -> None:
@@ -179,7 +196,89 @@ class TestLoadEnvVar:
 
         with patch.dict(os.environ, test_env, clear=False):
             _, mcp_host, mcp_port, _, _, _, _, _ = load_env_var(
-                "stdio", None, None, False, False, False, None, None)
+                "stdio", None, None, False, False, False, None, None
+            )
 
             assert mcp_host == "0.0.0.0"
             assert mcp_port == 9000
+
+
+class TestLoadPerformanceVar:
+    """Test load_performance_var function"""
+
+    def test_max_workers_from_cli(self, monkeypatch) -> None:
+        """Test that the CLI value takes precedence over the environment"""
+        monkeypatch.setattr(config, "max_workers", 32)
+        with patch.dict(os.environ, {"MISTMCP_MAX_WORKERS": "8"}, clear=False):
+            load_performance_var(argparse.Namespace(max_workers=4))
+        assert config.max_workers == 4
+
+    def test_max_workers_from_env(self, monkeypatch) -> None:
+        """Test loading the worker cap from environment variables"""
+        monkeypatch.setattr(config, "max_workers", 32)
+        with patch.dict(os.environ, {"MISTMCP_MAX_WORKERS": "8"}, clear=False):
+            load_performance_var(argparse.Namespace(max_workers=None))
+        assert config.max_workers == 8
+
+    def test_max_workers_invalid_env(self, monkeypatch) -> None:
+        """Test that an invalid value keeps the default"""
+        monkeypatch.setattr(config, "max_workers", 32)
+        with patch.dict(os.environ, {"MISTMCP_MAX_WORKERS": "many"}, clear=False):
+            load_performance_var(argparse.Namespace(max_workers=None))
+        assert config.max_workers == 32
+
+    def test_retry_delays_from_env(self, monkeypatch) -> None:
+        """Test that the retry delays are loaded as numbers of seconds"""
+        monkeypatch.setattr(config, "retry_base_delay", 1.0)
+        monkeypatch.setattr(config, "retry_max_delay", 30.0)
+        env = {"MISTMCP_RETRY_BASE_DELAY": "0.5", "MISTMCP_RETRY_MAX_DELAY": "2.5"}
+        with patch.dict(os.environ, env, clear=False):
+            load_performance_var(argparse.Namespace(max_workers=None))
+        assert config.retry_base_delay == 0.5
+        assert config.retry_max_delay == 2.5
+
+    def test_cache_and_pagination_from_env(self, monkeypatch) -> None:
+        """Test loading the cache and pagination options from environment variables"""
+        for name in (
+            "constants_ttl",
+            "config_cache_ttl",
+            "page_concurrency",
+            "object_index_ttl",
+            "field_profiles",
+            "serializer",
+            "cursor_ttl",
+            "prefetch",
+            "max_records",
+            "max_search_shards",
+            "aggregate_max_groups",
+            "watermark_file",
+        ):
+            monkeypatch.setattr(config, name, getattr(config, name))
+        env = {
+            "MISTMCP_CONSTANTS_TTL": "600",
+            "MISTMCP_CONFIG_CACHE_TTL": "0",
+            "MISTMCP_PAGE_CONCURRENCY": "4",
+            "MISTMCP_OBJECT_INDEX_TTL": "30",
+            "MISTMCP_FIELD_PROFILES": "false",
+            "MISTMCP_SERIALIZER": "JSON",
+            "MISTMCP_CURSOR_TTL": "0",
+            "MISTMCP_PREFETCH": "yes",
+            "MISTMCP_MAX_RECORDS": "500",
+            "MISTMCP_MAX_SEARCH_SHARDS": "4",
+            "MISTMCP_AGGREGATE_MAX_GROUPS": "50",
+            "MISTMCP_WATERMARK_FILE": "/tmp/watermarks.json",
+        }
+        with patch.dict(os.environ, env, clear=False):
+            load_performance_var(argparse.Namespace(max_workers=None))
+        assert config.constants_ttl == 600
+        assert config.config_cache_ttl == 0
+        assert config.page_concurrency == 4
+        assert config.object_index_ttl == 30
+        assert config.field_profiles is False
+        assert config.serializer == "json"
+        assert config.cursor_ttl == 0
+        assert config.prefetch is True
+        assert config.max_records == 500
+        assert config.max_search_shards == 4
+        assert config.aggregate_max_groups == 50
+        assert config.watermark_file == "/tmp/watermarks.json"
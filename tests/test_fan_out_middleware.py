@@ -0,0 +1,170 @@
+"""Tests for the mistmcp fan-out middleware"""
+
+from types import SimpleNamespace
+from typing import Annotated
+from uuid import UUID
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+from mistapi.__api_response import APIResponse
+from pydantic import Field
+
+import mistmcp.fan_out_middleware as fan_out_module
+import mistmcp.paginator as paginator_module
+from mistmcp.fan_out_middleware import FanOutMiddleware
+from mistmcp.rate_limiter import RateLimiter
+
+SITES = [f"00000000-0000-0000-0000-00000000000{i}" for i in range(1, 5)]
+
+
+def _server(middleware: FanOutMiddleware) -> FastMCP:
+    server = FastMCP("test", middleware=[middleware])
+
+    @server.tool(name="mist_list_rogue_devices")
+    async def list_rogue_devices(
+        site_id: Annotated[UUID, Field(description="Site ID")],
+        limit: int = 20,
+    ) -> dict | list | str:
+        if str(site_id) == SITES[1]:
+            raise ToolError({"status_code": 404, "message": "Not found"})
+        return [{"site_id": str(site_id), "limit": limit}]
+
+    return server
+
+
+@pytest.fixture
+def fan_out(monkeypatch) -> FanOutMiddleware:
+    async def fake_get_apisession():
+        return SimpleNamespace(_apitoken=["token-1"], mist_get=mist_get), "json"
+
+    def mist_get(uri):
+        raise AssertionError("mist_get is only called through mist_call")
+
+    monkeypatch.setattr(fan_out_module, "get_apisession", fake_get_apisession)
+    monkeypatch.setattr(
+        fan_out_module, "rate_limiter", RateLimiter(limit=100, reserve=10)
+    )
+    return FanOutMiddleware()
+
+
+@pytest.mark.asyncio
+async def test_site_ids_listed_and_fanned_out(fan_out) -> None:
+    async with Client(_server(fan_out)) as client:
+        (tool,) = await client.list_tools()
+        assert "site_ids" in tool.inputSchema["properties"]
+        assert "site_id" not in tool.inputSchema.get("required", [])
+
+        result = await client.call_tool(
+            "mist_list_rogue_devices", {"site_ids": SITES[:3], "limit": 5}
+        )
+
+    assert list(result.data["sites"]) == [SITES[0], SITES[2]]
+    assert result.data["sites"][SITES[2]] == [{"site_id": SITES[2], "limit": 5}]
+    assert result.data["errors"][SITES[1]]["status_code"] == 404
+    assert fan_out.stats() == {"fan_outs": 1, "calls": 3, "failures": 1}
+
+
+@pytest.mark.asyncio
+async def test_all_sites_resolved_from_org(fan_out, monkeypatch) -> None:
+    async def fake_mist_call(func, apisession, **kwargs):
+        assert kwargs["org_id"] == "org-1"
+        return "sites"
+
+    async def fake_process_response(response):
+        return None
+
+    async def fake_get_all_pages(apisession, response):
+        return [{"id": SITES[0]}, {"id": SITES[3]}]
+
+    monkeypatch.setattr(fan_out_module, "mist_call", fake_mist_call)
+    monkeypatch.setattr(fan_out_module, "process_response", fake_process_response)
+    monkeypatch.setattr(fan_out_module, "get_all_pages", fake_get_all_pages)
+
+    async with Client(_server(fan_out)) as client:
+        result = await client.call_tool(
+            "mist_list_rogue_devices", {"site_ids": "*", "org_id": "org-1"}
+        )
+        assert list(result.data["sites"]) == [SITES[0], SITES[3]]
+
+        with pytest.raises(Exception, match="org_id"):
+            await client.call_tool("mist_list_rogue_devices", {"site_ids": "*"})
+
+
+@pytest.mark.asyncio
+async def test_fan_out_refused_over_quota(fan_out, monkeypatch) -> None:
+    monkeypatch.setattr(
+        fan_out_module, "rate_limiter", RateLimiter(limit=12, reserve=10)
+    )
+
+    async with Client(_server(fan_out)) as client:
+        with pytest.raises(Exception, match="quota"):
+            await client.call_tool("mist_list_rogue_devices", {"site_ids": SITES})
+        result = await client.call_tool(
+            "mist_list_rogue_devices", {"site_id": SITES[0]}
+        )
+
+    assert result.data == [{"site_id": SITES[0], "limit": 20}]
+    assert fan_out.stats()["fan_outs"] == 0
+
+
+@pytest.mark.asyncio
+async def test_org_ids_resolved_from_privileges(fan_out, monkeypatch) -> None:
+    orgs = [f"10000000-0000-0000-0000-00000000000{i}" for i in range(1, 4)]
+
+    async def fake_mist_call(func, apisession, **kwargs):
+        response = APIResponse(response=None, url="")
+        response.status_code = 200
+        if func.__name__ == "getSelf":
+            response.data = {
+                "privileges": [
+                    {"scope": "org", "org_id": orgs[0], "name": "Org 1"},
+                    {"scope": "site", "org_id": orgs[2], "site_id": SITES[0]},
+                    {"scope": "msp", "msp_id": "msp-1", "name": "MSP"},
+                ]
+            }
+        elif func.__name__ == "listMspOrgs":
+            assert kwargs == {"msp_id": "msp-1"}
+            response.data = [{"id": orgs[0], "name": "Org 1"}]
+            response.next = "/api/v1/msps/msp-1/orgs?page=2"
+        else:
+            # the MSP orgs are listed over several pages
+            assert apisession == "/api/v1/msps/msp-1/orgs?page=2"
+            response.data = [{"id": orgs[1], "name": "Org 2"}]
+        return response
+
+    monkeypatch.setattr(fan_out_module, "mist_call", fake_mist_call)
+    monkeypatch.setattr(paginator_module, "mist_call", fake_mist_call)
+    server = FastMCP("test", middleware=[fan_out])
+
+    @server.tool(name="mist_get_org_licenses")
+    async def get_org_licenses(
+        org_id: Annotated[UUID, Field(description="Organization ID")],
+    ) -> dict | list | str:
+        return {"summary": {"SUB-MAN": 10}}
+
+    @server.tool(name="mist_get_stats")
+    async def get_stats(
+        org_id: Annotated[UUID, Field(description="Organization ID")],
+        site_id: Annotated[UUID, Field(description="Site ID", default=None)],
+    ) -> dict | list | str:
+        return {}
+
+    async with Client(server) as client:
+        tools = {tool.name: tool for tool in await client.list_tools()}
+        assert "org_ids" in tools["mist_get_org_licenses"].inputSchema["properties"]
+        assert (
+            "site_ids" not in tools["mist_get_org_licenses"].inputSchema["properties"]
+        )
+        assert {"org_ids", "site_ids"} <= set(
+            tools["mist_get_stats"].inputSchema["properties"]
+        )
+
+        result = await client.call_tool("mist_get_org_licenses", {"org_ids": "*"})
+        assert list(result.data["orgs"]) == orgs[:2]
+        assert result.data["names"] == {orgs[0]: "Org 1", orgs[1]: "Org 2"}
+
+        with pytest.raises(Exception, match="cannot be used together"):
+            await client.call_tool(
+                "mist_get_stats", {"org_ids": orgs, "site_ids": SITES}
+            )
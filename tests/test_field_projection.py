@@ -0,0 +1,120 @@
+"""Tests for the mistmcp fields projection"""
+
+from typing import Annotated
+
+import pytest
+from fastmcp import Client, FastMCP
+from mcp.types import ToolAnnotations
+from pydantic import Field
+
+from mistmcp.config import config
+from mistmcp.field_projection import (
+    ProjectionStats,
+    apply_projection,
+    project,
+    projected_fields,
+)
+from mistmcp.fields_middleware import FieldsMiddleware
+
+RECORDS = [
+    {
+        "mac": "aabbccddeeff",
+        "name": "ap-1",
+        "radio_stat": {"band_24": {"channel": 6, "power": 12}, "band_5": {}},
+        "port_stat": [{"port_id": "eth0", "up": True, "speed": 1000}],
+    },
+    {"mac": "112233445566", "model": "AP45"},
+]
+
+
+def test_project_nested_paths() -> None:
+    projected = project(
+        RECORDS, ("mac", "radio_stat.band_24.channel", "port_stat.up", "missing")
+    )
+    assert projected == [
+        {
+            "mac": "aabbccddeeff",
+            "radio_stat": {"band_24": {"channel": 6}},
+            "port_stat": [{"up": True}],
+        },
+        {"mac": "112233445566"},
+    ]
+    # a path keeps the whole value even if a longer path is also requested
+    assert project(RECORDS[0], ("radio_stat.band_24", "radio_stat")) == {
+        "radio_stat": RECORDS[0]["radio_stat"]
+    }
+    search = {"results": RECORDS, "total": 2, "next": None}
+    assert project(search, ("model",)) == {
+        "results": [{}, {"model": "AP45"}],
+        "total": 2,
+        "next": None,
+    }
+
+
+def test_default_profile_and_wildcard(monkeypatch) -> None:
+    monkeypatch.setattr(config, "field_profiles", True)
+    with projected_fields("mist_search_device", None):
+        assert apply_projection(RECORDS) == [
+            {"mac": "aabbccddeeff", "name": "ap-1"},
+            {"mac": "112233445566", "model": "AP45"},
+        ]
+    with projected_fields("mist_search_device", ["*"]):
+        assert apply_projection(RECORDS) == RECORDS
+    with projected_fields("mist_get_stats", None):
+        assert apply_projection(RECORDS) == RECORDS
+
+    monkeypatch.setattr(config, "field_profiles", False)
+    with projected_fields("mist_search_device", None):
+        assert apply_projection(RECORDS) == RECORDS
+    assert apply_projection(RECORDS) == RECORDS
+
+
+def test_projection_stats() -> None:
+    stats = ProjectionStats(sample_rate=2)
+    # the first projection of every two is measured
+    assert [stats.count() for _ in range(4)] == [True, False, True, False]
+    stats.record(100, 40)
+    stats.record(50, 50)
+    assert stats.stats() == {
+        "projections": 4,
+        "sampled": 2,
+        "bytes_in": 150,
+        "bytes_out": 90,
+        "bytes_saved": 60,
+    }
+
+
+@pytest.mark.asyncio
+async def test_fields_parameter_on_read_tools() -> None:
+    server = FastMCP("test", middleware=[FieldsMiddleware()])
+
+    @server.tool(name="mist_get_stats", annotations=ToolAnnotations(readOnlyHint=True))
+    async def get_stats(
+        site_id: Annotated[str, Field(description="Site ID")],
+    ) -> dict | list | str:
+        return apply_projection(RECORDS)
+
+    @server.tool(
+        name="mist_change_configuration_objects",
+        annotations=ToolAnnotations(readOnlyHint=False),
+    )
+    async def change_configuration_objects(object_id: str) -> dict | list | str:
+        return {}
+
+    async with Client(server) as client:
+        tools = {tool.name: tool for tool in await client.list_tools()}
+        assert "fields" in tools["mist_get_stats"].inputSchema["properties"]
+        assert (
+            "fields"
+            not in tools["mist_change_configuration_objects"].inputSchema["properties"]
+        )
+
+        result = await client.call_tool(
+            "mist_get_stats", {"site_id": "site-1", "fields": ["mac", "model"]}
+        )
+        assert result.data == [
+            {"mac": "aabbccddeeff"},
+            {"mac": "112233445566", "model": "AP45"},
+        ]
+        result = await client.call_tool("mist_get_stats", {"site_id": "site-1"})
+        assert result.data == RECORDS
@@ -0,0 +1,296 @@
+"""Tests for the mistmcp get_configuration_objects tool helpers."""
+
+import asyncio
+import copy
+import urllib.parse
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+from mistapi.__api_response import APIResponse
+from requests.structures import CaseInsensitiveDict
+
+import mistmcp.paginator as paginator_module
+import mistmcp.tools.get_configuration_objects as tool_module
+from mistmcp.config_cache import ConfigObjectCache
+from mistmcp.cursor_store import CursorStore
+from mistmcp.object_index import ObjectIndex
+from mistmcp.tools.get_configuration_objects import _index_lookup, _search_object
+
+URL = "https://api.mist.com/api/v1/orgs/org-1/wlans?limit=2"
+SESSION = SimpleNamespace(mist_get=None, _apitoken=["token"])
+
+
+def _page(page: int, pages: int = 5) -> APIResponse:
+    response = APIResponse(response=None, url=URL)
+    response.status_code = 200
+    response.data = [
+        {"ssid": f"corp-{page}-a", "id": f"{page}a"},
+        {"ssid": f"guest-{page}", "id": f"{page}b"},
+    ]
+    response.headers = CaseInsensitiveDict(
+        {"X-Page-Total": str(pages * 2), "X-Page-Limit": "2", "X-Page-Page": str(page)}
+    )
+    return response
+
+
+@pytest.fixture
+def fetched_pages(monkeypatch) -> list[int]:
+    fetched: list[int] = []
+
+    async def fake_mist_call(func, uri):
+        page = int(urllib.parse.parse_qs(urllib.parse.urlsplit(uri).query)["page"][0])
+        fetched.append(page)
+        return _page(page)
+
+    monkeypatch.setattr(paginator_module, "mist_call", fake_mist_call)
+    monkeypatch.setattr(paginator_module.config, "page_concurrency", 1)
+    return fetched
+
+
+@pytest.mark.asyncio
+async def test_search_object_stops_paginating_at_limit(fetched_pages) -> None:
+    response = await _search_object(SESSION, _page(1), "corp*", "ssid", limit=2)
+
+    assert response.data["results"] == [
+        {"ssid": "corp-1-a", "id": "1a"},
+        {"ssid": "corp-2-a", "id": "2a"},
+    ]
+    assert response.data["total"] == 2
+    assert response.data["total_is_lower_bound"] is True
+    assert response.next is None
+    assert 5 not in fetched_pages
+
+
+@pytest.mark.asyncio
+async def test_search_object_exact_total(fetched_pages) -> None:
+    response = await _search_object(SESSION, _page(1), "guest-*", "ssid", limit=20)
+
+    assert [entry["id"] for entry in response.data] == ["1b", "2b", "3b", "4b", "5b"]
+    assert response.headers["X-Page-Total"] == "5"
+    assert fetched_pages == [2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_search_object_builds_index(fetched_pages, monkeypatch) -> None:
+    index = ObjectIndex(ttl=60, max_entries=8)
+    cursors = CursorStore(ttl=60, max_bytes=10240)
+    monkeypatch.setattr(tool_module, "object_index", index)
+    monkeypatch.setattr(tool_module, "cursor_store", cursors)
+    key = index.key(SESSION, "org_wlans", org_id="org-1")
+
+    response = await _search_object(
+        SESSION, _page(1), "guest-*", "ssid", limit=20, index_key=key
+    )
+    assert [entry["id"] for entry in response.data] == ["1b", "2b", "3b", "4b", "5b"]
+    assert fetched_pages == [2, 3, 4, 5]
+
+    response = _index_lookup(key, name="*-3*")
+    assert [entry["id"] for entry in response.data] == ["3a", "3b"]
+    assert fetched_pages == [2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_search_object_indexes_in_background(fetched_pages, monkeypatch) -> None:
+    index = ObjectIndex(ttl=60, max_entries=8)
+    cursors = CursorStore(ttl=60, max_bytes=10240)
+    monkeypatch.setattr(tool_module, "object_index", index)
+    monkeypatch.setattr(tool_module, "cursor_store", cursors)
+    key = index.key(SESSION, "org_wlans", org_id="org-1")
+
+    # the search returns as soon as the page is filled
+    response = await _search_object(
+        SESSION, _page(1), "corp*", "ssid", limit=2, index_key=key
+    )
+    assert [entry["id"] for entry in response.data["results"]] == ["1a", "2a"]
+    assert response.data["total_is_lower_bound"] is True
+    assert _index_lookup(key, name="corp*") is None
+
+    # while the remaining pages are indexed in the background
+    await asyncio.gather(*tool_module._index_builds.values())
+    assert fetched_pages == [2, 3, 4, 5]
+    response = _index_lookup(key, name="corp*", limit=2)
+    assert response.data["total"] == 5
+    assert response.data["total_is_lower_bound"] is False
+
+    # the next pages of the search are served from the cursor store
+    page = cursors.page(key[0], response.next)
+    assert [entry["id"] for entry in page["results"]] == ["3a", "4a"]
+    page = cursors.page(key[0], page["next"])
+    assert [entry["id"] for entry in page["results"]] == ["5a"]
+    assert page["has_more"] is False
+
+
+@pytest.mark.asyncio
+async def test_computed_site_wlans_share_org_lists(monkeypatch) -> None:
+    calls: list[str] = []
+    data = {
+        "getSiteInfo": {"sitegroup_ids": ["sg-1"]},
+        "listOrgTemplates": [
+            {"id": "t-site", "applies": {"site_ids": ["site-1"]}},
+            {"id": "t-group", "applies": {"sitegroup_ids": ["sg-1"]}},
+            {"id": "t-other", "applies": {"site_ids": ["site-9"]}},
+        ],
+        "listOrgWlans": [
+            {"id": "w1", "ssid": "corp", "template_id": "t-site"},
+            {"id": "w2", "ssid": "other", "template_id": "t-other"},
+            {"id": "w3", "ssid": "guest", "template_id": "t-group"},
+        ],
+        "listSiteWlans": [{"id": "w4", "ssid": "site-only"}],
+    }
+
+    async def fake_mist_call(func, apisession, **kwargs):
+        calls.append(func.__name__)
+        response = APIResponse(response=None, url=URL)
+        response.status_code = 200
+        response.data = copy.deepcopy(data[func.__name__])
+        return response
+
+    monkeypatch.setattr(tool_module, "mist_call", fake_mist_call)
+    monkeypatch.setattr(
+        tool_module, "config_cache", ConfigObjectCache(ttl=60, max_bytes=10240)
+    )
+
+    for site_id in ("site-1", "site-2"):
+        response = await tool_module._get_site_wlans(
+            SESSION, "org-1", site_id, computed=True
+        )
+
+    assert [wlan["id"] for wlan in response.data] == ["w3", "w4"]
+    assert calls.count("listOrgTemplates") == 1
+    assert calls.count("listOrgWlans") == 1
+    assert calls.count("getSiteInfo") == 2
+
+    response = await tool_module._get_site_wlans(
+        SESSION, "org-1", "site-1", name="corp", computed=True
+    )
+    assert [wlan["id"] for wlan in response.data] == ["w1"]
+
+
+@pytest.mark.asyncio
+async def test_computed_site_devices_batch(monkeypatch) -> None:
+    calls: list[str] = []
+    data = {
+        "listSiteDevices": [
+            {
+                "id": "d1",
+                "type": "switch",
+                "name": "access-1",
+                "model": "EX4100",
+                "port_config": {"ge-0/0/1-2": {"usage": "ap"}},
+            },
+            {"id": "d2", "type": "switch", "name": "core-1", "model": "EX4650"},
+            {"id": "d3", "type": "gateway", "port_config": {"ge-0/0/0": {}}},
+            {"id": "d4", "type": "ap", "name": "ap-1"},
+        ],
+        "getSiteSettingDerived": {
+            "port_usages": {"ap": {"mode": "trunk"}},
+            "switch_matching": {
+                "enable": True,
+                "rules": [
+                    {
+                        "name": "access",
+                        "match_name[0:6]": "access",
+                        "port_config": {"ge-0/0/10": {"usage": "iot"}},
+                    }
+                ],
+            },
+        },
+        "getSiteInfo": {"gatewaytemplate_id": "gt-1"},
+        "getOrgGatewayTemplate": {"port_config": {"ge-0/0/1": {"usage": "wan"}}},
+    }
+
+    async def fake_mist_call(func, apisession, **kwargs):
+        calls.append(func.__name__)
+        response = APIResponse(response=None, url=URL)
+        response.status_code = 200
+        response.data = copy.deepcopy(data[func.__name__])
+        return response
+
+    compiled = []
+    compile_template = tool_module._compile_switch_template
+
+    def compile_switch_template(template):
+        compiled.append(template)
+        return compile_template(template)
+
+    monkeypatch.setattr(tool_module, "mist_call", fake_mist_call)
+    monkeypatch.setattr(
+        tool_module, "_compile_switch_template", compile_switch_template
+    )
+
+    response = await tool_module._get_site_devices(
+        SESSION, "org-1", "site-1", computed=True
+    )
+
+    devices = {device["id"]: device for device in response.data}
+    assert sorted(devices["d1"]["port_config"]) == ["ge-0/0/1", "ge-0/0/10", "ge-0/0/2"]
+    assert "port_config" not in devices["d2"]
+    assert devices["d2"]["port_usages"] == {"ap": {"mode": "trunk"}}
+    assert devices["d3"]["port_config"] == {"ge-0/0/1": {"usage": "wan"}}
+    assert devices["d4"] == {"id": "d4", "type": "ap", "name": "ap-1"}
+    assert sorted(calls) == [
+        "getOrgGatewayTemplate",
+        "getSiteInfo",
+        "getSiteSettingDerived",
+        "listSiteDevices",
+    ]
+    # the switch template is compiled once for the whole batch
+    assert len(compiled) == 1
+
+
+def test_switch_template_compiled_once_per_content(monkeypatch) -> None:
+    monkeypatch.setattr(tool_module, "_compiled_templates", OrderedDict())
+    template = {
+        "id": "t-1",
+        "modified_time": 1,
+        "port_usages": {"ap": {"mode": "trunk"}},
+        "switch_matching": {
+            "enable": True,
+            "rules": [
+                {
+                    "name": "core",
+                    "match_name[0:4]": "CORE",
+                    "match_role": "core",
+                    "port_config": {"xe-0/0/0-1,xe-0/1/0": {"usage": "uplink"}},
+                },
+                {"name": "ex4100", "match_model": "ex4100-48p", "ntp_servers": ["a"]},
+            ],
+        },
+    }
+
+    compiled = tool_module._compile_switch_template(template)
+    assert tool_module._compile_switch_template(template) is compiled
+    core = tool_module._process_switch_template(
+        compiled, "core-1", "EX4650", "core", {}
+    )
+    assert sorted(core["port_config"]) == ["xe-0/0/0", "xe-0/0/1", "xe-0/1/0"]
+    assert core["match_role"] == "core"
+    # the slice must be shorter than the name, and the role must match
+    assert "port_config" not in tool_module._process_switch_template(
+        compiled, "core", "EX4650", "core", {}
+    )
+    assert tool_module._process_switch_template(
+        compiled, "core-1", "EX4100-48P", "access", {}
+    )["ntp_servers"] == ["a"]
+
+    assert len(tool_module._compiled_templates) == 1
+
+    # the responses do not share the cached values
+    core["port_config"]["xe-0/0/0"]["usage"] = "modified"
+    assert tool_module._process_switch_template(
+        compiled, "core-1", "EX4650", "core", {}
+    )["port_config"]["xe-0/0/0"] == {"usage": "uplink"}
+
+    # an updated network template does not change the derived setting
+    # modified_time, the template is compiled again
+    template["switch_matching"]["rules"] = []
+    assert "port_config" not in tool_module._process_switch_template(
+        tool_module._compile_switch_template(template), "core-1", "EX4650", "core", {}
+    )
+    assert len(tool_module._compiled_templates) == 2
+
+    # the compiled templates expire
+    monkeypatch.setattr(tool_module, "_COMPILED_TEMPLATES_TTL", 0)
+    compiled = tool_module._compile_switch_template(template)
+    assert tool_module._compile_switch_template(template) is not compiled
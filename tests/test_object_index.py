@@ -0,0 +1,107 @@
+"""Tests for mistmcp configuration objects index"""
+
+import mistapi
+from mistapi.__api_request import APIRequest
+
+from mistmcp.object_index import ObjectIndex, name_matcher
+
+ORG = "org-1"
+OBJECTS = [
+    {"id": "1", "name": "Corp-HQ"},
+    {"id": "2", "name": "corp-branch"},
+    {"id": "3", "name": "Guest"},
+    {"id": "4", "name": "lab-corp"},
+    {"id": "5"},
+]
+
+
+def _session(token: str = "token") -> mistapi.APISession:
+    apisession = mistapi.APISession.__new__(mistapi.APISession)
+    APIRequest.__init__(apisession)
+    apisession._apitoken = [token]
+    return apisession
+
+
+def _indexed(**kwargs) -> tuple[ObjectIndex, tuple]:
+    index = ObjectIndex(**{"ttl": 60, "max_entries": 8, **kwargs})
+    key = index.key(_session(), "org_wlantemplates", org_id=ORG)
+    index.build(key, OBJECTS)
+    return index, key
+
+
+def _ids(found) -> list[str]:
+    return [obj["id"] for obj in found[0]]
+
+
+class TestObjectIndex:
+    """Test ObjectIndex class"""
+
+    def test_name_matcher(self) -> None:
+        """Test the matchers of the name patterns"""
+        assert name_matcher("Corp*")("corp-1")
+        assert not name_matcher("corp*")("my-corp")
+        assert name_matcher("*corp")("my-corp")
+        assert not name_matcher("*corp")("corp-1")
+        assert name_matcher("*RP-1*")("corp-1-a")
+        assert name_matcher("rp-1")("corp-1-a")
+        assert name_matcher("*")("anything")
+
+    def test_search_modes_match_name_matcher(self) -> None:
+        """Test that the indexed searches return the same objects as a scan"""
+        index, key = _indexed()
+        for pattern in ("corp*", "*corp", "*corp*", "corp", "co", "*-*", "x*", "*"):
+            match = name_matcher(pattern)
+            expected = [
+                obj["id"] for obj in OBJECTS if match(obj.get("name", "").lower())
+            ]
+            assert _ids(index.search(key, pattern, 20)) == expected, pattern
+
+    def test_search_limit_and_copies(self) -> None:
+        """Test that the results are limited, counted and copied"""
+        index, key = _indexed()
+        found, total = index.search(key, "*corp*", 2)
+        found[0]["name"] = "modified"
+
+        assert total == 3
+        assert len(found) == 2
+        assert index.search(key, "corp-hq", 20)[1] == 1
+
+    def test_prefix_search_astral_characters(self) -> None:
+        """Test that the prefix searches match the characters above U+FFFF"""
+        index = ObjectIndex(ttl=60, max_entries=8)
+        key = index.key(_session(), "org_wlantemplates", org_id=ORG)
+        index.build(
+            key,
+            [
+                {"id": "1", "name": "wifi-\U0001f600"},
+                {"id": "2", "name": "wifi-\uffff"},
+                {"id": "3", "name": "wifj"},
+            ],
+        )
+        assert _ids(index.search(key, "wifi-*", 20)) == ["1", "2"]
+        assert _ids(index.search(key, "wifi-\U0001f600*", 20)) == ["1"]
+
+    def test_not_indexed(self) -> None:
+        """Test that nothing is served for expired, unknown or other token lists"""
+        index, key = _indexed(ttl=0)
+        assert index.search(key, "corp*", 20) is None
+
+        index, key = _indexed()
+        other = index.key(_session("other"), "org_wlantemplates", org_id=ORG)
+        assert index.search(other, "corp*", 20) is None
+        assert index.stats()["misses"] == 1
+
+    def test_invalidate_and_max_entries(self) -> None:
+        """Test that writes and the max number of entries drop the indexes"""
+        index, key = _indexed(max_entries=2)
+        other_type = index.key(_session(), "org_networks", org_id=ORG)
+        index.build(other_type, OBJECTS)
+
+        index.invalidate("org_wlantemplates", org_id=ORG)
+        assert index.search(key, "corp*", 20) is None
+        assert index.search(other_type, "corp*", 20) is not None
+
+        for org in ("org-2", "org-3"):
+            index.build(index.key(_session(), "org_networks", org_id=org), OBJECTS)
+        assert index.search(other_type, "corp*", 20) is None
+        assert index.stats()["size"] == 2
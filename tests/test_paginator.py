@@ -0,0 +1,95 @@
+"""Tests for mistmcp paginator"""
+
+import asyncio
+import urllib.parse
+from types import SimpleNamespace
+
+import pytest
+from mistapi.__api_response import APIResponse
+from requests.structures import CaseInsensitiveDict
+
+import mistmcp.paginator as paginator_module
+from mistmcp.paginator import get_all_pages
+
+URL = "https://api.mist.com/api/v1/orgs/org-1/psks?limit=2"
+
+
+def _page(items, page: int, total: int = 7, limit: int = 2) -> APIResponse:
+    response = APIResponse(response=None, url=URL)
+    response.status_code = 200
+    response.data = items
+    response.headers = CaseInsensitiveDict(
+        {
+            "X-Page-Total": str(total),
+            "X-Page-Limit": str(limit),
+            "X-Page-Page": str(page),
+        }
+    )
+    return response
+
+
+class TestGetAllPages:
+    """Test get_all_pages function"""
+
+    @pytest.mark.asyncio
+    async def test_pages_fetched_concurrently_in_order(self, monkeypatch) -> None:
+        """Test that the remaining pages are retrieved in parallel and kept in order"""
+        requested: list[str] = []
+        running = 0
+        max_running = 0
+
+        async def fake_mist_call(func, uri):
+            nonlocal running, max_running
+            requested.append(uri)
+            running += 1
+            max_running = max(max_running, running)
+            page = int(
+                urllib.parse.parse_qs(urllib.parse.urlsplit(uri).query)["page"][0]
+            )
+            # later pages answer first
+            await asyncio.sleep(0.01 * (5 - page))
+            running -= 1
+            return _page([f"item-{page}"], page)
+
+        monkeypatch.setattr(paginator_module, "mist_call", fake_mist_call)
+        first = _page(["item-1"], 1)
+
+        data = await get_all_pages(SimpleNamespace(mist_get=None), first, concurrency=2)
+
+        assert data == ["item-1", "item-2", "item-3", "item-4"]
+        assert "/api/v1/orgs/org-1/psks?limit=2&page=2" in requested
+        assert max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_single_page(self, monkeypatch) -> None:
+        """Test that no request is sent when everything is in the first page"""
+
+        async def fake_mist_call(func, uri):
+            raise AssertionError("unexpected request")
+
+        monkeypatch.setattr(paginator_module, "mist_call", fake_mist_call)
+
+        assert await get_all_pages(
+            SimpleNamespace(mist_get=None), _page(["a", "b"], 1, total=2)
+        ) == [
+            "a",
+            "b",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_followed_serially(self, monkeypatch) -> None:
+        """Test that search responses follow the next cursor"""
+        first = APIResponse(response=None, url=URL)
+        first.status_code = 200
+        first.data = {"results": ["a"], "next": "/api/v1/next?cursor=1"}
+        first.next = "/api/v1/next?cursor=1"
+
+        async def fake_mist_call(func, uri):
+            response = APIResponse(response=None, url=uri)
+            response.status_code = 200
+            response.data = {"results": ["b"]}
+            return response
+
+        monkeypatch.setattr(paginator_module, "mist_call", fake_mist_call)
+
+        assert await get_all_pages(SimpleNamespace(mist_get=None), first) == ["a", "b"]
@@ -0,0 +1,127 @@
+"""Tests for the mistmcp next page prefetch middleware"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+from mistapi.__api_response import APIResponse
+
+import mistmcp.prefetch_middleware as prefetch_module
+from mistmcp.config import config
+from mistmcp.prefetch_middleware import PrefetchMiddleware
+from mistmcp.rate_limiter import RateLimiter
+
+NEXT = "https://api.mist.com/api/v1/sites/site-1/stats/devices?limit=2&page=2"
+SESSION = SimpleNamespace(_apitoken=["token-1"], mist_get=None)
+
+
+def _server(middleware: PrefetchMiddleware) -> FastMCP:
+    server = FastMCP("test", middleware=[middleware])
+
+    @server.tool(name="mist_get_stats")
+    async def get_stats() -> dict | list | str:
+        return {"results": [{"mac": "1"}, {"mac": "2"}], "next": NEXT, "has_more": True}
+
+    return server
+
+
+@pytest.fixture
+def fetched(monkeypatch) -> list[str]:
+    urls: list[str] = []
+
+    async def fake_get_apisession():
+        return SESSION, "json"
+
+    async def fake_mist_call(func, url):
+        urls.append(url)
+        response = APIResponse(response=None, url=url)
+        response.status_code = 200
+        response.data = [{"mac": "3"}]
+        return response
+
+    monkeypatch.setattr(prefetch_module, "get_apisession", fake_get_apisession)
+    monkeypatch.setattr(prefetch_module, "mist_call", fake_mist_call)
+    monkeypatch.setattr(prefetch_module, "session_key", lambda apisession: "key")
+    monkeypatch.setattr(
+        prefetch_module, "rate_limiter", RateLimiter(limit=100, reserve=10)
+    )
+    monkeypatch.setattr(config, "prefetch", True)
+    monkeypatch.setattr(config, "prefetch_ttl", 30)
+    monkeypatch.setattr(config, "prefetch_max_pages", 2)
+    return urls
+
+
+@pytest.mark.asyncio
+async def test_next_page_prefetched(fetched) -> None:
+    prefetch = PrefetchMiddleware()
+    async with Client(_server(prefetch)) as client:
+        await client.call_tool("mist_get_stats", {})
+        # a second page returned with the same next URL is not fetched again
+        await client.call_tool("mist_get_stats", {})
+    await asyncio.sleep(0)
+    assert fetched == [NEXT]
+
+    response = await prefetch.take(SESSION, NEXT)
+    assert response.data == [{"mac": "3"}]
+    assert await prefetch.take(SESSION, NEXT) is None
+    assert prefetch.stats() == {
+        "prefetched": 1,
+        "skipped": 0,
+        "hits": 1,
+        "misses": 1,
+        "wasted": 0,
+        "hit_rate": 0.5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_prefetch_skipped_under_quota_pressure(fetched, monkeypatch) -> None:
+    monkeypatch.setattr(
+        prefetch_module, "rate_limiter", RateLimiter(limit=100, reserve=60)
+    )
+    prefetch = PrefetchMiddleware()
+    async with Client(_server(prefetch)) as client:
+        await client.call_tool("mist_get_stats", {})
+    await asyncio.sleep(0)
+
+    assert fetched == []
+    assert prefetch.stats()["skipped"] == 1
+    assert await prefetch.take(SESSION, NEXT) is None
+
+
+@pytest.mark.asyncio
+async def test_prefetched_pages_expire(fetched, monkeypatch) -> None:
+    monkeypatch.setattr(config, "prefetch_ttl", 0)
+    prefetch = PrefetchMiddleware()
+    prefetch.schedule(SESSION, NEXT)
+
+    assert await prefetch.take(SESSION, NEXT) is None
+    assert prefetch.stats()["wasted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_prefetch_is_a_miss(fetched, monkeypatch) -> None:
+    async def failing_mist_call(func, url):
+        raise ToolError("timeout")
+
+    monkeypatch.setattr(prefetch_module, "mist_call", failing_mist_call)
+    prefetch = PrefetchMiddleware()
+    prefetch.schedule(SESSION, NEXT)
+
+    assert await prefetch.take(SESSION, NEXT) is None
+    assert prefetch.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_prefetch_programming_error_raised(fetched, monkeypatch) -> None:
+    async def broken_mist_call(func, url):
+        raise KeyError("data")
+
+    monkeypatch.setattr(prefetch_module, "mist_call", broken_mist_call)
+    prefetch = PrefetchMiddleware()
+    prefetch.schedule(SESSION, NEXT)
+
+    with pytest.raises(KeyError):
+        await prefetch.take(SESSION, NEXT)
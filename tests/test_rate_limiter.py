@@ -0,0 +1,125 @@
+"""Tests for mistmcp rate limiter"""
+
+import mistapi
+import pytest
+from fastmcp.exceptions import ToolError
+from mistapi.__api_request import APIRequest
+from mistapi.__api_response import APIResponse
+
+from mistmcp import request_executor as request_executor_module
+from mistmcp.rate_limiter import RateLimiter, low_priority, token_key, token_keys
+
+
+class TestRateLimiter:
+    """Test RateLimiter class"""
+
+    @pytest.mark.asyncio
+    async def test_acquire_consumes_budget(self) -> None:
+        """Test that each call is counted against the token budget"""
+        limiter = RateLimiter(limit=10, reserve=0, max_wait=0)
+
+        await limiter.acquire("token")
+        await limiter.acquire("token", cost=3)
+
+        assert limiter.remaining("token") == 6
+        assert limiter.calls_last_hour("token") == 4
+        assert limiter.remaining("other-token") == 10
+
+    @pytest.mark.asyncio
+    async def test_acquire_rejects_when_budget_exhausted(self) -> None:
+        """Test that a call is rejected with a 429 when it cannot wait long enough"""
+        limiter = RateLimiter(limit=2, reserve=0, max_wait=0)
+        await limiter.acquire("token", cost=2)
+
+        with pytest.raises(ToolError) as exc_info:
+            await limiter.acquire("token")
+
+        assert exc_info.value.args[0]["status_code"] == 429
+        assert limiter.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self) -> None:
+        """Test that a call waits for the bucket to refill within max_wait"""
+        limiter = RateLimiter(limit=3600 * 50, reserve=0, max_wait=1)
+        await limiter.acquire("token", cost=3600 * 50)
+
+        await limiter.acquire("token")
+
+        assert limiter.stats()["waited"] == 1
+
+    @pytest.mark.asyncio
+    async def test_low_priority_keeps_reserve(self) -> None:
+        """Test that low priority calls cannot use the reserved budget"""
+        limiter = RateLimiter(limit=10, reserve=5, max_wait=0)
+        await limiter.acquire("token", cost=4)
+
+        with low_priority():
+            await limiter.acquire("token")
+            with pytest.raises(ToolError):
+                await limiter.acquire("token")
+        await limiter.acquire("token")
+
+        assert limiter.remaining("token") == 4
+
+    def test_reconcile_with_api_usage(self) -> None:
+        """Test that the budget follows the usage reported by the Mist Cloud"""
+        limiter = RateLimiter(limit=5000)
+
+        limiter.reconcile("token", {"requests": 4200, "request_limit": 5000})
+        assert limiter.remaining("token") == 800
+
+        limiter.reconcile("token", {"unexpected": "payload"})
+        assert limiter.remaining("token") == 800
+
+        limiter.exhausted("token")
+        assert limiter.remaining("token") == 0
+
+
+class TestMistCallRateLimit:
+    """Test the rate limiter integration in mist_call"""
+
+    @pytest.mark.asyncio
+    async def test_mist_call_counts_and_reconciles(self, monkeypatch) -> None:
+        """Test that mist_call charges the budget and reconciles with getSelfApiUsage"""
+        limiter = RateLimiter(limit=5000, reserve=0, max_wait=0)
+        monkeypatch.setattr(request_executor_module, "rate_limiter", limiter)
+        apisession = mistapi.APISession.__new__(mistapi.APISession)
+        APIRequest.__init__(apisession)
+        apisession._apitoken = ["secret-token"]
+        key = request_executor_module.session_key(apisession)
+        usage = APIResponse(response=None, url="")
+        usage.status_code = 200
+        usage.data = {"requests": 1000, "request_limit": 5000}
+        monkeypatch.setattr(
+            mistapi.api.v1.self.usage, "getSelfApiUsage", lambda session: usage
+        )
+
+        await request_executor_module.mist_call(lambda session: None, apisession)
+        assert limiter.remaining(key) == 4999
+
+        await request_executor_module.mist_call(
+            mistapi.api.v1.self.usage.getSelfApiUsage, apisession
+        )
+        assert limiter.remaining(key) == 4000
+
+    @pytest.mark.asyncio
+    async def test_mist_call_budget_per_token(self, monkeypatch) -> None:
+        """Test that each API token of a session has its own budget"""
+        limiter = RateLimiter(limit=2, reserve=0, max_wait=0)
+        monkeypatch.setattr(request_executor_module, "rate_limiter", limiter)
+        apisession = mistapi.APISession.__new__(mistapi.APISession)
+        APIRequest.__init__(apisession)
+        apisession._apitoken = ["token-1", "token-2"]
+        apisession._apitoken_index = 0
+        first, second = token_keys(apisession)
+
+        for _ in range(4):
+            await request_executor_module.mist_call(lambda session: None, apisession)
+
+        # the session switched to its second token when the first was exhausted
+        assert limiter.remaining(first) == 0
+        assert limiter.remaining(second) == 0
+        assert token_key(apisession) == second
+        assert limiter.session_remaining(apisession) == 0
+        with pytest.raises(ToolError):
+            await request_executor_module.mist_call(lambda session: None, apisession)
@@ -0,0 +1,107 @@
+"""Tests for mistmcp request executor"""
+
+import asyncio
+import threading
+
+import pytest
+
+from mistmcp.request_executor import RequestExecutor, mist_call
+
+
+class TestRequestExecutor:
+    """Test RequestExecutor class"""
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result_from_worker_thread(self) -> None:
+        """Test that the call runs outside of the event loop thread"""
+        executor = RequestExecutor(max_workers=2)
+        loop_thread = threading.get_ident()
+
+        def blocking_call(value: int, factor: int = 1) -> tuple[int, int]:
+            return value * factor, threading.get_ident()
+
+        result, worker_thread = await executor.run(blocking_call, 21, factor=2)
+
+        assert result == 42
+        assert worker_thread != loop_thread
+        assert executor.stats()["completed"] == 1
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_propagates_exceptions(self) -> None:
+        """Test that exceptions raised by the call reach the caller"""
+        executor = RequestExecutor(max_workers=1)
+
+        def failing_call() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await executor.run(failing_call)
+        assert executor.stats()["running"] == 0
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently_up_to_worker_cap(self) -> None:
+        """Test that calls run in parallel and extra calls are queued"""
+        executor = RequestExecutor(max_workers=2)
+        release = threading.Event()
+        started = threading.Semaphore(0)
+
+        def blocking_call() -> bool:
+            started.release()
+            return release.wait(5)
+
+        tasks = [asyncio.create_task(executor.run(blocking_call)) for _ in range(3)]
+        await asyncio.to_thread(started.acquire, True, 5)
+        await asyncio.to_thread(started.acquire, True, 5)
+
+        stats = executor.stats()
+        assert stats["running"] == 2
+        assert stats["queued"] == 1
+        assert stats["max_queue_depth"] == 1
+
+        release.set()
+        assert await asyncio.gather(*tasks) == [True, True, True]
+        assert executor.stats()["completed"] == 3
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_queued_call_never_runs(self) -> None:
+        """Test that cancelling a queued call removes it from the queue"""
+        executor = RequestExecutor(max_workers=1)
+        release = threading.Event()
+        started = threading.Event()
+        calls: list[str] = []
+
+        def blocking_call() -> None:
+            started.set()
+            release.wait(5)
+
+        def queued_call() -> None:
+            calls.append("queued")
+
+        running = asyncio.create_task(executor.run(blocking_call))
+        await asyncio.to_thread(started.wait, 5)
+        queued = asyncio.create_task(executor.run(queued_call))
+        await asyncio.sleep(0)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+        release.set()
+        await running
+        stats = executor.stats()
+        assert calls == []
+        assert stats["cancelled"] == 1
+        assert stats["queued"] == 0
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_mist_call_uses_shared_executor(self) -> None:
+        """Test the module level helper"""
+
+        def blocking_call(session: object, org_id: str) -> str:
+            return f"{session}:{org_id}"
+
+        assert await mist_call(blocking_call, "session", org_id="abc") == "session:abc"
@@ -0,0 +1,55 @@
+"""Tests for the mistmcp response formatter"""
+
+import json
+
+from mistmcp.response_formatter import format_response, format_table
+
+DEVICES = [
+    {"mac": "5c5b35000001", "model": "AP45", "site_id": "site-1"},
+    {"mac": "5c5b35000002", "model": "AP45", "site_id": "site-1", "name": "ap-2"},
+    {"mac": "5c5b35000003", "model": "AP45", "site_id": "site-2"},
+    {"mac": "5c5b35000004", "model": "AP34", "site_id": "site-1", "name": None},
+]
+
+
+def test_table_format() -> None:
+    table = format_response(DEVICES, "table")
+
+    assert table["columns"] == ["mac", "model", "site_id", "name"]
+    assert table["dictionaries"] == {
+        "model": ["AP45", "AP34"],
+        "site_id": ["site-1", "site-2"],
+    }
+    assert table["rows"][1] == ["5c5b35000002", 0, 0, "ap-2"]
+    assert table["rows"][3] == ["5c5b35000004", 1, 0, None]
+    # decoding the table gives back the objects, with the missing keys as null
+    decoded = [
+        {
+            column: table["dictionaries"][column][value]
+            if column in table["dictionaries"]
+            else value
+            for column, value in zip(table["columns"], row, strict=True)
+        }
+        for row in table["rows"]
+    ]
+    assert decoded == [{"name": None, **device} for device in DEVICES]
+    assert len(json.dumps(table)) < len(json.dumps(DEVICES))
+
+
+def test_table_format_of_other_responses() -> None:
+    search = {"results": DEVICES[2:], "total": 2, "has_more": False}
+    assert format_table(search) == {
+        "results": {
+            "columns": ["mac", "model", "site_id", "name"],
+            "rows": [
+                ["5c5b35000003", "AP45", "site-2", None],
+                ["5c5b35000004", "AP34", "site-1", None],
+            ],
+        },
+        "total": 2,
+        "has_more": False,
+    }
+    assert format_table({"id": "1", "name": "corp"}) == {"id": "1", "name": "corp"}
+    assert format_table(["a", "b"]) == ["a", "b"]
+    assert format_table([]) == []
+    assert json.loads(format_response(DEVICES, "string")) == DEVICES
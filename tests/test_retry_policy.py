@@ -0,0 +1,132 @@
+"""Tests for mistmcp retry policy"""
+
+import httpx
+import pytest
+from mistapi.__api_response import APIResponse
+
+from mistmcp.retry_policy import RetryPolicy, tool_deadline
+
+
+def _response(status_code: int | None, headers: dict | None = None) -> APIResponse:
+    response = APIResponse(response=None, url="https://api.mist.com/api/v1/self")
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+class FakeSend:
+    """Return the given results one after the other, counting the calls"""
+
+    def __init__(self, *results) -> None:
+        self.results = list(results)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy class"""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch) -> list[float]:
+        """Record the backoff delays instead of sleeping"""
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr("mistmcp.retry_policy.asyncio.sleep", fake_sleep)
+        return delays
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors_until_success(self, no_sleep) -> None:
+        """Test that 5xx responses and network errors are retried"""
+        policy = RetryPolicy(max_retries=3, base_delay=1, max_delay=10)
+        send = FakeSend(_response(503), httpx.ConnectError("reset"), _response(200))
+
+        response = await policy.run(send)
+
+        assert response.status_code == 200
+        assert send.calls == 3
+        assert 0.5 <= no_sleep[0] <= 1
+        assert 1 <= no_sleep[1] <= 2
+        assert policy.stats() == {
+            "retries": 2,
+            "recovered": 1,
+            "exhausted": 0,
+            "deadline_exceeded": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_honours_retry_after(self, no_sleep) -> None:
+        """Test that the Retry-After header replaces the backoff delay"""
+        policy = RetryPolicy(max_retries=1, base_delay=1, max_delay=10)
+        send = FakeSend(_response(429, {"Retry-After": "7"}), _response(200))
+
+        await policy.run(send)
+
+        assert no_sleep == [7.0]
+
+        # the Retry-After delay is capped at max_delay
+        send = FakeSend(_response(429, {"Retry-After": "3600"}), _response(200))
+        await policy.run(send)
+        assert no_sleep == [7.0, 10.0]
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_callback(self) -> None:
+        """Test that on_rate_limited is called before retrying an HTTP 429"""
+        policy = RetryPolicy(max_retries=2, base_delay=0, max_delay=0)
+        rotations: list[int] = []
+        send = FakeSend(_response(429), _response(503), _response(200))
+
+        response = await policy.run(
+            send, on_rate_limited=lambda: rotations.append(send.calls)
+        )
+
+        assert response.status_code == 200
+        assert rotations == [1]
+
+    @pytest.mark.asyncio
+    async def test_returns_last_failure_when_exhausted(self) -> None:
+        """Test that the failure is returned once the retries are exhausted"""
+        policy = RetryPolicy(max_retries=2, base_delay=0, max_delay=0)
+        send = FakeSend(_response(502), _response(502), _response(502))
+
+        response = await policy.run(send)
+
+        assert response.status_code == 502
+        assert send.calls == 3
+        assert policy.stats()["exhausted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_non_idempotent_calls_only_retry_429(self) -> None:
+        """Test that write requests are not retried on 5xx or network errors"""
+        policy = RetryPolicy(max_retries=3, base_delay=0, max_delay=0)
+
+        send = FakeSend(_response(500))
+        assert (await policy.run(send, idempotent=False)).status_code == 500
+        assert send.calls == 1
+
+        send = FakeSend(httpx.ConnectError("reset"))
+        with pytest.raises(httpx.ConnectError):
+            await policy.run(send, idempotent=False)
+
+        send = FakeSend(_response(429), _response(200))
+        assert (await policy.run(send, idempotent=False)).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_deadline_stops_retries(self) -> None:
+        """Test that no retry is attempted past the tool deadline"""
+        policy = RetryPolicy(max_retries=3, base_delay=1, max_delay=10)
+        send = FakeSend(_response(429, {"Retry-After": "60"}), _response(200))
+
+        with tool_deadline(5):
+            response = await policy.run(send)
+
+        assert response.status_code == 429
+        assert policy.stats()["deadline_exceeded"] == 1
@@ -0,0 +1,46 @@
+"""Tests for the mistmcp JSON serializer"""
+
+import datetime
+import json
+import uuid
+
+import pytest
+
+from mistmcp import serializer
+from mistmcp.config import config
+
+DATA = {
+    "id": uuid.UUID(int=1),
+    "timestamp": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+    "stats": [{"mac": "5c5b35000001", "num_clients": 3, "name": "é"}],
+    "big": 2**70,
+}
+EXPECTED = {
+    "id": "00000000-0000-0000-0000-000000000001",
+    "timestamp": "2024-01-02T03:04:05+00:00",
+    "stats": [{"mac": "5c5b35000001", "num_clients": 3, "name": "é"}],
+    "big": 2**70,
+}
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_dumps(backend, monkeypatch) -> None:
+    monkeypatch.setattr(config, "serializer", backend)
+    if serializer.backend() != backend:
+        pytest.skip("orjson is not installed")
+
+    output = serializer.dumps(DATA)
+    assert json.loads(output) == EXPECTED
+    assert "\n" not in output and ", " not in output
+
+    pretty = serializer.dumps({"a": [1]}, pretty=True)
+    assert json.loads(pretty) == {"a": [1]}
+    assert "\n" in pretty
+
+
+def test_orjson_fallback(monkeypatch) -> None:
+    monkeypatch.setattr(serializer, "orjson", None)
+    monkeypatch.setattr(config, "serializer", "orjson")
+    assert serializer.backend() == "json"
+    assert config.serializer == "json"
+    assert json.loads(serializer.dumps(DATA)) == EXPECTED
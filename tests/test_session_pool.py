@@ -0,0 +1,140 @@
+"""Tests for mistmcp API session pool"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import mistmcp.session_pool as session_pool_module
+from mistmcp.logger import token_hash
+from mistmcp.request_executor import session_leases
+from mistmcp.session_pool import SessionPool
+
+
+class FakeRequestsSession:
+    def __init__(self) -> None:
+        self.closed = False
+        self.adapters: dict[str, object] = {}
+
+    def mount(self, prefix: str, adapter: object) -> None:
+        self.adapters[prefix] = adapter
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeAPISession:
+    created = 0
+
+    def __init__(self, host: str, apitoken: str) -> None:
+        FakeAPISession.created += 1
+        self.host = host
+        self._apitoken = [apitoken] if apitoken != "invalid" else []
+        self._session = FakeRequestsSession()
+
+
+@pytest.fixture(autouse=True)
+def fake_apisession(monkeypatch):
+    FakeAPISession.created = 0
+    monkeypatch.setattr(
+        session_pool_module, "mistapi", SimpleNamespace(APISession=FakeAPISession)
+    )
+
+
+class TestSessionPool:
+    """Test SessionPool class"""
+
+    def test_token_hash_hides_token(self) -> None:
+        """Test that the pool key does not contain the token"""
+        assert "secret-token" not in token_hash("secret-token")
+        assert token_hash("secret-token") == token_hash("secret-token")
+        assert token_hash("secret-token") != token_hash("other-token")
+
+    @pytest.mark.asyncio
+    async def test_session_reused_for_same_cloud_and_token(self) -> None:
+        """Test that back-to-back calls get the same session"""
+        pool = SessionPool(max_size=4, idle_ttl=60, connections=8)
+
+        first = await pool.get("api.mist.com", "token-a")
+        second = await pool.get("api.mist.com", "token-a")
+        other_token = await pool.get("api.mist.com", "token-b")
+        other_cloud = await pool.get("api.eu.mist.com", "token-a")
+
+        assert first is second
+        assert other_token is not first
+        assert other_cloud is not first
+        assert FakeAPISession.created == 3
+        assert pool.stats()["hits"] == 1
+        assert pool.stats()["misses"] == 3
+        adapter = first._session.adapters["https://"]
+        assert adapter._pool_maxsize == 8
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_create_one_session(self) -> None:
+        """Test that concurrent calls share the session being created"""
+        pool = SessionPool(max_size=4, idle_ttl=60)
+
+        sessions = await asyncio.gather(
+            *[pool.get("api.mist.com", "token-a") for _ in range(5)]
+        )
+
+        assert all(session is sessions[0] for session in sessions)
+        assert FakeAPISession.created == 1
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_session_evicted(self) -> None:
+        """Test that the pool size is capped"""
+        pool = SessionPool(max_size=2, idle_ttl=60)
+
+        first = await pool.get("api.mist.com", "token-a")
+        await pool.get("api.mist.com", "token-b")
+        await pool.get("api.mist.com", "token-a")
+        await pool.get("api.mist.com", "token-c")
+
+        stats = pool.stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+        assert first._session.closed is False
+        assert await pool.get("api.mist.com", "token-a") is first
+
+    @pytest.mark.asyncio
+    async def test_idle_session_evicted(self, monkeypatch) -> None:
+        """Test that sessions unused for longer than the TTL are closed"""
+        pool = SessionPool(max_size=4, idle_ttl=10)
+        now = [1000.0]
+        monkeypatch.setattr(session_pool_module.time, "monotonic", lambda: now[0])
+
+        first = await pool.get("api.mist.com", "token-a")
+        now[0] += 11
+        second = await pool.get("api.mist.com", "token-a")
+
+        assert first is not second
+        assert first._session.closed is True
+        assert pool.stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_session_in_use_closed_after_last_call(self, monkeypatch) -> None:
+        """Test that an evicted session is only closed when its calls complete"""
+        pool = SessionPool(max_size=4, idle_ttl=10)
+        now = [1000.0]
+        monkeypatch.setattr(session_pool_module.time, "monotonic", lambda: now[0])
+
+        first = await pool.get("api.mist.com", "token-a")
+        with session_leases.lease(first):
+            with session_leases.lease(first):
+                now[0] += 11
+                await pool.get("api.mist.com", "token-a")
+            assert first._session.closed is False
+        assert first._session.closed is True
+        assert pool.stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejected_token_not_pooled(self) -> None:
+        """Test that sessions without a valid token are not kept"""
+        pool = SessionPool(max_size=4, idle_ttl=60)
+
+        await pool.get("api.mist.com", "invalid")
+        await pool.get("api.mist.com", "invalid")
+
+        assert FakeAPISession.created == 2
+        assert pool.stats()["size"] == 0
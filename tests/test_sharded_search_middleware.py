@@ -0,0 +1,245 @@
+"""Tests for the mistmcp sharded search middleware"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+from mistapi.__api_response import APIResponse
+
+import mistmcp.auto_paginate_middleware as auto_paginate_module
+import mistmcp.sharded_search_middleware as sharded_module
+from mistmcp.config import config
+from mistmcp.response_formatter import format_response
+from mistmcp.sharded_search_middleware import (
+    ShardedSearchMiddleware,
+    merge_windows,
+    time_windows,
+)
+
+SESSION = SimpleNamespace(_apitoken=["token-1"], mist_get=None)
+# one event every 100 seconds, the event at 1000 is returned by two windows
+EVENTS = [{"timestamp": t, "type": "AP_RESTARTED"} for t in range(0, 1200, 100)]
+NEXT = "https://api.mist.com/api/v1/orgs/org-1/devices/events/search?start={start}&end={end}"
+
+
+def _events(start: int, end: int) -> list[dict]:
+    return [e for e in reversed(EVENTS) if start <= e["timestamp"] <= end]
+
+
+def test_time_windows() -> None:
+    assert time_windows(0, 1200, 3) == [(800, 1200), (400, 800), (0, 400)]
+    # windows are at least one minute long
+    assert time_windows(0, 100, 4) == [(0, 100)]
+
+
+def test_merge_windows() -> None:
+    merged = merge_windows([_events(800, 1200), _events(400, 800), _events(0, 400)])
+    assert [e["timestamp"] for e in merged] == list(range(1100, -100, -100))
+    # different events with the same timestamp are all kept
+    other = {"timestamp": 800, "type": "AP_CONFIGURED"}
+    merged = merge_windows([_events(800, 1200), [other, *_events(400, 800)]])
+    assert [e["type"] for e in merged if e["timestamp"] == 800] == [
+        "AP_RESTARTED",
+        "AP_CONFIGURED",
+    ]
+
+
+@pytest.fixture
+def fetched(monkeypatch) -> list[str]:
+    urls: list[str] = []
+
+    async def fake_get_apisession():
+        return SESSION, "json"
+
+    async def fake_mist_call(func, url):
+        urls.append(url)
+        query = dict(part.split("=") for part in url.split("?")[1].split("&"))
+        response = APIResponse(response=None, url=url)
+        response.status_code = 200
+        # second page of a window: its oldest event
+        response.data = {
+            "results": _events(int(query["start"]), int(query["end"]))[-1:]
+        }
+        return response
+
+    async def fake_process_response(response):
+        return None
+
+    monkeypatch.setattr(sharded_module, "get_apisession", fake_get_apisession)
+    monkeypatch.setattr(auto_paginate_module, "mist_call", fake_mist_call)
+    monkeypatch.setattr(auto_paginate_module, "process_response", fake_process_response)
+    monkeypatch.setattr(config, "max_records", 10000)
+    monkeypatch.setattr(config, "max_search_shards", 16)
+    return urls
+
+
+def _server(middleware: ShardedSearchMiddleware, windows: list) -> FastMCP:
+    server = FastMCP("test", middleware=[middleware])
+
+    @server.tool(name="mist_search_events")
+    async def search_events(
+        org_id: str, start: int | None = None, end: int | None = None, limit: int = 20
+    ) -> dict | list | str:
+        windows.append((start, end, limit))
+        events = _events(start, end)
+        response = APIResponse(response=None, url="")
+        response.status_code = 200
+        # first page: every event of the window but the oldest one
+        response.data = {"results": events[:-1], "total": len(events)}
+        response.next = NEXT.format(start=start, end=end)
+        return format_response(response, "table")
+
+    return server
+
+
+@pytest.mark.asyncio
+async def test_sharded_search(fetched) -> None:
+    windows: list = []
+    middleware = ShardedSearchMiddleware()
+    async with Client(_server(middleware, windows)) as client:
+        (tool,) = await client.list_tools()
+        assert "shards" in tool.inputSchema["properties"]
+
+        result = await client.call_tool(
+            "mist_search_events",
+            {"org_id": "org-1", "start": 0, "end": 1200, "shards": 3},
+        )
+
+        with pytest.raises(Exception, match="start"):
+            await client.call_tool(
+                "mist_search_events", {"org_id": "org-1", "shards": 3}
+            )
+
+    assert sorted(windows) == [(0, 400, 1000), (400, 800, 1000), (800, 1200, 1000)]
+    assert len(fetched) == 3
+    assert [e["timestamp"] for e in result.data["results"]] == list(
+        range(1100, -100, -100)
+    )
+    assert result.data["has_more"] is False
+    assert middleware.stats() == {
+        "searches": 1,
+        "shards": 3,
+        "pages": 6,
+        "duplicates": 2,
+        "throttled": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_sharded_search_budget(fetched, monkeypatch) -> None:
+    windows: list = []
+    middleware = ShardedSearchMiddleware()
+    async with Client(_server(middleware, windows)) as client:
+        result = await client.call_tool(
+            "mist_search_events",
+            {"org_id": "org-1", "start": 0, "end": 1200, "shards": 3, "max_records": 3},
+        )
+
+        # API call budget under pressure: a single window is searched
+        monkeypatch.setattr(config, "rate_limit", 100)
+        monkeypatch.setattr(sharded_module.rate_limiter, "remaining", lambda key: 1)
+        await client.call_tool(
+            "mist_search_events",
+            {"org_id": "org-1", "start": 0, "end": 1200, "shards": 3, "max_records": 3},
+        )
+
+    # each window retrieves its share of max_records, no next page is needed
+    assert sorted(windows[:3]) == [(0, 400, 1), (400, 800, 1), (800, 1200, 1)]
+    assert fetched == []
+    # the events of the older windows do not fill the gap of the first one
+    assert [e["timestamp"] for e in result.data["results"]] == [1100, 1000, 900]
+    assert result.data["has_more"] is True
+    assert windows[3:] == [(0, 1200, 3)]
+    assert middleware.stats()["throttled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sharded_search_contiguous_records(monkeypatch) -> None:
+    # one event every second, returned `limit` events per page
+    events = [{"timestamp": t, "type": "AP_RESTARTED"} for t in range(1199, -1, -1)]
+    urls: list[str] = []
+
+    def _page(start: int, end: int, offset: int, limit: int) -> APIResponse:
+        window = [e for e in events if start <= e["timestamp"] < end]
+        response = APIResponse(response=None, url="")
+        response.status_code = 200
+        response.data = {"results": window[offset : offset + limit]}
+        if offset + limit < len(window):
+            response.next = f"{NEXT.format(start=start, end=end)}&offset={offset + limit}&limit={limit}"
+        return response
+
+    async def fake_get_apisession():
+        return SESSION, "json"
+
+    async def fake_mist_call(func, url):
+        urls.append(url)
+        query = dict(part.split("=") for part in url.split("?")[1].split("&"))
+        return _page(
+            *(int(query[name]) for name in ("start", "end", "offset", "limit"))
+        )
+
+    async def fake_process_response(response):
+        return None
+
+    monkeypatch.setattr(sharded_module, "get_apisession", fake_get_apisession)
+    monkeypatch.setattr(auto_paginate_module, "mist_call", fake_mist_call)
+    monkeypatch.setattr(auto_paginate_module, "process_response", fake_process_response)
+    monkeypatch.setattr(config, "max_records", 10000)
+    monkeypatch.setattr(config, "max_search_shards", 16)
+
+    server = FastMCP("test", middleware=[ShardedSearchMiddleware()])
+
+    @server.tool(name="mist_search_events")
+    async def search_events(
+        org_id: str, start: int | None = None, end: int | None = None, limit: int = 20
+    ) -> dict | list | str:
+        return format_response(_page(start, end, 0, limit), "json")
+
+    async with Client(server) as client:
+        result = await client.call_tool(
+            "mist_search_events",
+            {
+                "org_id": "org-1",
+                "start": 0,
+                "end": 1200,
+                "shards": 4,
+                "max_records": 100,
+            },
+        )
+
+    # the most recent window is paged until max_records events are retrieved
+    assert [e["timestamp"] for e in result.data["results"]] == list(
+        range(1199, 1099, -1)
+    )
+    assert result.data["has_more"] is True
+    assert len(urls) == 3
+
+
+@pytest.mark.asyncio
+async def test_sharded_search_failure_cancels_windows(fetched) -> None:
+    cancelled: list = []
+    server = FastMCP("test", middleware=[ShardedSearchMiddleware()])
+
+    @server.tool(name="mist_search_events")
+    async def search_events(
+        org_id: str, start: int | None = None, end: int | None = None, limit: int = 20
+    ) -> dict | list | str:
+        if start == 0:
+            raise ToolError({"status_code": 400, "message": "Bad request"})
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append((start, end))
+            raise
+        return {}
+
+    async with Client(server) as client:
+        with pytest.raises(ToolError, match="Bad request"):
+            await client.call_tool(
+                "mist_search_events",
+                {"org_id": "org-1", "start": 0, "end": 1200, "shards": 3},
+            )
+
+    assert sorted(cancelled) == [(400, 800), (800, 1200)]
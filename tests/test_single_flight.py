@@ -0,0 +1,98 @@
+"""Tests for mistmcp single-flight request coalescing"""
+
+import asyncio
+
+import pytest
+from mistapi.__api_response import APIResponse
+
+from mistmcp.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test SingleFlight class"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self) -> None:
+        """Test that identical concurrent calls only run the function once"""
+        group = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch() -> APIResponse:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            response = APIResponse(response=None, url="https://api.mist.com/")
+            response.data = [{"id": "site-1"}]
+            return response
+
+        tasks = [
+            asyncio.create_task(group.do(("token", "GET", "/sites"), fetch))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        responses = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert all(response.data == [{"id": "site-1"}] for response in responses)
+        # every caller gets its own copy of the shared response
+        responses[0].data.append({"id": "site-2"})
+        assert responses[1].data == [{"id": "site-1"}]
+        assert group.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 4}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_and_sequential_calls_are_not_shared(self) -> None:
+        """Test that only identical calls in flight at the same time are coalesced"""
+        group = SingleFlight()
+        calls: list[str] = []
+
+        async def fetch(name: str) -> str:
+            calls.append(name)
+            await asyncio.sleep(0)
+            return name
+
+        await asyncio.gather(
+            group.do(("token", "GET", "/a"), lambda: fetch("a")),
+            group.do(("other-token", "GET", "/a"), lambda: fetch("b")),
+        )
+        await group.do(("token", "GET", "/a"), lambda: fetch("c"))
+
+        assert calls == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_abort_shared_request(self) -> None:
+        """Test that the request keeps running for the other callers"""
+        group = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(group.do(("token", "GET", "/x"), fetch))
+        second = asyncio.create_task(group.do(("token", "GET", "/x"), fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared(self) -> None:
+        """Test that a failure is raised to every waiting caller"""
+        group = SingleFlight()
+
+        async def fetch() -> None:
+            await asyncio.sleep(0)
+            raise ConnectionError("reset")
+
+        results = await asyncio.gather(
+            group.do(("token", "GET", "/x"), fetch),
+            group.do(("token", "GET", "/x"), fetch),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ConnectionError) for result in results)
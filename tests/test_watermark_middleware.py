@@ -0,0 +1,217 @@
+"""Tests for the mistmcp watermark middleware and store"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastmcp import Client, FastMCP
+from mistapi.__api_response import APIResponse
+
+import mistmcp.watermark_middleware as watermark_module
+from mistmcp.config import config
+from mistmcp.response_formatter import format_response
+from mistmcp.watermark_middleware import WatermarkMiddleware, advance, new_records
+from mistmcp.watermark_store import (
+    WATERMARKS_VERSION,
+    Watermark,
+    WatermarkStore,
+    record_id,
+)
+
+SESSION = SimpleNamespace(_apitoken=["token-1"], mist_get=None)
+
+
+def _event(timestamp: float, event_type: str = "AP_RESTARTED") -> dict:
+    return {"timestamp": timestamp, "type": event_type}
+
+
+def test_new_records_and_advance() -> None:
+    records = [_event(101.5), _event(101.5, "AP_CONFIGURED"), _event(100)]
+    watermark = advance(None, records)
+    assert watermark == Watermark(
+        101.5, frozenset({record_id(records[0]), record_id(records[1])})
+    )
+
+    # the same search from second 101: only the new records are kept
+    polled = [_event(102), _event(101.5, "AP_DISCONNECTED"), *records[:2]]
+    fresh = new_records(polled, watermark)
+    assert fresh == polled[:2]
+    assert advance(watermark, fresh) == Watermark(
+        102, frozenset({record_id(polled[0])})
+    )
+    # nothing new, the watermark does not move
+    assert advance(watermark, []) == watermark
+
+    # the records without timestamp are only returned once
+    untimed = {"type": "AP_RESTARTED", "id": "untimed-1"}
+    watermark = advance(watermark, [untimed])
+    assert watermark.untimed == ("untimed-1",)
+    assert new_records([untimed, _event(103)], watermark) == [_event(103)]
+
+
+def test_watermark_store_file(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(config, "watermark_ttl", 3600)
+    path = str(tmp_path / "watermarks.json")
+    store = WatermarkStore(path)
+    key = store.key("session-1", "mist_search_events", None, {"org_id": "org-1"})
+    assert key != store.key(
+        "session-1", "mist_search_events", None, {"org_id": "org-2"}
+    )
+    assert store.get(key) is None
+    watermark = Watermark(
+        100,
+        frozenset({"a"}),
+        ("b",),
+        Watermark(150, frozenset({"c"})),
+        Watermark(200, frozenset({"d"})),
+    )
+    store.set(key, watermark)
+
+    # e.g. after a restart of the server
+    restarted = WatermarkStore(path)
+    assert restarted.get(key) == watermark
+    assert restarted.stats() == {"size": 1, "hits": 1, "misses": 0, "updates": 0}
+
+    with open(path, encoding="utf-8") as file:
+        saved = json.load(file)
+    assert saved["version"] == WATERMARKS_VERSION
+    assert saved["watermarks"][key]["until"] == {"timestamp": 150, "ids": ["c"]}
+
+    monkeypatch.setattr(config, "watermark_ttl", 0)
+    assert WatermarkStore(path).get(key) is None
+
+
+def test_watermark_store_file_version(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(config, "watermark_ttl", 3600)
+    path = tmp_path / "watermarks.json"
+    # a file of another format version is ignored
+    path.write_text(json.dumps({"session-1:mist_search_events:a": [100, ["a"], 0]}))
+    store = WatermarkStore(str(path))
+    assert store.get("session-1:mist_search_events:a") is None
+
+    store.set("session-1:mist_search_events:a", Watermark(100, frozenset({"a"})))
+    assert json.loads(path.read_text())["version"] == WATERMARKS_VERSION
+
+
+@pytest.mark.asyncio
+async def test_since_last(monkeypatch) -> None:
+    async def fake_get_apisession():
+        return SESSION, "json"
+
+    monkeypatch.setattr(watermark_module, "get_apisession", fake_get_apisession)
+    monkeypatch.setattr(watermark_module, "watermark_store", WatermarkStore(""))
+    monkeypatch.setattr(config, "watermark_ttl", 3600)
+
+    events = [_event(100.5), _event(100)]
+    starts: list = []
+    server = FastMCP("test", middleware=[WatermarkMiddleware()])
+
+    @server.tool(name="mist_search_events")
+    async def search_events(
+        org_id: str, start: int | None = None, limit: int = 20
+    ) -> dict | list | str:
+        starts.append(start)
+        response = APIResponse(response=None, url="")
+        response.status_code = 200
+        response.data = {
+            "results": [e for e in events if start is None or e["timestamp"] >= start]
+        }
+        return format_response(response, "json")
+
+    async with Client(server) as client:
+        (tool,) = await client.list_tools()
+        assert "since" in tool.inputSchema["properties"]
+
+        first = await client.call_tool(
+            "mist_search_events", {"org_id": "org-1", "since": "last"}
+        )
+        events.insert(0, _event(100.5, "AP_CONFIGURED"))
+        second = await client.call_tool(
+            "mist_search_events", {"org_id": "org-1", "since": "last"}
+        )
+        third = await client.call_tool(
+            "mist_search_events", {"org_id": "org-1", "since": "last"}
+        )
+        # another search has its own watermark
+        other = await client.call_tool(
+            "mist_search_events", {"org_id": "org-2", "since": "last"}
+        )
+
+    assert starts == [None, 100, 100, None]
+    assert first.data["results"] == [_event(100.5), _event(100)]
+    assert second.data["results"] == [_event(100.5, "AP_CONFIGURED")]
+    assert third.data["results"] == []
+    assert third.data["watermark"] == 100.5
+    assert len(other.data["results"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_since_last_more_than_max_records(monkeypatch) -> None:
+    async def fake_get_apisession():
+        return SESSION, "json"
+
+    monkeypatch.setattr(watermark_module, "get_apisession", fake_get_apisession)
+    monkeypatch.setattr(watermark_module, "watermark_store", WatermarkStore(""))
+    monkeypatch.setattr(config, "watermark_ttl", 3600)
+
+    events = [_event(100)]
+    searches: list = []
+    server = FastMCP("test", middleware=[WatermarkMiddleware()])
+
+    @server.tool(name="mist_search_events")
+    async def search_events(
+        org_id: str,
+        start: int | None = None,
+        end: int | None = None,
+        duration: str | None = None,
+        limit: int = 20,
+    ) -> dict | list | str:
+        searches.append((start, end, duration))
+        matching = [
+            e
+            for e in events
+            if (start is None or e["timestamp"] >= start)
+            and (end is None or e["timestamp"] <= end)
+        ]
+        response = APIResponse(response=None, url="")
+        response.status_code = 200
+        response.data = {"results": matching[:limit]}
+        if len(matching) > limit:
+            response.data["next"] = "https://api.mist.com/api/v1/next"
+        return format_response(response, "json")
+
+    async with Client(server) as client:
+        await client.call_tool(
+            "mist_search_events", {"org_id": "org-1", "since": "last"}
+        )
+        # 5 new events, more than max_records
+        events[:0] = [_event(t) for t in range(105, 100, -1)]
+        polls = []
+        for _ in range(7):
+            result = await client.call_tool(
+                "mist_search_events",
+                {
+                    "org_id": "org-1",
+                    "since": "last",
+                    "max_records": 2,
+                    "end": 50,
+                    "duration": "1d",
+                },
+            )
+            polls.append(result.data)
+
+    # every new event is returned once, most recent first
+    assert [e["timestamp"] for poll in polls for e in poll["results"]] == [
+        105,
+        104,
+        103,
+        102,
+        101,
+    ]
+    assert polls[0]["has_more"] is True
+    assert "next" not in polls[0]
+    assert polls[-1]["has_more"] is False
+    assert polls[-1]["watermark"] == 105
+    # `end` and `duration` are ignored, the older events are searched
+    # until the oldest event returned
+    assert searches[1:4] == [(100, None, None), (100, 104, None), (100, 103, None)]